@@ -0,0 +1,445 @@
+#if UNITY_EDITOR
+using UnityEngine;
+using UnityEditor;
+using UnityEditor.Build;
+using System.IO;
+
+namespace Dannect.Toolkit.Editor
+{
+    public class AutoWebGLBuildScript
+    {
+        [MenuItem("Dannect/Build/Auto Build WebGL (Player Settings)")]
+        public static void BuildWebGLWithPlayerSettings()
+        {
+            Debug.Log("=== WebGL Player Settings 자동 설정 및 빌드 시작 ===");
+            
+            // WebGL Player Settings 자동 설정
+            ConfigureWebGLPlayerSettings();
+            
+            // 설정된 Player Settings 정보 출력
+            LogCurrentPlayerSettings();
+            
+            // 빌드 출력 경로 설정 (명령행 -buildOutput 우선, Product Name 기반)
+            string buildPath = GetCommandLineBuildOutput(@"Builds/WebGL");
+            
+            // Product Name이 설정되어 있다면 경로에 반영
+            if (!string.IsNullOrEmpty(PlayerSettings.productName))
+            {
+                string safeName = PlayerSettings.productName.Replace(" ", "_");
+                // 특수문자 제거
+                safeName = System.Text.RegularExpressions.Regex.Replace(safeName, @"[^\w\-_]", "");
+                buildPath = Path.Combine(Path.GetDirectoryName(buildPath), safeName);
+            }
+            
+            // 출력 디렉토리 생성
+            if (!Directory.Exists(buildPath))
+            {
+                Directory.CreateDirectory(buildPath);
+                Debug.Log($"빌드 출력 디렉토리 생성: {buildPath}");
+            }
+            
+            // 빌드할 씬들 가져오기 (Build Settings에서 활성화된 씬만)
+            string[] scenes = GetBuildScenes();
+            if (scenes.Length == 0)
+            {
+                Debug.LogError("빌드할 씬이 없습니다. Build Settings에서 씬을 추가하세요.");
+                return;
+            }
+            
+            // WebGL 빌드 옵션 설정 (Player Settings 완전 반영)
+            BuildPlayerOptions buildPlayerOptions = new BuildPlayerOptions();
+            buildPlayerOptions.scenes = scenes;
+            buildPlayerOptions.locationPathName = buildPath;
+            buildPlayerOptions.target = BuildTarget.WebGL;
+            
+            // 빌드 옵션을 Player Settings에 따라 설정
+            buildPlayerOptions.options = GetBuildOptionsFromPlayerSettings();
+            
+            // WebGL 특수 설정 적용
+            ApplyWebGLSettings();
+            
+            Debug.Log($"🌐 WebGL 빌드 시작");
+            Debug.Log($"📁 빌드 경로: {buildPlayerOptions.locationPathName}");
+            Debug.Log($"🎮 제품명: {PlayerSettings.productName}");
+            Debug.Log($"🏢 회사명: {PlayerSettings.companyName}");
+            Debug.Log($"📋 버전: {PlayerSettings.bundleVersion}");
+            
+            // WebGL 빌드 실행
+            var report = BuildPipeline.BuildPlayer(buildPlayerOptions);
+            ExportBuildReport(report, buildPath);
+            
+            // 빌드 결과 확인
+            if (report.summary.result == UnityEditor.Build.Reporting.BuildResult.Succeeded)
+            {
+                Debug.Log($"✅ WebGL 빌드 성공!");
+                Debug.Log($"📦 빌드 크기: {FormatBytes(report.summary.totalSize)}");
+                Debug.Log($"⏱️ 빌드 시간: {report.summary.totalTime}");
+                Debug.Log($"📁 빌드 경로: {buildPath}");
+                Debug.Log($"🌐 WebGL 빌드 완료!");
+            }
+            else
+            {
+                Debug.LogError($"❌ WebGL 빌드 실패: {report.summary.result}");
+                if (report.summary.totalErrors > 0)
+                {
+                    Debug.LogError($"에러 수: {report.summary.totalErrors}");
+                }
+                if (report.summary.totalWarnings > 0)
+                {
+                    Debug.LogWarning($"경고 수: {report.summary.totalWarnings}");
+                }
+            }
+            
+            Debug.Log("=== WebGL Player Settings 반영 빌드 완료 ===");
+        }
+        
+        private static string GetCommandLineBuildOutput(string defaultPath)
+        {
+            // 패키지에 포함된 스크립트는 프로젝트별 경로를 모르므로 명령행 인수로 전달받음
+            string[] args = System.Environment.GetCommandLineArgs();
+            for (int i = 0; i < args.Length - 1; i++)
+            {
+                if (args[i] == "-buildOutput")
+                {
+                    return args[i + 1];
+                }
+            }
+            return defaultPath;
+        }
+        
+        private static void ConfigureWebGLPlayerSettings()
+        {
+            Debug.Log("🔧 WebGL Player Settings 이미지 기반 고정 설정 적용 중...");
+            
+            // 기본 제품 정보 설정 (비어있는 경우에만)
+            if (string.IsNullOrEmpty(PlayerSettings.productName))
+            {
+                PlayerSettings.productName = "Science Experiment Simulation";
+                Debug.Log("✅ 제품명 설정: Science Experiment Simulation");
+            }
+            
+            if (string.IsNullOrEmpty(PlayerSettings.companyName))
+            {
+                PlayerSettings.companyName = "Educational Software";
+                Debug.Log("✅ 회사명 설정: Educational Software");
+            }
+            
+            if (string.IsNullOrEmpty(PlayerSettings.bundleVersion))
+            {
+                PlayerSettings.bundleVersion = "1.0.0";
+                Debug.Log("✅ 버전 설정: 1.0.0");
+            }
+            
+            // === 이미지 기반 고정 설정 적용 ===
+            
+            // Resolution and Presentation 설정 (이미지 기반)
+            PlayerSettings.defaultWebScreenWidth = 1655;
+            PlayerSettings.defaultWebScreenHeight = 892;
+            PlayerSettings.runInBackground = true;
+            Debug.Log("✅ 해상도 설정: 1655x892, Run In Background 활성화");
+            
+            // WebGL Template 설정 (이미지 기반: Minimal)
+            PlayerSettings.WebGL.template = "APPLICATION:Minimal";
+            Debug.Log("✅ WebGL 템플릿 설정: Minimal");
+            
+            // Publishing Settings (이미지 기반)
+            PlayerSettings.WebGL.compressionFormat = WebGLCompressionFormat.Disabled;
+            PlayerSettings.WebGL.nameFilesAsHashes = true;
+            PlayerSettings.WebGL.dataCaching = true;
+            // Unity 6에서 debugSymbols -> debugSymbolMode로 변경
+            PlayerSettings.WebGL.debugSymbolMode = WebGLDebugSymbolMode.Off;
+            PlayerSettings.WebGL.showDiagnostics = false;
+            PlayerSettings.WebGL.decompressionFallback = false;
+            Debug.Log("✅ Publishing Settings: 압축 비활성화, 파일명 해시화, 데이터 캐싱 활성화");
+            
+            // WebAssembly Language Features (이미지 기반)
+            PlayerSettings.WebGL.exceptionSupport = WebGLExceptionSupport.ExplicitlyThrownExceptionsOnly;
+            PlayerSettings.WebGL.threadsSupport = false;
+            // Unity 6에서 wasmStreaming 제거됨 (decompressionFallback에 따라 자동 결정)
+            Debug.Log("✅ WebAssembly 설정: 명시적 예외만, 멀티스레딩 비활성화, 스트리밍 자동");
+            
+            // Memory Settings (이미지 기반)
+            PlayerSettings.WebGL.memorySize = 32;  // Initial Memory Size
+            PlayerSettings.WebGL.memoryGrowthMode = WebGLMemoryGrowthMode.Geometric;
+            PlayerSettings.WebGL.maximumMemorySize = 2048;
+            Debug.Log("✅ 메모리 설정: 초기 32MB, 최대 2048MB, Geometric 증가");
+            
+            // Splash Screen 설정 (이미지 기반)
+            PlayerSettings.SplashScreen.show = true;
+            PlayerSettings.SplashScreen.showUnityLogo = false;
+            PlayerSettings.SplashScreen.animationMode = PlayerSettings.SplashScreen.AnimationMode.Dolly;
+            // Unity 6에서 logoAnimationMode 제거됨
+            PlayerSettings.SplashScreen.overlayOpacity = 0.0f;
+            PlayerSettings.SplashScreen.blurBackgroundImage = true;
+            Debug.Log("✅ 스플래시 화면: Unity 로고 숨김, Dolly 애니메이션, 오버레이 투명");
+            
+            // WebGL 링커 타겟 설정 (Unity 6 최적화)
+            PlayerSettings.WebGL.linkerTarget = WebGLLinkerTarget.Wasm;
+            Debug.Log("✅ WebGL 링커 타겟 설정: WebAssembly (Unity 6 최적화)");
+            
+            Debug.Log("🔧 WebGL Player Settings 이미지 기반 고정 설정 완료");
+        }
+        
+        private static void LogCurrentPlayerSettings()
+        {
+            Debug.Log("=== 현재 WebGL Player Settings ===");
+            Debug.Log($"🎮 제품명: {PlayerSettings.productName}");
+            Debug.Log($"🏢 회사명: {PlayerSettings.companyName}");
+            Debug.Log($"📋 버전: {PlayerSettings.bundleVersion}");
+            
+            // Unity 6 호환성: 아이콘 API 확인 (Unity 버전에 따라 다름)
+            try
+            {
+                // Unity 6에서는 NamedBuildTarget과 IconKind 사용
+                var icons = PlayerSettings.GetIcons(NamedBuildTarget.WebGL, IconKind.Application);
+                Debug.Log($"🖼️ 기본 아이콘: {(icons != null && icons.Length > 0 ? "설정됨" : "없음")}");
+            }
+            catch
+            {
+                Debug.Log($"🖼️ 기본 아이콘: 확인 불가 (Unity 버전 호환성 문제)");
+            }
+            
+            // WebGL 전용 설정들
+            Debug.Log($"🌐 WebGL 템플릿: {PlayerSettings.WebGL.template}");
+            Debug.Log($"💾 WebGL 메모리 크기: {PlayerSettings.WebGL.memorySize}MB");
+            Debug.Log($"📦 WebGL 압축 포맷: {PlayerSettings.WebGL.compressionFormat}");
+            Debug.Log($"⚠️ WebGL 예외 지원: {PlayerSettings.WebGL.exceptionSupport}");
+            Debug.Log($"💽 WebGL 데이터 캐싱: {PlayerSettings.WebGL.dataCaching}");
+            Debug.Log($"🔧 WebGL 링커 타겟: {PlayerSettings.WebGL.linkerTarget}");
+            Debug.Log($"🎯 WebGL 최적화: Unity 6에서 자동 관리");
+            Debug.Log("=====================================");
+        }
+        
+        private static BuildOptions GetBuildOptionsFromPlayerSettings()
+        {
+            BuildOptions options = BuildOptions.None;
+            
+            // Development Build 설정 확인
+            if (EditorUserBuildSettings.development)
+            {
+                options |= BuildOptions.Development;
+                Debug.Log("✅ Development Build 모드 활성화");
+            }
+            
+            // Script Debugging 설정 확인
+            if (EditorUserBuildSettings.allowDebugging)
+            {
+                options |= BuildOptions.AllowDebugging;
+                Debug.Log("✅ Script Debugging 활성화");
+            }
+            
+            // Profiler 설정 확인
+            if (EditorUserBuildSettings.connectProfiler)
+            {
+                options |= BuildOptions.ConnectWithProfiler;
+                Debug.Log("✅ Profiler 연결 활성화");
+            }
+            
+            // Deep Profiling 설정 확인
+            if (EditorUserBuildSettings.buildWithDeepProfilingSupport)
+            {
+                options |= BuildOptions.EnableDeepProfilingSupport;
+                Debug.Log("✅ Deep Profiling 지원 활성화");
+            }
+            
+            // Unity 6에서 autoRunPlayer 제거됨
+            // WebGL은 브라우저에서 실행되므로 AutoRunPlayer 옵션 불필요
+            Debug.Log("ℹ️ WebGL 빌드는 브라우저에서 수동 실행");
+            
+            return options;
+        }
+        
+        private static void ApplyWebGLSettings()
+        {
+            Debug.Log("🌐 WebGL 특수 설정 적용 및 검증 중...");
+            
+            Debug.Log($"🌐 WebGL 템플릿 사용: {PlayerSettings.WebGL.template}");
+            Debug.Log($"💾 WebGL 메모리 크기: {PlayerSettings.WebGL.memorySize}MB");
+            Debug.Log($"📦 WebGL 압축 포맷: {PlayerSettings.WebGL.compressionFormat}");
+            Debug.Log($"⚠️ WebGL 예외 지원: {PlayerSettings.WebGL.exceptionSupport}");
+            Debug.Log($"💽 WebGL 데이터 캐싱: {PlayerSettings.WebGL.dataCaching}");
+            
+            // WebGL 최적화 설정 확인 및 권장사항
+            if (PlayerSettings.WebGL.memorySize < 256)
+            {
+                Debug.LogWarning("⚠️ WebGL 메모리 크기가 256MB 미만입니다. 과학실험 시뮬레이션에는 512MB 이상 권장합니다.");
+            }
+            else if (PlayerSettings.WebGL.memorySize >= 512)
+            {
+                Debug.Log("✅ WebGL 메모리 크기가 적절합니다 (512MB 이상).");
+            }
+            
+            if (string.IsNullOrEmpty(PlayerSettings.WebGL.template) || PlayerSettings.WebGL.template == "APPLICATION:Default")
+            {
+                Debug.LogWarning("⚠️ WebGL 템플릿이 기본값입니다. 교육용 템플릿 사용을 권장합니다.");
+            }
+            else
+            {
+                Debug.Log($"✅ WebGL 템플릿 설정됨: {PlayerSettings.WebGL.template}");
+            }
+            
+            // WebGL 압축 설정 확인
+            if (PlayerSettings.WebGL.compressionFormat == WebGLCompressionFormat.Disabled)
+            {
+                Debug.LogWarning("⚠️ WebGL 압축이 비활성화되어 있습니다. 파일 크기가 클 수 있습니다.");
+            }
+            else
+            {
+                Debug.Log($"✅ WebGL 압축 활성화: {PlayerSettings.WebGL.compressionFormat}");
+            }
+            
+            // 과학실험 시뮬레이션에 최적화된 설정 권장사항
+            Debug.Log("📚 과학실험 시뮬레이션 최적화 권장사항:");
+            Debug.Log("  - 메모리: 512MB 이상");
+            Debug.Log("  - 압축: Gzip 또는 Brotli");
+            Debug.Log("  - 예외 지원: ExplicitlyThrownExceptionsOnly");
+            Debug.Log("  - 데이터 캐싱: 활성화");
+        }
+        
+        private static string[] GetBuildScenes()
+        {
+            // Build Settings에서 활성화된 씬들만 가져오기
+            var enabledScenes = new System.Collections.Generic.List<string>();
+            
+            foreach (var scene in EditorBuildSettings.scenes)
+            {
+                if (scene.enabled)
+                {
+                    enabledScenes.Add(scene.path);
+                }
+            }
+            
+            Debug.Log($"📋 빌드할 씬 수: {enabledScenes.Count}");
+            foreach (var scene in enabledScenes)
+            {
+                Debug.Log($"  - {scene}");
+            }
+            
+            return enabledScenes.ToArray();
+        }
+        
+        [System.Serializable]
+        private class BuildStepExport
+        {
+            public string name;
+            public int depth;
+            public double seconds;
+        }
+        
+        [System.Serializable]
+        private class PackedAssetExport
+        {
+            public string path;
+            public string type;
+            public long size;
+        }
+        
+        [System.Serializable]
+        private class BuildFileExport
+        {
+            public string path;
+            public string role;
+            public long size;
+        }
+        
+        [System.Serializable]
+        private class BuildReportExport
+        {
+            public string guid;
+            public string productName;
+            public string unityVersion;
+            public string result;
+            public string buildStartedAt;
+            public double totalSeconds;
+            public long totalSize;
+            public int totalErrors;
+            public int totalWarnings;
+            public BuildStepExport[] steps;
+            public PackedAssetExport[] packedAssets;
+            public BuildFileExport[] files;
+        }
+        
+        private static void ExportBuildReport(UnityEditor.Build.Reporting.BuildReport report, string buildPath)
+        {
+            // 빌드 단계 시간, 에셋별 크기, 출력 파일을 JSON으로 저장 (툴킷이 실행 기록 DB에 수집)
+            try
+            {
+                var export = new BuildReportExport();
+                export.guid = report.summary.guid.ToString();
+                export.productName = PlayerSettings.productName;
+                export.unityVersion = Application.unityVersion;
+                export.result = report.summary.result.ToString();
+                export.buildStartedAt = report.summary.buildStartedAt.ToUniversalTime().ToString("o");
+                export.totalSeconds = report.summary.totalTime.TotalSeconds;
+                export.totalSize = (long)report.summary.totalSize;
+                export.totalErrors = report.summary.totalErrors;
+                export.totalWarnings = report.summary.totalWarnings;
+                
+                var steps = new System.Collections.Generic.List<BuildStepExport>();
+                foreach (var step in report.steps)
+                {
+                    steps.Add(new BuildStepExport { name = step.name, depth = step.depth, seconds = step.duration.TotalSeconds });
+                }
+                export.steps = steps.ToArray();
+                
+                // 같은 에셋이 여러 묶음에 나뉘어 들어갈 수 있으므로 경로별로 합산 후 큰 순서로 상위 항목만 기록
+                var assetsByPath = new System.Collections.Generic.Dictionary<string, PackedAssetExport>();
+                foreach (var packed in report.packedAssets)
+                {
+                    foreach (var info in packed.contents)
+                    {
+                        string path = string.IsNullOrEmpty(info.sourceAssetPath) ? "(built-in)" : info.sourceAssetPath;
+                        PackedAssetExport entry;
+                        if (!assetsByPath.TryGetValue(path, out entry))
+                        {
+                            entry = new PackedAssetExport { path = path, type = info.type != null ? info.type.Name : "" };
+                            assetsByPath[path] = entry;
+                        }
+                        entry.size += (long)info.packedSize;
+                    }
+                }
+                var assets = new System.Collections.Generic.List<PackedAssetExport>(assetsByPath.Values);
+                assets.Sort((a, b) => b.size.CompareTo(a.size));
+                if (assets.Count > 200)
+                {
+                    assets.RemoveRange(200, assets.Count - 200);
+                }
+                export.packedAssets = assets.ToArray();
+                
+                var files = new System.Collections.Generic.List<BuildFileExport>();
+    #if UNITY_2022_1_OR_NEWER
+                var buildFiles = report.GetFiles();
+    #else
+                var buildFiles = report.files;
+    #endif
+                foreach (var file in buildFiles)
+                {
+                    files.Add(new BuildFileExport { path = file.path.Replace('\\', '/'), role = file.role, size = (long)file.size });
+                }
+                export.files = files.ToArray();
+                
+                string reportPath = Path.Combine(Path.GetDirectoryName(buildPath), ".build_report.json");
+                File.WriteAllText(reportPath, JsonUtility.ToJson(export));
+                Debug.Log($"📊 빌드 리포트 저장: {reportPath}");
+            }
+            catch (System.Exception e)
+            {
+                Debug.LogWarning($"빌드 리포트 저장 실패: {e.Message}");
+            }
+        }
+        
+        private static string FormatBytes(ulong bytes)
+        {
+            string[] sizes = { "B", "KB", "MB", "GB", "TB" };
+            double len = bytes;
+            int order = 0;
+            while (len >= 1024 && order < sizes.Length - 1)
+            {
+                order++;
+                len = len / 1024;
+            }
+            return $"{len:0.##} {sizes[order]}";
+        }
+    }
+}
+#endif
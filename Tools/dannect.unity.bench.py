@@ -0,0 +1,503 @@
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import socket
+import argparse
+import tempfile
+import threading
+import contextlib
+import subprocess
+import statistics
+import importlib
+
+# =========================
+# #region 벤치마크 설정
+# =========================
+TOOLKIT_DIR = os.path.dirname(os.path.abspath(__file__))  # dannect_toolkit 패키지가 있는 폴더
+TOOLKIT_MODULES = ["config", "sources", "manifests", "mirror", "gitops", "unity", "build",
+                   "payload_budget", "precompression", "stage_pipeline", "distributed", "run_history"]
+DEFAULT_BASELINE_PATH = os.path.join(os.path.expanduser("~"), ".dannect_toolkit", "bench_baseline.json")
+DEFAULT_TOLERANCE = 0.25  # 기준 대비 이 비율 이상 느려지면 성능 저하로 판단
+
+# 생성할 C# 파일 인코딩 (순서대로 돌아가며 사용)
+BENCH_ENCODINGS = ["utf-8", "utf-8-sig", "euc-kr", "cp949", "utf-16"]
+
+# deprecated API 호출 예시 (fix_unity6_deprecated_apis 교체 대상)
+DEPRECATED_API_LINES = [
+    "var target = FindObjectOfType<{type}>();",
+    "var targets = FindObjectsOfType<{type}>();",
+    "var other = GameObject.FindObjectOfType<{type}>();",
+    "PlayerSettings.WebGL.debugSymbols = false;",
+    "PlayerSettings.WebGL.wasmStreaming = true;",
+]
+MODERN_API_LINES = [
+    "var target = GetComponent<{type}>();",
+    "transform.position += Vector3.up * Time.deltaTime;",
+    "Debug.Log(\"{type} 상태 갱신\");",
+]
+
+BENCH_STAGES = ["convert_to_utf8", "process_unity6_compatibility", "add_git_packages_to_manifest",
+                "commit_and_push_changes", "package_mirror", "unity_batch", "webgl_build", "payload", "precompress"]
+# 기본 단계와 같은 작업을 한 번에 수행하므로 --stages로 지정할 때만 측정
+BENCH_OPTIONAL_STAGES = ["pipeline", "distributed"]
+# [(프로젝트명, 성공 여부)]를 반환하는 단계 (실패한 프로젝트가 있으면 측정 실패)
+BENCH_CHECKED_STAGES = ["unity_batch", "webgl_build", "pipeline", "distributed"]
+# endregion
+
+# =========================
+# #region 가짜 Unity 실행 파일
+# =========================
+# 환경 변수로 동작을 조절합니다.
+#   FAKE_UNITY_DELAY          전체 실행 시간 (초, 로그 줄마다 나누어 대기)
+#   FAKE_UNITY_EXIT_CODE      종료 코드
+#   FAKE_UNITY_FAIL_PROJECTS  컴파일 오류로 실패할 프로젝트명 (쉼표 구분)
+#   FAKE_UNITY_LOCKED_PROJECTS  첫 실행 시 "이미 열린 프로젝트" 오류를 낼 프로젝트명 (쉼표 구분)
+#   FAKE_UNITY_BUILD_KB       WebGL 빌드 출력물 크기 (.data 기준, KB)
+FAKE_UNITY_SOURCE = r'''import os
+import sys
+import time
+import hashlib
+import json
+import random
+
+def arg_value(name):
+    if name in sys.argv:
+        index = sys.argv.index(name)
+        if index + 1 < len(sys.argv):
+            return sys.argv[index + 1]
+    return None
+
+project_path = arg_value("-projectPath") or os.getcwd()
+method = arg_value("-executeMethod") or ""
+project_name = os.path.basename(project_path.rstrip(os.sep))
+delay = float(os.environ.get("FAKE_UNITY_DELAY", "0.2"))
+exit_code = int(os.environ.get("FAKE_UNITY_EXIT_CODE", "0"))
+failing = [p for p in os.environ.get("FAKE_UNITY_FAIL_PROJECTS", "").split(",") if p]
+locked = [p for p in os.environ.get("FAKE_UNITY_LOCKED_PROJECTS", "").split(",") if p]
+build_kb = int(os.environ.get("FAKE_UNITY_BUILD_KB", "512"))
+
+lines = [
+    "Initialize engine version: 6000.0.30f1 (fake)",
+    "[Licensing::Module] Successfully connected to LicensingClient",
+    "Asset Pipeline Refresh (id=fake): Total: %.3f seconds - Initiated by InitialRefreshV2" % (delay * 0.3),
+    "*** Tundra build success (%.2f seconds), 12 items updated, 120 evaluated" % (delay * 0.2),
+    "Domain Reload Profiling: %dms" % int(delay * 100),
+]
+step = delay / (len(lines) + 2)
+
+def emit(line):
+    print(line, flush=True)
+    time.sleep(step)
+
+if project_name in locked:
+    marker = os.path.join(project_path, "Temp", "fake_unity_locked")
+    if not os.path.exists(marker):
+        os.makedirs(os.path.dirname(marker), exist_ok=True)
+        open(marker, "w").close()
+        print("It looks like another Unity instance is running with this project open.", flush=True)
+        sys.exit(1)
+
+for line in lines:
+    emit(line)
+
+if project_name in failing:
+    print("Assets/Scripts/Broken.cs(10,5): error CS0246: The type or namespace name 'Missing' could not be found", flush=True)
+    print("Scripts have compiler errors.", flush=True)
+    sys.exit(1)
+
+if method.endswith("AutoWebGLBuildScript.BuildWebGLWithPlayerSettings"):
+    build_dir = arg_value("-buildOutput") or os.path.join(project_path, "Builds", "WebGL")
+    os.makedirs(os.path.join(build_dir, "Build"), exist_ok=True)
+    # 반복 패턴은 gzip이 거의 없는 크기로 줄여 압축 시간을 잴 수 없으므로 프로젝트별 시드의 난수 바이트 사용
+    payload = random.Random(project_name).getrandbits(build_kb * 1024 * 8).to_bytes(build_kb * 1024, "little")
+    outputs = {
+        ".data": payload[: build_kb * 1024],
+        ".wasm": payload[: build_kb * 512],
+        ".framework.js": b"var unityFramework = function() {};\n" * (build_kb * 8),
+    }
+    output_files = []
+    for suffix, content in outputs.items():
+        name = hashlib.md5(content).hexdigest() + suffix
+        with open(os.path.join(build_dir, "Build", name), "wb") as f:
+            f.write(content)
+        output_files.append({"path": os.path.join(build_dir, "Build", name).replace(os.sep, "/"),
+                             "role": suffix.lstrip("."), "size": len(content)})
+    # 빌드 스크립트의 ExportBuildReport와 같은 형식의 요약
+    report = {
+        "guid": hashlib.md5(f"{project_name}{time.time()}".encode("utf-8")).hexdigest(),
+        "productName": project_name,
+        "unityVersion": "6000.0.30f1",
+        "result": "Succeeded",
+        "totalSeconds": delay,
+        "totalSize": sum(len(content) for content in outputs.values()),
+        "steps": [
+            {"name": "Build player", "depth": 0, "seconds": delay},
+            {"name": "Compile scripts", "depth": 1, "seconds": delay * 0.3},
+            {"name": "Link IL2CPP", "depth": 1, "seconds": delay * 0.6},
+        ],
+        "packedAssets": [
+            {"path": "Assets/Textures/Atlas.png", "type": "Texture2D", "size": build_kb * 256},
+            {"path": "Packages/com.bench.toolkit/Runtime/Shared.prefab", "type": "GameObject", "size": 4096},
+        ],
+        "files": output_files,
+    }
+    with open(os.path.join(os.path.dirname(build_dir), ".build_report.json"), "w") as f:
+        json.dump(report, f)
+    with open(os.path.join(build_dir, "Build", "WebGL.loader.js"), "w") as f:
+        f.write("function createUnityInstance() {}\n")
+    with open(os.path.join(build_dir, "index.html"), "w") as f:
+        f.write("<html><body>" + project_name + "</body></html>\n")
+    emit("빌드 시간: 00:00:%06.3f" % delay)
+    emit("Build Finished, Result: Success.")
+
+emit("Exiting batchmode successfully now!")
+sys.exit(exit_code)
+'''
+
+def write_fake_unity(bin_dir):
+    """가짜 Unity 실행 파일을 만들고 경로를 반환합니다."""
+    os.makedirs(bin_dir, exist_ok=True)
+    script_path = os.path.join(bin_dir, "fake_unity.py")
+    with open(script_path, "w", encoding="utf-8") as f:
+        f.write(FAKE_UNITY_SOURCE)
+
+    if os.name == "nt":
+        launcher = os.path.join(bin_dir, "Unity.bat")
+        with open(launcher, "w", encoding="utf-8") as f:
+            f.write(f'@"{sys.executable}" "{script_path}" %*\n')
+    else:
+        launcher = os.path.join(bin_dir, "Unity")
+        with open(launcher, "w", encoding="utf-8") as f:
+            f.write(f'#!/bin/sh\nexec "{sys.executable}" "{script_path}" "$@"\n')
+        os.chmod(launcher, 0o755)
+    return launcher
+# endregion
+
+# =========================
+# #region 합성 Unity 프로젝트 생성
+# =========================
+def run_git(args, cwd):
+    """벤치마크 준비용 Git 명령을 실행합니다. (실패 시 예외)"""
+    subprocess.run(["git"] + args, cwd=cwd, check=True, capture_output=True)
+
+def generate_cs_file(rng, class_name, lines_per_file, deprecated_density):
+    """한글 주석과 deprecated API 호출이 섞인 C# 소스 코드를 생성합니다."""
+    body = []
+    for i in range(lines_per_file):
+        type_name = rng.choice(["Rigidbody", "Collider", "AudioSource", "Camera", "Light"])
+        if rng.random() < deprecated_density:
+            line = rng.choice(DEPRECATED_API_LINES).format(type=type_name)
+        else:
+            line = rng.choice(MODERN_API_LINES).format(type=type_name)
+        body.append(f"        // 실험 단계 {i}: 비커의 용액 농도를 확인합니다")
+        body.append(f"        {line}")
+
+    return (
+        "using UnityEngine;\n"
+        "using UnityEditor;\n\n"
+        f"// {class_name}: 과학실험 시뮬레이션용 합성 스크립트 (용해도 관찰)\n"
+        f"public class {class_name} : MonoBehaviour\n"
+        "{\n"
+        "    void Update()\n"
+        "    {\n"
+        + "\n".join(body) + "\n"
+        "    }\n"
+        "}\n"
+    )
+
+def generate_project(base_dir, remotes_dir, index, files_per_project, lines_per_file, deprecated_density, seed):
+    """합성 Unity 프로젝트 하나와 로컬 bare 원격 저장소를 생성합니다."""
+    rng = random.Random(seed * 1000 + index)
+    project_name = f"Bench_{index:02d}_Simulation"
+    project_path = os.path.join(base_dir, project_name)
+
+    scripts_dir = os.path.join(project_path, "Assets", "Scripts")
+    os.makedirs(scripts_dir)
+    for file_index in range(files_per_project):
+        class_name = f"Experiment{file_index:03d}"
+        encoding = BENCH_ENCODINGS[(index + file_index) % len(BENCH_ENCODINGS)]
+        source = generate_cs_file(rng, class_name, lines_per_file, deprecated_density)
+        with open(os.path.join(scripts_dir, f"{class_name}.cs"), "w", encoding=encoding) as f:
+            f.write(source)
+
+    os.makedirs(os.path.join(project_path, "ProjectSettings"))
+    with open(os.path.join(project_path, "ProjectSettings", "ProjectSettings.asset"), "w", encoding="utf-8") as f:
+        f.write("%YAML 1.1\nPlayerSettings:\n  productName: " + project_name + "\n")
+    with open(os.path.join(project_path, "ProjectSettings", "ProjectVersion.txt"), "w", encoding="utf-8") as f:
+        f.write("m_EditorVersion: 6000.0.30f1\n")
+
+    # Unity가 생성하는 형식과 같은 2칸 들여쓰기 manifest
+    os.makedirs(os.path.join(project_path, "Packages"))
+    manifest = {"dependencies": {"com.unity.ugui": "2.0.0", "com.unity.modules.physics": "1.0.0"}}
+    with open(os.path.join(project_path, "Packages", "manifest.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+        f.write("\n")
+
+    with open(os.path.join(project_path, ".gitignore"), "w", encoding="utf-8") as f:
+        f.write("[Ll]ibrary/\n[Tt]emp/\n[Ll]ogs/\n[Bb]uilds/\n")
+
+    remote_path = os.path.join(remotes_dir, project_name)
+    run_git(["init", "--bare", "-q", remote_path], base_dir)
+    run_git(["init", "-q", "-b", "main"], project_path)
+    run_git(["config", "user.email", "bench@example.com"], project_path)
+    run_git(["config", "user.name", "bench"], project_path)
+    run_git(["add", "."], project_path)
+    run_git(["commit", "-q", "-m", "Initial synthetic project"], project_path)
+    run_git(["remote", "add", "origin", remote_path], project_path)
+    run_git(["push", "-q", "-u", "origin", "main"], project_path)
+    return project_path
+
+def generate_package_remote(work_dir, remotes_dir, package_name):
+    """manifest에 추가할 Git 패키지를 로컬 bare 저장소로 생성합니다."""
+    source_dir = os.path.join(work_dir, "package_sources", package_name)
+    os.makedirs(os.path.join(source_dir, "Editor"))
+    with open(os.path.join(source_dir, "package.json"), "w", encoding="utf-8") as f:
+        json.dump({"name": package_name, "version": "1.0.0", "displayName": "Bench Toolkit",
+                   "unity": "2021.3", "dependencies": {"com.unity.ugui": "2.0.0"}}, f, indent=2)
+    with open(os.path.join(source_dir, "Editor", "BenchTool.cs"), "w", encoding="utf-8") as f:
+        f.write("public static class BenchTool { }\n")
+
+    remote_path = os.path.join(remotes_dir, package_name + ".git")
+    run_git(["init", "--bare", "-q", "-b", "main", remote_path], work_dir)
+    run_git(["init", "-q", "-b", "main"], source_dir)
+    run_git(["config", "user.email", "bench@example.com"], source_dir)
+    run_git(["config", "user.name", "bench"], source_dir)
+    run_git(["add", "."], source_dir)
+    run_git(["commit", "-q", "-m", "Bench package"], source_dir)
+    run_git(["push", "-q", remote_path, "main"], source_dir)
+    return remote_path
+
+def generate_fleet(work_dir, projects, files_per_project, lines_per_file, deprecated_density, seed):
+    """N개의 합성 프로젝트와 패키지 원격 저장소를 생성합니다.
+
+    반환값: (프로젝트 경로 목록, {패키지명: 로컬 Git URL})
+    """
+    projects_dir = os.path.join(work_dir, "projects")
+    remotes_dir = os.path.join(work_dir, "remotes")
+    os.makedirs(projects_dir)
+    os.makedirs(remotes_dir)
+    packages = {"com.bench.toolkit": generate_package_remote(work_dir, remotes_dir, "com.bench.toolkit")}
+    return [
+        generate_project(projects_dir, remotes_dir, i, files_per_project, lines_per_file, deprecated_density, seed)
+        for i in range(projects)
+    ], packages
+# endregion
+
+# =========================
+# #region 벤치마크 실행
+# =========================
+def load_toolkit():
+    """dannect_toolkit 패키지를 새로 불러옵니다. (반복 실행마다 캐시/기록 등 모듈 상태 초기화)"""
+    if TOOLKIT_DIR not in sys.path:
+        sys.path.insert(0, TOOLKIT_DIR)
+    for name in [name for name in sys.modules if name.split(".")[0] == "dannect_toolkit"]:
+        del sys.modules[name]
+    toolkit = importlib.import_module("dannect_toolkit")
+    for name in TOOLKIT_MODULES:
+        importlib.import_module(f"dannect_toolkit.{name}")
+    return toolkit
+
+def configure_toolkit(toolkit, work_dir, unity_path):
+    """툴킷 상태 폴더, Unity 경로, Git 원격을 벤치마크 작업 폴더로 돌립니다."""
+    state_dir = os.path.join(work_dir, "state")
+    config = toolkit.config
+    original_state_dir = config.TOOLKIT_STATE_DIR
+    for name in dir(config):
+        value = getattr(config, name)
+        if name.isupper() and isinstance(value, str) and value.startswith(original_state_dir):
+            setattr(config, name, state_dir + value[len(original_state_dir):])
+
+    config.UNITY_EDITOR_PATH = unity_path
+    config.GIT_BASE_URL = os.path.join(work_dir, "remotes") + os.sep
+    config.UNITY_RETRY_BACKOFF = 0
+    config.DISTRIBUTED_HEARTBEAT_INTERVAL = 0.5
+    config.DISTRIBUTED_POLL_INTERVAL = 0.2
+
+def run_distributed(toolkit, projects, workers):
+    """코디네이터와 워커 여러 개를 localhost에서 함께 실행하고 작업 결과 [(프로젝트명, 성공 여부)]를 반환합니다. (워커마다 슬롯 1개)"""
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    url = f"http://127.0.0.1:{port}"
+    agents = [
+        threading.Thread(target=toolkit.distributed.run_build_worker, args=(url, projects),
+                         kwargs={"slots": 1, "name": f"bench-worker-{index + 1}"})
+        for index in range(max(1, workers))
+    ]
+    results = {}
+    coordinator = threading.Thread(
+        target=lambda: results.update(toolkit.distributed.run_build_coordinator(
+            projects, ["batch", "build"], force=True, host="127.0.0.1", port=port
+        ))
+    )
+    coordinator.start()
+    time.sleep(0.5)
+    for agent in agents:
+        agent.start()
+    for thread in agents + [coordinator]:
+        thread.join()
+    return [item for kind_results in results.values() for item in kind_results]
+
+def time_stage(timings, stage, func, quiet):
+    """단계 하나를 실행하고 소요 시간을 기록한 뒤 단계의 반환값을 돌려줍니다."""
+    started = time.perf_counter()
+    if quiet:
+        with open(os.devnull, "w", encoding="utf-8") as devnull, contextlib.redirect_stdout(devnull):
+            result = func()
+    else:
+        result = func()
+    timings[stage] = time.perf_counter() - started
+    return result
+
+def get_unexpected_failures(result, args):
+    """단계 결과 [(프로젝트명, 성공 여부)]에서 --fail-projects/--unity-exit-code로 일부러 낸 실패가 아닌 것을 반환합니다."""
+    if args.unity_exit_code != 0:
+        return []
+    return [name for name, success in result or [] if not success and name not in args.fail_projects]
+
+def run_benchmark_once(args, run_index):
+    """합성 프로젝트를 새로 만들고 모든 단계를 한 번 실행하여 단계별 시간을 반환합니다. 단계가 실패하면 None."""
+    if args.work_dir:
+        os.makedirs(args.work_dir, exist_ok=True)
+    work_dir = tempfile.mkdtemp(prefix="dannect_bench_", dir=args.work_dir)
+    try:
+        toolkit = load_toolkit()
+        unity_path = write_fake_unity(os.path.join(work_dir, "bin"))
+        configure_toolkit(toolkit, work_dir, unity_path)
+
+        os.environ["FAKE_UNITY_DELAY"] = str(args.unity_delay)
+        os.environ["FAKE_UNITY_EXIT_CODE"] = str(args.unity_exit_code)
+        os.environ["FAKE_UNITY_FAIL_PROJECTS"] = ",".join(args.fail_projects)
+        os.environ["FAKE_UNITY_BUILD_KB"] = str(args.build_kb)
+
+        started = time.perf_counter()
+        projects, packages = generate_fleet(work_dir, args.projects, args.files, args.lines,
+                                            args.deprecated_density, args.seed + run_index)
+        print(f"  합성 프로젝트 {len(projects)}개 생성 ({time.perf_counter() - started:.2f}초)")
+
+        stages = {
+            "convert_to_utf8": lambda: [toolkit.sources.convert_project_to_utf8(p) for p in projects],
+            "process_unity6_compatibility": lambda: toolkit.sources.process_unity6_compatibility(projects),
+            "add_git_packages_to_manifest": lambda: toolkit.manifests.add_git_packages_to_projects(projects, packages),
+            "commit_and_push_changes": lambda: [toolkit.gitops.commit_and_push_changes(p, "Bench commit") for p in projects],
+            "package_mirror": lambda: toolkit.mirror.use_package_mirrors(projects, packages),
+            "unity_batch": lambda: (
+                [toolkit.unity.create_unity_batch_script(p) for p in projects],
+                toolkit.unity.process_multiple_projects_parallel(projects, max_workers=args.workers),
+            )[1],
+            "webgl_build": lambda: toolkit.build.build_multiple_webgl_projects(
+                projects, parallel=args.workers > 1, max_workers=args.workers, force=True
+            ),
+            "payload": lambda: toolkit.payload_budget.check_payload_budgets(projects),
+            "precompress": lambda: toolkit.precompression.precompress_build_outputs(projects),
+            "pipeline": lambda: toolkit.stage_pipeline.run_project_pipeline(
+                projects, ["convert", "fix", "manifest", "git", "batch", "build"],
+                {"package_versions": packages, "package_pins": None, "clean_keep": 0, "force": True},
+            ),
+            "distributed": lambda: run_distributed(toolkit, projects, args.workers),
+        }
+
+        # 빨리 실패한 단계가 성능 향상으로 보이지 않도록 BENCH_CHECKED_STAGES는 실패한 프로젝트가 있으면 이번 실행을 실패로 처리
+        timings = {}
+        for stage in args.stages:
+            result = time_stage(timings, stage, stages[stage], not args.verbose)
+            failed = get_unexpected_failures(result, args) if stage in BENCH_CHECKED_STAGES else []
+            if failed:
+                print(f"  ❌ {stage}: {len(failed)}개 프로젝트 실패 ({', '.join(failed)}), 측정 중단")
+                return None
+            print(f"  {stage}: {timings[stage]:.3f}초")
+        toolkit.run_history.history_flush()
+        return timings
+    finally:
+        if not args.keep:
+            shutil.rmtree(work_dir, ignore_errors=True)
+        else:
+            print(f"  작업 폴더 유지: {work_dir}")
+
+def compare_with_baseline(results, baseline, tolerance):
+    """기준 결과와 비교하여 성능 저하 단계 목록을 반환합니다."""
+    regressions = []
+    print(f"\n=== 기준 대비 비교 (허용 {tolerance * 100:.0f}%) ===")
+    for stage, seconds in results.items():
+        base = baseline.get("timings", {}).get(stage)
+        if not base:
+            print(f"  {stage:32s} {seconds:8.3f}초   (기준 없음)")
+            continue
+        change = seconds / base - 1
+        mark = "⚠️" if change > tolerance else "✅"
+        print(f"{mark} {stage:32s} {seconds:8.3f}초   기준 {base:8.3f}초   {change * 100:+6.1f}%")
+        if change > tolerance:
+            regressions.append(stage)
+    return regressions
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="합성 Unity 프로젝트와 가짜 Unity로 툴킷 단계별 성능을 측정합니다.")
+    parser.add_argument("--projects", type=int, default=5, help="생성할 프로젝트 수 (기본 5)")
+    parser.add_argument("--files", type=int, default=40, help="프로젝트당 C# 파일 수 (기본 40)")
+    parser.add_argument("--lines", type=int, default=30, help="파일당 코드 줄 수 (기본 30)")
+    parser.add_argument("--deprecated-density", type=float, default=0.2,
+                        help="deprecated API 호출 비율 0~1 (기본 0.2)")
+    parser.add_argument("--unity-delay", type=float, default=0.2, help="가짜 Unity 실행 시간 (초)")
+    parser.add_argument("--unity-exit-code", type=int, default=0, help="가짜 Unity 종료 코드")
+    parser.add_argument("--fail-projects", nargs="*", default=[], help="컴파일 오류로 실패시킬 프로젝트명")
+    parser.add_argument("--build-kb", type=int, default=512, help="가짜 WebGL 빌드 출력 크기 (KB)")
+    parser.add_argument("--workers", type=int, default=2, help="배치/빌드 병렬 작업 수")
+    parser.add_argument("--stages", nargs="*", default=BENCH_STAGES, choices=BENCH_STAGES + BENCH_OPTIONAL_STAGES, help="측정할 단계")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (단계별 중앙값 사용)")
+    parser.add_argument("--seed", type=int, default=1, help="합성 데이터 난수 시드")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE_PATH, help="기준 결과 파일 경로")
+    parser.add_argument("--save-baseline", action="store_true", help="이번 결과를 기준으로 저장")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="허용 성능 저하 비율")
+    parser.add_argument("--work-dir", default=None, help="합성 프로젝트를 만들 상위 폴더 (기본: 임시 폴더)")
+    parser.add_argument("--keep", action="store_true", help="측정 후 합성 프로젝트를 지우지 않음")
+    parser.add_argument("--verbose", action="store_true", help="툴킷 출력을 그대로 표시")
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    print("=== Unity 툴킷 합성 벤치마크 ===")
+    print(f"프로젝트 {args.projects}개 × C# 파일 {args.files}개, deprecated 비율 {args.deprecated_density}, "
+          f"가짜 Unity {args.unity_delay}초, 반복 {args.repeat}회")
+
+    runs = []
+    for run_index in range(args.repeat):
+        print(f"\n--- 실행 {run_index + 1}/{args.repeat} ---")
+        timings = run_benchmark_once(args, run_index)
+        if timings is None:
+            print("\n❌ 단계가 실패하여 벤치마크를 중단합니다. (실패한 실행의 시간은 기준과 비교하거나 저장하지 않음)")
+            sys.exit(1)
+        runs.append(timings)
+
+    results = {stage: statistics.median(run[stage] for run in runs) for stage in args.stages}
+    parameters = {key: getattr(args, key) for key in
+                  ("projects", "files", "lines", "deprecated_density", "unity_delay", "build_kb", "workers")}
+
+    exit_code = 0
+    baseline = None
+    if os.path.exists(args.baseline):
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline.get("parameters") != parameters:
+            print("\n⚠️ 기준 결과와 측정 조건이 다릅니다. 비교 결과를 참고용으로만 사용하세요.")
+        if compare_with_baseline(results, baseline, args.tolerance):
+            exit_code = 1
+    else:
+        print("\n기준 결과 없음 (--save-baseline으로 저장)")
+        for stage, seconds in results.items():
+            print(f"  {stage:32s} {seconds:8.3f}초")
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(os.path.abspath(args.baseline)), exist_ok=True)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump({"created": time.strftime('%Y-%m-%d %H:%M:%S'), "parameters": parameters,
+                       "timings": results}, f, indent=2)
+        print(f"\n💾 기준 결과 저장: {args.baseline}")
+
+    sys.exit(exit_code)
+
+if __name__ == "__main__":
+    main()
+# endregion
@@ -0,0 +1,8 @@
+"""Unity 프로젝트 자동화 도구 (UTF-8 변환, Unity 6 API 수정, 패키지, Git, 배치 모드, WebGL 빌드).
+
+하위 모듈은 필요한 명령이 실행될 때만 불러옵니다. 설정은 dannect_toolkit/config.py에 있습니다.
+
+    python -m dannect_toolkit <명령> [옵션]
+    python dannect.unity.toolkit.py [옵션]   (기존 플래그 방식)
+"""
+__version__ = "1.0.0"
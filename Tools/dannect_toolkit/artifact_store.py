@@ -0,0 +1,299 @@
+"""아티팩트 저장소 (내용 주소 기반 중복 제거, 검증, 정리)."""
+import os
+import hashlib
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from . import config, fileutil, tracing
+
+
+# =========================
+# #region 아티팩트 저장소 (내용 주소 기반 중복 제거, 검증, 정리)
+# =========================
+# objects/<해시 앞 2자리>/<sha256> 에 파일 하나씩 보관하고, 빌드 폴더의 같은 내용 파일은
+# 이 객체에 대한 하드링크(또는 reflink)로 교체합니다.
+# index/<폴더 경로 해시>.json 에는 폴더별 [크기, mtime, inode, 해시]를 기록해
+# 다음 실행 때 바뀌지 않은 파일은 다시 해시하지 않습니다.
+artifact_store_stats = {"files": 0, "linked": 0, "adopted": 0, "saved_bytes": 0, "failed": 0}
+_artifact_store_lock = threading.Lock()
+
+def get_artifact_object_path(file_hash):
+    """해시에 해당하는 저장소 객체 경로를 반환합니다."""
+    return os.path.join(config.ARTIFACT_STORE_DIR, "objects", file_hash[:2], file_hash)
+
+def get_artifact_index_path(directory):
+    """폴더별 인덱스 파일 경로를 반환합니다."""
+    key = hashlib.sha1(os.path.abspath(directory).encode("utf-8")).hexdigest()
+    return os.path.join(config.ARTIFACT_STORE_DIR, "index", f"{key}.json")
+
+def reflink_file(source, target):
+    """파일 내용을 공유하는 복사본(reflink)을 만듭니다. 지원하지 않으면 OSError가 발생합니다."""
+    if sys.platform.startswith("linux"):
+        import fcntl
+        FICLONE = 0x40049409
+        with open(source, "rb") as src, open(target, "wb") as dst:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+    elif sys.platform == "darwin":
+        subprocess.run(["cp", "-c", source, target], check=True, capture_output=True)
+    else:
+        raise OSError("이 운영체제에서는 reflink를 지원하지 않습니다")
+
+def link_artifact(source, target):
+    """ARTIFACT_LINK_MODE에 따라 source를 target으로 연결합니다. (target은 없어야 함)"""
+    try:
+        if config.ARTIFACT_LINK_MODE == "reflink":
+            reflink_file(source, target)
+        else:
+            os.link(source, target)
+    except Exception:
+        if os.path.exists(target):
+            os.remove(target)
+        raise
+
+def is_same_file_stat(stat_a, stat_b):
+    """두 stat 결과가 같은 파일(inode)을 가리키는지 확인합니다."""
+    return stat_a.st_ino == stat_b.st_ino and stat_a.st_dev == stat_b.st_dev
+
+def dedupe_artifact_file(filepath, file_hash):
+    """파일 하나를 저장소 객체와 연결합니다. 객체가 없으면 이 파일을 객체로 등록합니다.
+
+    반환값: "adopted"(새 객체 등록), "linked"(기존 객체로 교체), "same"(이미 연결됨)
+    """
+    object_path = get_artifact_object_path(file_hash)
+    file_stat = os.stat(filepath)
+    
+    try:
+        object_stat = os.stat(object_path)
+    except FileNotFoundError:
+        object_stat = None
+    
+    if object_stat is not None and object_stat.st_size != file_stat.st_size:
+        # 객체가 손상됨 (다른 경로에서 덮어씀) - 현재 파일로 다시 등록
+        print(f"⚠️ 손상된 저장소 객체 교체: {file_hash[:12]}")
+        os.remove(object_path)
+        object_stat = None
+    
+    if object_stat is None:
+        os.makedirs(os.path.dirname(object_path), exist_ok=True)
+        tmp_path = f"{object_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        link_artifact(filepath, tmp_path)
+        os.replace(tmp_path, object_path)
+        return "adopted"
+    
+    if config.ARTIFACT_LINK_MODE != "reflink" and is_same_file_stat(object_stat, file_stat):
+        return "same"
+    
+    tmp_path = f"{filepath}.{os.getpid()}.{threading.get_ident()}.tmp"
+    link_artifact(object_path, tmp_path)
+    os.replace(tmp_path, filepath)
+    return "linked"
+
+def dedupe_artifact_directory(directory):
+    """폴더 안의 모든 파일을 저장소 객체와 연결하고 인덱스를 갱신합니다."""
+    index_path = get_artifact_index_path(directory)
+    old_files = fileutil.load_json_file(index_path, {}).get("files", {})
+    new_files = {}
+    
+    def process_file(relative_path):
+        filepath = os.path.join(directory, relative_path)
+        stat = os.stat(filepath)
+        cached = old_files.get(relative_path)
+        if cached and cached[:3] == [stat.st_size, stat.st_mtime_ns, stat.st_ino]:
+            return relative_path, cached, "same"
+        
+        file_hash = fileutil.hash_file(filepath)
+        result = dedupe_artifact_file(filepath, file_hash)
+        stat = os.stat(filepath)
+        return relative_path, [stat.st_size, stat.st_mtime_ns, stat.st_ino, file_hash], result
+    
+    relative_paths = []
+    for root, dirs, files in os.walk(directory):
+        for file in files:
+            if file.endswith(".tmp"):
+                continue
+            filepath = os.path.join(root, file)
+            if os.path.islink(filepath) or os.path.getsize(filepath) == 0:
+                continue
+            relative_paths.append(os.path.relpath(filepath, directory))
+    
+    with ThreadPoolExecutor(max_workers=config.ARTIFACT_HASH_WORKERS, thread_name_prefix="artifact-hash") as executor:
+        futures = [executor.submit(process_file, relative_path) for relative_path in relative_paths]
+        for future in as_completed(futures):
+            try:
+                relative_path, entry, result = future.result()
+            except Exception as e:
+                with _artifact_store_lock:
+                    artifact_store_stats["failed"] += 1
+                print(f"⚠️ 저장소 연결 실패 ({directory}): {e}")
+                continue
+            new_files[relative_path] = entry
+            with _artifact_store_lock:
+                artifact_store_stats["files"] += 1
+                if result in ("adopted", "linked"):
+                    artifact_store_stats[result] += 1
+                if result == "linked":
+                    artifact_store_stats["saved_bytes"] += entry[0]
+    
+    fileutil.save_json_file(index_path, {"dir": os.path.abspath(directory), "updated_at": time.time(), "files": new_files})
+
+def get_artifact_directories(project_dirs):
+    """중복 제거 대상 폴더 목록: 프로젝트 빌드 폴더와 빌드 캐시 항목들"""
+    directories = [
+        os.path.join(project_dir, config.BUILD_OUTPUT_DIR)
+        for project_dir in project_dirs
+        if os.path.isdir(os.path.join(project_dir, config.BUILD_OUTPUT_DIR))
+    ]
+    if os.path.isdir(config.BUILD_CACHE_DIR):
+        for project_name in sorted(os.listdir(config.BUILD_CACHE_DIR)):
+            entries_dir = os.path.join(config.BUILD_CACHE_DIR, project_name, "entries")
+            if not os.path.isdir(entries_dir):
+                continue
+            for entry in sorted(os.listdir(entries_dir)):
+                if not entry.endswith(".tmp"):
+                    directories.append(os.path.join(entries_dir, entry))
+    return directories
+
+@tracing.traced("stage")
+def dedupe_build_artifacts(project_dirs):
+    """빌드 출력물과 빌드 캐시의 동일한 파일을 저장소 객체 하나로 공유하도록 연결합니다."""
+    print("\n=== 빌드 출력물 중복 제거 시작 ===")
+    directories = get_artifact_directories(project_dirs)
+    if not directories:
+        print("⚪ 중복 제거할 빌드 출력물이 없습니다.")
+        return
+    
+    print(f"📁 대상 폴더 {len(directories)}개 (링크 방식: {config.ARTIFACT_LINK_MODE})")
+    for directory in directories:
+        dedupe_artifact_directory(directory)
+    
+    stats = artifact_store_stats
+    print(f"🔗 기존 객체로 교체: {stats['linked']}개, 새 객체 등록: {stats['adopted']}개, 확인한 파일: {stats['files']}개")
+    print(f"💾 이번 실행에서 절약한 용량: {fileutil.format_bytes(stats['saved_bytes'])}")
+    if stats["failed"]:
+        print(f"⚠️ 연결 실패: {stats['failed']}개 (저장소와 빌드 폴더가 같은 볼륨인지 확인하세요: {config.ARTIFACT_STORE_DIR})")
+    print_artifact_store_usage()
+
+def detach_artifact_links(directory):
+    """폴더 안에서 저장소 객체와 하드링크된 파일을 독립된 복사본으로 바꿉니다.
+
+    Unity가 출력 파일을 제자리에서 덮어쓰면 하드링크된 저장소 객체도 함께 바뀌므로 빌드 전에 호출합니다.
+    """
+    if config.ARTIFACT_LINK_MODE == "reflink" or not os.path.isfile(get_artifact_index_path(directory)):
+        return
+    for root, dirs, files in os.walk(directory):
+        for file in files:
+            filepath = os.path.join(root, file)
+            try:
+                if os.lstat(filepath).st_nlink <= 1:
+                    continue
+                tmp_path = f"{filepath}.{os.getpid()}.{threading.get_ident()}.tmp"
+                shutil.copy2(filepath, tmp_path)
+                os.replace(tmp_path, filepath)
+            except OSError as e:
+                print(f"⚠️ 저장소 링크 분리 실패: {filepath} ({e})")
+    os.remove(get_artifact_index_path(directory))
+
+def iter_artifact_objects():
+    """저장소의 모든 객체 (해시, 경로)를 반환합니다."""
+    objects_dir = os.path.join(config.ARTIFACT_STORE_DIR, "objects")
+    if not os.path.isdir(objects_dir):
+        return
+    for prefix in sorted(os.listdir(objects_dir)):
+        prefix_dir = os.path.join(objects_dir, prefix)
+        for name in sorted(os.listdir(prefix_dir)):
+            if not name.endswith(".tmp"):
+                yield name, os.path.join(prefix_dir, name)
+
+@tracing.traced("stage")
+def verify_artifact_store():
+    """모든 저장소 객체의 내용을 다시 해시하여 파일명(해시)과 일치하는지 검사합니다.
+
+    손상된 객체는 삭제하고, 그 객체를 참조하던 폴더의 인덱스를 지워 다음 중복 제거 때 다시 처리되게 합니다.
+    """
+    print("\n=== 아티팩트 저장소 검증 시작 ===")
+    objects = list(iter_artifact_objects())
+    corrupted = []
+    with ThreadPoolExecutor(max_workers=config.ARTIFACT_HASH_WORKERS, thread_name_prefix="artifact-hash") as executor:
+        future_to_object = {executor.submit(fileutil.hash_file, path): (file_hash, path) for file_hash, path in objects}
+        for future in as_completed(future_to_object):
+            file_hash, path = future_to_object[future]
+            if future.result() != file_hash:
+                corrupted.append((file_hash, path))
+    
+    if corrupted:
+        corrupted_hashes = {file_hash for file_hash, _ in corrupted}
+        for file_hash, path in corrupted:
+            print(f"❌ 손상된 객체: {file_hash[:12]} (삭제)")
+            os.remove(path)
+        for index_path, index in load_artifact_indexes():
+            affected = [rel for rel, entry in index.get("files", {}).items() if entry[3] in corrupted_hashes]
+            if affected:
+                print(f"⚠️ {index.get('dir')}: 손상된 내용을 공유하던 파일 {len(affected)}개 (예: {affected[0]}), 다시 빌드가 필요할 수 있습니다")
+                os.remove(index_path)
+    
+    print(f"✅ 검사한 객체: {len(objects)}개, 손상: {len(corrupted)}개")
+    return not corrupted
+
+def load_artifact_indexes():
+    """모든 폴더 인덱스를 (경로, 내용) 목록으로 반환합니다."""
+    index_dir = os.path.join(config.ARTIFACT_STORE_DIR, "index")
+    if not os.path.isdir(index_dir):
+        return []
+    return [
+        (os.path.join(index_dir, name), fileutil.load_json_file(os.path.join(index_dir, name), {}))
+        for name in sorted(os.listdir(index_dir)) if name.endswith(".json")
+    ]
+
+@tracing.traced("stage")
+def gc_artifact_store():
+    """더 이상 어떤 폴더에서도 쓰지 않는 저장소 객체를 삭제합니다.
+
+    하드링크 방식에서는 링크 수가 1(저장소 자신만 참조)인 객체가 삭제 대상이고,
+    reflink 방식에서는 인덱스가 참조하지 않는 객체가 삭제 대상입니다.
+    """
+    print("\n=== 아티팩트 저장소 정리(GC) 시작 ===")
+    
+    # 사라진 폴더의 인덱스 정리 및 참조 중인 해시 수집
+    referenced = set()
+    for index_path, index in load_artifact_indexes():
+        if not os.path.isdir(index.get("dir", "")):
+            os.remove(index_path)
+            continue
+        referenced.update(entry[3] for entry in index.get("files", {}).values())
+    
+    removed_count = 0
+    removed_bytes = 0
+    for file_hash, path in iter_artifact_objects():
+        stat = os.stat(path)
+        if config.ARTIFACT_LINK_MODE == "reflink":
+            unused = file_hash not in referenced
+        else:
+            unused = stat.st_nlink <= 1
+        if unused:
+            os.remove(path)
+            removed_count += 1
+            removed_bytes += stat.st_size
+    
+    print(f"🗑️ 삭제한 객체: {removed_count}개 ({fileutil.format_bytes(removed_bytes)})")
+    print_artifact_store_usage()
+
+def print_artifact_store_usage():
+    """저장소 실제 용량과 폴더들이 참조하는 논리 용량을 비교해 출력합니다."""
+    object_count = 0
+    store_bytes = 0
+    for _, path in iter_artifact_objects():
+        object_count += 1
+        store_bytes += os.path.getsize(path)
+    logical_bytes = sum(
+        entry[0]
+        for _, index in load_artifact_indexes()
+        for entry in index.get("files", {}).values()
+    )
+    print(f"📦 저장소: 객체 {object_count}개, {fileutil.format_bytes(store_bytes)} "
+          f"(연결된 빌드 출력 논리 용량 {fileutil.format_bytes(logical_bytes)}, "
+          f"절약 {fileutil.format_bytes(max(0, logical_bytes - store_bytes))})")
+# endregion
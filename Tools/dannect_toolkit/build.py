@@ -0,0 +1,759 @@
+"""Unity WebGL 빌드 자동화와 빌드 출력물 정리."""
+import os
+import textwrap
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from . import artifact_store, build_cache, config, fileutil, logs, run_history, schedule, tracing, unity
+
+
+# =========================
+# #region Unity 빌드 자동화 함수들 (Player Settings 완전 반영)
+# =========================
+def create_unity_webgl_build_script(project_path, output_path=None, auto_configure=True):
+    """Unity WebGL 빌드를 위한 Editor 스크립트를 생성합니다. (Player Settings 자동 설정 포함)
+
+    내용이 이전과 같으면 파일을 다시 쓰지 않아 Unity 스크립트 재컴파일을 피합니다.
+    """
+    script_path = os.path.join(project_path, "Assets", "Editor", "AutoWebGLBuildScript.cs")
+    
+    if use_package_editor_scripts(project_path):
+        remove_generated_editor_script(script_path)
+        return True
+    
+    script_content = render_unity_webgl_build_script(project_path, output_path)
+    
+    try:
+        if fileutil.write_file_if_changed(script_path, script_content):
+            print(f"WebGL 전용 빌드 스크립트 생성 완료: {script_path}")
+        else:
+            print(f"WebGL 빌드 스크립트 변경 없음, 기록 생략: {script_path}")
+        return True
+    except Exception as e:
+        print(f"WebGL 빌드 스크립트 생성 실패: {e}")
+        return False
+
+def render_unity_webgl_build_script(project_path, output_path=None):
+    """WebGL 빌드 Editor 스크립트 내용을 문자열로 생성합니다. (파일은 쓰지 않음)"""
+    if output_path is None:
+        output_path = os.path.join(project_path, config.BUILD_OUTPUT_DIR, "WebGL")
+    
+    output_path_formatted = output_path.replace(os.sep, '/')
+    
+    # WebGL 전용 Player Settings를 자동 설정하고 빌드하는 스크립트 (Unity 6 호환)
+    script_content = f"""using UnityEngine;
+using UnityEditor;
+using UnityEditor.Build;
+using System.IO;
+
+public class AutoWebGLBuildScript
+{{
+    [MenuItem("Build/Auto Build WebGL (Player Settings)")]
+    public static void BuildWebGLWithPlayerSettings()
+    {{
+        Debug.Log("=== WebGL Player Settings 자동 설정 및 빌드 시작 ===");
+        
+        // WebGL Player Settings 자동 설정
+        ConfigureWebGLPlayerSettings();
+        
+        // 설정된 Player Settings 정보 출력
+        LogCurrentPlayerSettings();
+        
+        // 빌드 출력 경로 설정 (명령행 -buildOutput 우선, Product Name 기반)
+        string buildPath = GetCommandLineBuildOutput(@"{output_path_formatted}");
+        
+        // Product Name이 설정되어 있다면 경로에 반영
+        if (!string.IsNullOrEmpty(PlayerSettings.productName))
+        {{
+            string safeName = PlayerSettings.productName.Replace(" ", "_");
+            // 특수문자 제거
+            safeName = System.Text.RegularExpressions.Regex.Replace(safeName, @"[^\\w\\-_]", "");
+            buildPath = Path.Combine(Path.GetDirectoryName(buildPath), safeName);
+        }}
+        
+        // 출력 디렉토리 생성
+        if (!Directory.Exists(buildPath))
+        {{
+            Directory.CreateDirectory(buildPath);
+            Debug.Log($"빌드 출력 디렉토리 생성: {{buildPath}}");
+        }}
+        
+        // 빌드할 씬들 가져오기 (Build Settings에서 활성화된 씬만)
+        string[] scenes = GetBuildScenes();
+        if (scenes.Length == 0)
+        {{
+            Debug.LogError("빌드할 씬이 없습니다. Build Settings에서 씬을 추가하세요.");
+            return;
+        }}
+        
+        // WebGL 빌드 옵션 설정 (Player Settings 완전 반영)
+        BuildPlayerOptions buildPlayerOptions = new BuildPlayerOptions();
+        buildPlayerOptions.scenes = scenes;
+        buildPlayerOptions.locationPathName = buildPath;
+        buildPlayerOptions.target = BuildTarget.WebGL;
+        
+        // 빌드 옵션을 Player Settings에 따라 설정
+        buildPlayerOptions.options = GetBuildOptionsFromPlayerSettings();
+        
+        // WebGL 특수 설정 적용
+        ApplyWebGLSettings();
+        
+        Debug.Log($"🌐 WebGL 빌드 시작");
+        Debug.Log($"📁 빌드 경로: {{buildPlayerOptions.locationPathName}}");
+        Debug.Log($"🎮 제품명: {{PlayerSettings.productName}}");
+        Debug.Log($"🏢 회사명: {{PlayerSettings.companyName}}");
+        Debug.Log($"📋 버전: {{PlayerSettings.bundleVersion}}");
+        
+        // WebGL 빌드 실행
+        var report = BuildPipeline.BuildPlayer(buildPlayerOptions);
+        ExportBuildReport(report, buildPath);
+        
+        // 빌드 결과 확인
+        if (report.summary.result == UnityEditor.Build.Reporting.BuildResult.Succeeded)
+        {{
+            Debug.Log($"✅ WebGL 빌드 성공!");
+            Debug.Log($"📦 빌드 크기: {{FormatBytes(report.summary.totalSize)}}");
+            Debug.Log($"⏱️ 빌드 시간: {{report.summary.totalTime}}");
+            Debug.Log($"📁 빌드 경로: {{buildPath}}");
+            Debug.Log($"🌐 WebGL 빌드 완료!");
+        }}
+        else
+        {{
+            Debug.LogError($"❌ WebGL 빌드 실패: {{report.summary.result}}");
+            if (report.summary.totalErrors > 0)
+            {{
+                Debug.LogError($"에러 수: {{report.summary.totalErrors}}");
+            }}
+            if (report.summary.totalWarnings > 0)
+            {{
+                Debug.LogWarning($"경고 수: {{report.summary.totalWarnings}}");
+            }}
+        }}
+        
+        Debug.Log("=== WebGL Player Settings 반영 빌드 완료 ===");
+    }}
+    
+    private static string GetCommandLineBuildOutput(string defaultPath)
+    {{
+        // 패키지에 포함된 스크립트는 프로젝트별 경로를 모르므로 명령행 인수로 전달받음
+        string[] args = System.Environment.GetCommandLineArgs();
+        for (int i = 0; i < args.Length - 1; i++)
+        {{
+            if (args[i] == "-buildOutput")
+            {{
+                return args[i + 1];
+            }}
+        }}
+        return defaultPath;
+    }}
+    
+    private static void ConfigureWebGLPlayerSettings()
+    {{
+        Debug.Log("🔧 WebGL Player Settings 이미지 기반 고정 설정 적용 중...");
+        
+        // 기본 제품 정보 설정 (비어있는 경우에만)
+        if (string.IsNullOrEmpty(PlayerSettings.productName))
+        {{
+            PlayerSettings.productName = "Science Experiment Simulation";
+            Debug.Log("✅ 제품명 설정: Science Experiment Simulation");
+        }}
+        
+        if (string.IsNullOrEmpty(PlayerSettings.companyName))
+        {{
+            PlayerSettings.companyName = "Educational Software";
+            Debug.Log("✅ 회사명 설정: Educational Software");
+        }}
+        
+        if (string.IsNullOrEmpty(PlayerSettings.bundleVersion))
+        {{
+            PlayerSettings.bundleVersion = "1.0.0";
+            Debug.Log("✅ 버전 설정: 1.0.0");
+        }}
+        
+        // === 이미지 기반 고정 설정 적용 ===
+        
+        // Resolution and Presentation 설정 (이미지 기반)
+        PlayerSettings.defaultWebScreenWidth = 1655;
+        PlayerSettings.defaultWebScreenHeight = 892;
+        PlayerSettings.runInBackground = true;
+        Debug.Log("✅ 해상도 설정: 1655x892, Run In Background 활성화");
+        
+        // WebGL Template 설정 (이미지 기반: Minimal)
+        PlayerSettings.WebGL.template = "APPLICATION:Minimal";
+        Debug.Log("✅ WebGL 템플릿 설정: Minimal");
+        
+        // Publishing Settings (이미지 기반)
+        PlayerSettings.WebGL.compressionFormat = WebGLCompressionFormat.Disabled;
+        PlayerSettings.WebGL.nameFilesAsHashes = true;
+        PlayerSettings.WebGL.dataCaching = true;
+        // Unity 6에서 debugSymbols -> debugSymbolMode로 변경
+        PlayerSettings.WebGL.debugSymbolMode = WebGLDebugSymbolMode.Off;
+        PlayerSettings.WebGL.showDiagnostics = false;
+        PlayerSettings.WebGL.decompressionFallback = false;
+        Debug.Log("✅ Publishing Settings: 압축 비활성화, 파일명 해시화, 데이터 캐싱 활성화");
+        
+        // WebAssembly Language Features (이미지 기반)
+        PlayerSettings.WebGL.exceptionSupport = WebGLExceptionSupport.ExplicitlyThrownExceptionsOnly;
+        PlayerSettings.WebGL.threadsSupport = false;
+        // Unity 6에서 wasmStreaming 제거됨 (decompressionFallback에 따라 자동 결정)
+        Debug.Log("✅ WebAssembly 설정: 명시적 예외만, 멀티스레딩 비활성화, 스트리밍 자동");
+        
+        // Memory Settings (이미지 기반)
+        PlayerSettings.WebGL.memorySize = 32;  // Initial Memory Size
+        PlayerSettings.WebGL.memoryGrowthMode = WebGLMemoryGrowthMode.Geometric;
+        PlayerSettings.WebGL.maximumMemorySize = 2048;
+        Debug.Log("✅ 메모리 설정: 초기 32MB, 최대 2048MB, Geometric 증가");
+        
+        // Splash Screen 설정 (이미지 기반)
+        PlayerSettings.SplashScreen.show = true;
+        PlayerSettings.SplashScreen.showUnityLogo = false;
+        PlayerSettings.SplashScreen.animationMode = PlayerSettings.SplashScreen.AnimationMode.Dolly;
+        // Unity 6에서 logoAnimationMode 제거됨
+        PlayerSettings.SplashScreen.overlayOpacity = 0.0f;
+        PlayerSettings.SplashScreen.blurBackgroundImage = true;
+        Debug.Log("✅ 스플래시 화면: Unity 로고 숨김, Dolly 애니메이션, 오버레이 투명");
+        
+        // WebGL 링커 타겟 설정 (Unity 6 최적화)
+        PlayerSettings.WebGL.linkerTarget = WebGLLinkerTarget.Wasm;
+        Debug.Log("✅ WebGL 링커 타겟 설정: WebAssembly (Unity 6 최적화)");
+        
+        Debug.Log("🔧 WebGL Player Settings 이미지 기반 고정 설정 완료");
+    }}
+    
+    private static void LogCurrentPlayerSettings()
+    {{
+        Debug.Log("=== 현재 WebGL Player Settings ===");
+        Debug.Log($"🎮 제품명: {{PlayerSettings.productName}}");
+        Debug.Log($"🏢 회사명: {{PlayerSettings.companyName}}");
+        Debug.Log($"📋 버전: {{PlayerSettings.bundleVersion}}");
+        
+        // Unity 6 호환성: 아이콘 API 확인 (Unity 버전에 따라 다름)
+        try
+        {{
+            // Unity 6에서는 NamedBuildTarget과 IconKind 사용
+            var icons = PlayerSettings.GetIcons(NamedBuildTarget.WebGL, IconKind.Application);
+            Debug.Log($"🖼️ 기본 아이콘: {{(icons != null && icons.Length > 0 ? "설정됨" : "없음")}}");
+        }}
+        catch
+        {{
+            Debug.Log($"🖼️ 기본 아이콘: 확인 불가 (Unity 버전 호환성 문제)");
+        }}
+        
+        // WebGL 전용 설정들
+        Debug.Log($"🌐 WebGL 템플릿: {{PlayerSettings.WebGL.template}}");
+        Debug.Log($"💾 WebGL 메모리 크기: {{PlayerSettings.WebGL.memorySize}}MB");
+        Debug.Log($"📦 WebGL 압축 포맷: {{PlayerSettings.WebGL.compressionFormat}}");
+        Debug.Log($"⚠️ WebGL 예외 지원: {{PlayerSettings.WebGL.exceptionSupport}}");
+        Debug.Log($"💽 WebGL 데이터 캐싱: {{PlayerSettings.WebGL.dataCaching}}");
+        Debug.Log($"🔧 WebGL 링커 타겟: {{PlayerSettings.WebGL.linkerTarget}}");
+        Debug.Log($"🎯 WebGL 최적화: Unity 6에서 자동 관리");
+        Debug.Log("=====================================");
+    }}
+    
+    private static BuildOptions GetBuildOptionsFromPlayerSettings()
+    {{
+        BuildOptions options = BuildOptions.None;
+        
+        // Development Build 설정 확인
+        if (EditorUserBuildSettings.development)
+        {{
+            options |= BuildOptions.Development;
+            Debug.Log("✅ Development Build 모드 활성화");
+        }}
+        
+        // Script Debugging 설정 확인
+        if (EditorUserBuildSettings.allowDebugging)
+        {{
+            options |= BuildOptions.AllowDebugging;
+            Debug.Log("✅ Script Debugging 활성화");
+        }}
+        
+        // Profiler 설정 확인
+        if (EditorUserBuildSettings.connectProfiler)
+        {{
+            options |= BuildOptions.ConnectWithProfiler;
+            Debug.Log("✅ Profiler 연결 활성화");
+        }}
+        
+        // Deep Profiling 설정 확인
+        if (EditorUserBuildSettings.buildWithDeepProfilingSupport)
+        {{
+            options |= BuildOptions.EnableDeepProfilingSupport;
+            Debug.Log("✅ Deep Profiling 지원 활성화");
+        }}
+        
+        // Unity 6에서 autoRunPlayer 제거됨
+        // WebGL은 브라우저에서 실행되므로 AutoRunPlayer 옵션 불필요
+        Debug.Log("ℹ️ WebGL 빌드는 브라우저에서 수동 실행");
+        
+        return options;
+    }}
+    
+    private static void ApplyWebGLSettings()
+    {{
+        Debug.Log("🌐 WebGL 특수 설정 적용 및 검증 중...");
+        
+        Debug.Log($"🌐 WebGL 템플릿 사용: {{PlayerSettings.WebGL.template}}");
+        Debug.Log($"💾 WebGL 메모리 크기: {{PlayerSettings.WebGL.memorySize}}MB");
+        Debug.Log($"📦 WebGL 압축 포맷: {{PlayerSettings.WebGL.compressionFormat}}");
+        Debug.Log($"⚠️ WebGL 예외 지원: {{PlayerSettings.WebGL.exceptionSupport}}");
+        Debug.Log($"💽 WebGL 데이터 캐싱: {{PlayerSettings.WebGL.dataCaching}}");
+        
+        // WebGL 최적화 설정 확인 및 권장사항
+        if (PlayerSettings.WebGL.memorySize < 256)
+        {{
+            Debug.LogWarning("⚠️ WebGL 메모리 크기가 256MB 미만입니다. 과학실험 시뮬레이션에는 512MB 이상 권장합니다.");
+        }}
+        else if (PlayerSettings.WebGL.memorySize >= 512)
+        {{
+            Debug.Log("✅ WebGL 메모리 크기가 적절합니다 (512MB 이상).");
+        }}
+        
+        if (string.IsNullOrEmpty(PlayerSettings.WebGL.template) || PlayerSettings.WebGL.template == "APPLICATION:Default")
+        {{
+            Debug.LogWarning("⚠️ WebGL 템플릿이 기본값입니다. 교육용 템플릿 사용을 권장합니다.");
+        }}
+        else
+        {{
+            Debug.Log($"✅ WebGL 템플릿 설정됨: {{PlayerSettings.WebGL.template}}");
+        }}
+        
+        // WebGL 압축 설정 확인
+        if (PlayerSettings.WebGL.compressionFormat == WebGLCompressionFormat.Disabled)
+        {{
+            Debug.LogWarning("⚠️ WebGL 압축이 비활성화되어 있습니다. 파일 크기가 클 수 있습니다.");
+        }}
+        else
+        {{
+            Debug.Log($"✅ WebGL 압축 활성화: {{PlayerSettings.WebGL.compressionFormat}}");
+        }}
+        
+        // 과학실험 시뮬레이션에 최적화된 설정 권장사항
+        Debug.Log("📚 과학실험 시뮬레이션 최적화 권장사항:");
+        Debug.Log("  - 메모리: 512MB 이상");
+        Debug.Log("  - 압축: Gzip 또는 Brotli");
+        Debug.Log("  - 예외 지원: ExplicitlyThrownExceptionsOnly");
+        Debug.Log("  - 데이터 캐싱: 활성화");
+    }}
+    
+    private static string[] GetBuildScenes()
+    {{
+        // Build Settings에서 활성화된 씬들만 가져오기
+        var enabledScenes = new System.Collections.Generic.List<string>();
+        
+        foreach (var scene in EditorBuildSettings.scenes)
+        {{
+            if (scene.enabled)
+            {{
+                enabledScenes.Add(scene.path);
+            }}
+        }}
+        
+        Debug.Log($"📋 빌드할 씬 수: {{enabledScenes.Count}}");
+        foreach (var scene in enabledScenes)
+        {{
+            Debug.Log($"  - {{scene}}");
+        }}
+        
+        return enabledScenes.ToArray();
+    }}
+    
+    [System.Serializable]
+    private class BuildStepExport
+    {{
+        public string name;
+        public int depth;
+        public double seconds;
+    }}
+    
+    [System.Serializable]
+    private class PackedAssetExport
+    {{
+        public string path;
+        public string type;
+        public long size;
+    }}
+    
+    [System.Serializable]
+    private class BuildFileExport
+    {{
+        public string path;
+        public string role;
+        public long size;
+    }}
+    
+    [System.Serializable]
+    private class BuildReportExport
+    {{
+        public string guid;
+        public string productName;
+        public string unityVersion;
+        public string result;
+        public string buildStartedAt;
+        public double totalSeconds;
+        public long totalSize;
+        public int totalErrors;
+        public int totalWarnings;
+        public BuildStepExport[] steps;
+        public PackedAssetExport[] packedAssets;
+        public BuildFileExport[] files;
+    }}
+    
+    private static void ExportBuildReport(UnityEditor.Build.Reporting.BuildReport report, string buildPath)
+    {{
+        // 빌드 단계 시간, 에셋별 크기, 출력 파일을 JSON으로 저장 (툴킷이 실행 기록 DB에 수집)
+        try
+        {{
+            var export = new BuildReportExport();
+            export.guid = report.summary.guid.ToString();
+            export.productName = PlayerSettings.productName;
+            export.unityVersion = Application.unityVersion;
+            export.result = report.summary.result.ToString();
+            export.buildStartedAt = report.summary.buildStartedAt.ToUniversalTime().ToString("o");
+            export.totalSeconds = report.summary.totalTime.TotalSeconds;
+            export.totalSize = (long)report.summary.totalSize;
+            export.totalErrors = report.summary.totalErrors;
+            export.totalWarnings = report.summary.totalWarnings;
+            
+            var steps = new System.Collections.Generic.List<BuildStepExport>();
+            foreach (var step in report.steps)
+            {{
+                steps.Add(new BuildStepExport {{ name = step.name, depth = step.depth, seconds = step.duration.TotalSeconds }});
+            }}
+            export.steps = steps.ToArray();
+            
+            // 같은 에셋이 여러 묶음에 나뉘어 들어갈 수 있으므로 경로별로 합산 후 큰 순서로 상위 항목만 기록
+            var assetsByPath = new System.Collections.Generic.Dictionary<string, PackedAssetExport>();
+            foreach (var packed in report.packedAssets)
+            {{
+                foreach (var info in packed.contents)
+                {{
+                    string path = string.IsNullOrEmpty(info.sourceAssetPath) ? "(built-in)" : info.sourceAssetPath;
+                    PackedAssetExport entry;
+                    if (!assetsByPath.TryGetValue(path, out entry))
+                    {{
+                        entry = new PackedAssetExport {{ path = path, type = info.type != null ? info.type.Name : "" }};
+                        assetsByPath[path] = entry;
+                    }}
+                    entry.size += (long)info.packedSize;
+                }}
+            }}
+            var assets = new System.Collections.Generic.List<PackedAssetExport>(assetsByPath.Values);
+            assets.Sort((a, b) => b.size.CompareTo(a.size));
+            if (assets.Count > {config.BUILD_REPORT_MAX_ASSETS})
+            {{
+                assets.RemoveRange({config.BUILD_REPORT_MAX_ASSETS}, assets.Count - {config.BUILD_REPORT_MAX_ASSETS});
+            }}
+            export.packedAssets = assets.ToArray();
+            
+            var files = new System.Collections.Generic.List<BuildFileExport>();
+#if UNITY_2022_1_OR_NEWER
+            var buildFiles = report.GetFiles();
+#else
+            var buildFiles = report.files;
+#endif
+            foreach (var file in buildFiles)
+            {{
+                files.Add(new BuildFileExport {{ path = file.path.Replace('\\\\', '/'), role = file.role, size = (long)file.size }});
+            }}
+            export.files = files.ToArray();
+            
+            string reportPath = Path.Combine(Path.GetDirectoryName(buildPath), "{config.BUILD_REPORT_FILENAME}");
+            File.WriteAllText(reportPath, JsonUtility.ToJson(export));
+            Debug.Log($"📊 빌드 리포트 저장: {{reportPath}}");
+        }}
+        catch (System.Exception e)
+        {{
+            Debug.LogWarning($"빌드 리포트 저장 실패: {{e.Message}}");
+        }}
+    }}
+    
+    private static string FormatBytes(ulong bytes)
+    {{
+        string[] sizes = {{ "B", "KB", "MB", "GB", "TB" }};
+        double len = bytes;
+        int order = 0;
+        while (len >= 1024 && order < sizes.Length - 1)
+        {{
+            order++;
+            len = len / 1024;
+        }}
+        return $"{{len:0.##}} {{sizes[order]}}";
+    }}
+}}
+"""
+    return script_content
+
+def run_unity_webgl_build(project_path, timeout=config.BUILD_TIMEOUT):
+    """Unity CLI를 사용하여 WebGL 빌드를 실행합니다. (Player Settings 완전 반영)"""
+    unity.unity_run_results.pop(project_path, None)
+    unity_path = config.UNITY_EDITOR_PATH
+    
+    # Unity 경로가 존재하지 않으면 자동 검색
+    if not os.path.exists(unity_path):
+        print(f"Unity 경로를 찾을 수 없습니다: {unity_path}")
+        print("Unity 경로 자동 검색 중...")
+        unity_path = unity.find_unity_editor_path()
+        if not unity_path:
+            print("Unity Editor를 찾을 수 없습니다. UNITY_EDITOR_PATH를 확인해주세요.")
+            return False
+        print(f"Unity 경로 발견: {unity_path}")
+    
+    project_name = fileutil.get_project_name_from_path(project_path)
+    
+    print(f"🌐 Unity WebGL Player Settings 반영 빌드 시작: {project_name}")
+    
+    # WebGL 전용 빌드 스크립트 생성
+    if not create_unity_webgl_build_script(project_path):
+        return False
+    
+    # Unity가 기존 출력 파일을 덮어써도 저장소 객체가 바뀌지 않도록 하드링크 분리
+    artifact_store.detach_artifact_links(os.path.join(project_path, config.BUILD_OUTPUT_DIR))
+    
+    # Unity CLI 명령어 구성
+    cmd = [
+        unity_path,
+        "-batchmode",
+        "-quit", 
+        "-projectPath", project_path,
+        "-buildTarget", "WebGL",
+        "-executeMethod", get_editor_script_method(project_path, "AutoWebGLBuildScript.BuildWebGLWithPlayerSettings"),
+        "-buildOutput", os.path.join(project_path, config.BUILD_OUTPUT_DIR, "WebGL"),
+        "-logFile", "-"
+    ]
+    
+    try:
+        print(f"🌐 Unity WebGL 빌드 실행 중... (타임아웃: {timeout}초)")
+        print(f"명령어: {' '.join(cmd)}")
+        
+        result = unity.run_unity_process(
+            cmd,
+            timeout=timeout,
+            inactivity_timeout=config.BUILD_INACTIVITY_TIMEOUT
+        )
+        unity.unity_run_results[project_path] = result
+        
+        # 로그 출력 (stderr는 stdout에 합쳐서 수집, 정상 종료했으면 debug 레벨로만 출력)
+        if result.output:
+            level = "debug" if result.status == "exited" and result.returncode == 0 else "info"
+            logs.log_emit(level, "=== Unity WebGL 빌드 로그 ===\n" + result.output.rstrip("\n"))
+        
+        if result.status == "timeout":
+            print(f"❌ Unity WebGL 빌드 타임아웃: {project_name} ({timeout}초 초과, 프로세스 트리 종료)")
+            return False
+        if result.status == "stalled":
+            print(f"❌ Unity WebGL 빌드 멈춤 감지: {project_name} ({config.BUILD_INACTIVITY_TIMEOUT}초 동안 로그 없음, 프로세스 트리 종료)")
+            return False
+        if result.status == "cancelled":
+            print(f"⛔ Unity WebGL 빌드 취소됨: {project_name}")
+            return False
+        
+        # 빌드 스크립트가 남긴 BuildReport 요약 수집 (실패한 빌드도 단계 시간은 유효)
+        run_history.ingest_build_report(project_path)
+        
+        if result.returncode == 0:
+            print(f"✅ Unity WebGL 빌드 성공: {project_name}")
+            schedule.record_build_duration(project_path, result.duration)
+            return True
+        else:
+            print(f"❌ Unity WebGL 빌드 실패: {project_name} (종료 코드: {result.returncode})")
+            return False
+            
+    except Exception as e:
+        print(f"❌ Unity WebGL 빌드 예외: {project_name} - {e}")
+        return False
+
+@tracing.traced("stage")
+def build_multiple_webgl_projects(project_dirs, parallel=False, max_workers=2, force=False):
+    """여러 Unity 프로젝트를 WebGL로 빌드합니다. (입력이 바뀌지 않은 프로젝트는 빌드 캐시에서 복원)"""
+    print(f"\n=== Unity WebGL 다중 프로젝트 빌드 시작 ===")
+    
+    if parallel:
+        return build_multiple_webgl_projects_parallel(project_dirs, max_workers, force)
+    else:
+        return build_multiple_webgl_projects_sequential(project_dirs, force)
+
+def build_multiple_webgl_projects_sequential(project_dirs, force=False):
+    """여러 Unity 프로젝트를 WebGL로 순차적으로 빌드합니다."""
+    success_count = 0
+    fail_count = 0
+    results = []
+    failed_project_dirs = []
+    
+    estimates = schedule.estimate_build_durations([d for d in project_dirs if os.path.exists(d)])
+    schedule.print_build_eta(sum(estimates.values()))
+    
+    for project_dir in project_dirs:
+        if not os.path.exists(project_dir):
+            print(f"❌ 프로젝트 경로가 존재하지 않습니다: {project_dir}")
+            fail_count += 1
+            results.append((fileutil.get_project_name_from_path(project_dir), False))
+            continue
+        
+        project_name = fileutil.get_project_name_from_path(project_dir)
+        print(f"\n--- {project_name} WebGL 빌드 시작 ---")
+        
+        if build_cache.build_webgl_project_cached(project_dir, force):
+            success_count += 1
+            results.append((project_name, True))
+        else:
+            fail_count += 1
+            failed_project_dirs.append(project_dir)
+            results.append((project_name, False))
+    
+    # 일시적 실패는 마지막에 백오프 후 재시도
+    recovered = unity.retry_transient_unity_failures(
+        failed_project_dirs, lambda project_dir: build_cache.build_webgl_project_cached(project_dir, force), "WebGL 빌드"
+    )
+    if recovered:
+        results = unity.apply_retry_results(results, recovered)
+        success_count = sum(1 for _, ok in results if ok)
+        fail_count = len(results) - success_count
+    
+    logs.log_summary(f"\n=== WebGL 순차 빌드 결과 ===")
+    logs.log_summary(f"성공: {success_count}개")
+    logs.log_summary(f"실패: {fail_count}개")
+    logs.log_summary(f"총 빌드: {success_count + fail_count}개")
+    
+    return results
+
+def build_multiple_webgl_projects_parallel(project_dirs, max_workers=2, force=False):
+    """여러 Unity 프로젝트를 WebGL로 병렬로 빌드합니다."""
+    print(f"🌐 WebGL 병렬 빌드 시작 (최대 {max_workers}개 동시 실행)")
+    
+    success_count = 0
+    fail_count = 0
+    results = []
+    failed_project_dirs = []
+    
+    # 과거 빌드 시간 기준으로 오래 걸리는 프로젝트부터 제출 (LPT 스케줄링)
+    existing_dirs = [d for d in project_dirs if os.path.exists(d)]
+    estimates = schedule.estimate_build_durations(existing_dirs)
+    ordered_dirs = schedule.order_longest_first(existing_dirs, estimates)
+    print("📅 빌드 순서: 예상 빌드 시간이 긴 프로젝트부터 실행")
+    schedule.print_build_eta(schedule.predict_makespan([estimates[d] for d in ordered_dirs], max_workers))
+    
+    started_at = {}
+    completed = set()
+    
+    def build_job(project_dir):
+        started_at[project_dir] = time.time()
+        return build_cache.build_webgl_project_cached(project_dir, force)
+    
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="build-worker") as executor:
+        # 모든 프로젝트를 병렬로 제출 (제출 순서 = 실행 순서)
+        future_to_project = {
+            executor.submit(build_job, project_dir): project_dir 
+            for project_dir in ordered_dirs
+        }
+        
+        # 완료된 작업들을 처리 (Ctrl+C 시 대기 작업 취소)
+        try:
+            for future in as_completed(future_to_project):
+                project_dir = future_to_project[future]
+                project_name = fileutil.get_project_name_from_path(project_dir)
+                completed.add(project_dir)
+                
+                remaining = schedule.estimate_remaining_build_time(estimates, ordered_dirs, started_at, completed, max_workers)
+                print(f"📊 진행: {len(completed)}/{len(ordered_dirs)}, 남은 예상 시간: {fileutil.format_duration(remaining)}")
+                
+                try:
+                    result = future.result()
+                    if result:
+                        success_count += 1
+                        print(f"✅ {project_name} WebGL 병렬 빌드 완료")
+                    else:
+                        fail_count += 1
+                        failed_project_dirs.append(project_dir)
+                        print(f"❌ {project_name} WebGL 병렬 빌드 실패")
+                    results.append((project_name, result))
+                except Exception as e:
+                    fail_count += 1
+                    print(f"❌ {project_name} WebGL 병렬 빌드 예외: {e}")
+                    results.append((project_name, False))
+        except KeyboardInterrupt:
+            unity.cancel_pending_futures(future_to_project)
+            raise
+    
+    # 일시적 실패는 마지막에 백오프 후 재시도
+    recovered = unity.retry_transient_unity_failures(
+        failed_project_dirs, lambda project_dir: build_cache.build_webgl_project_cached(project_dir, force), "WebGL 빌드"
+    )
+    if recovered:
+        results = unity.apply_retry_results(results, recovered)
+        success_count = sum(1 for _, ok in results if ok)
+        fail_count = len(results) - success_count
+    
+    logs.log_summary(f"\n=== WebGL 병렬 빌드 결과 ===")
+    logs.log_summary(f"성공: {success_count}개")
+    logs.log_summary(f"실패: {fail_count}개")
+    logs.log_summary(f"총 빌드: {success_count + fail_count}개")
+    
+    return results
+
+def use_package_editor_scripts(project_path):
+    """이 프로젝트에서 패키지에 포함된 에디터 스크립트를 사용할지 확인합니다.
+
+    패키지 방식이어도 프로젝트 manifest에 패키지가 없으면 프로젝트별 스크립트로 대체합니다.
+    """
+    if config.EDITOR_SCRIPTS_MODE != "package":
+        return False
+    manifest = fileutil.load_json_file(os.path.join(project_path, "Packages", "manifest.json"), {})
+    if config.EDITOR_SCRIPTS_PACKAGE in manifest.get("dependencies", {}):
+        return True
+    print(f"⚠️ {fileutil.get_project_name_from_path(project_path)}: {config.EDITOR_SCRIPTS_PACKAGE} 패키지가 없어 프로젝트별 에디터 스크립트를 생성합니다.")
+    return False
+
+def get_editor_script_method(project_path, method):
+    """-executeMethod에 넘길 메서드 이름을 반환합니다. (패키지 방식이면 네임스페이스 포함)"""
+    if use_package_editor_scripts(project_path):
+        return f"{config.EDITOR_SCRIPTS_NAMESPACE}.{method}"
+    return method
+
+def remove_generated_editor_script(script_path):
+    """패키지 방식으로 바꾼 프로젝트에서 이전에 생성한 프로젝트별 스크립트(.meta 포함)를 삭제합니다."""
+    for path in (script_path, script_path + ".meta"):
+        if os.path.exists(path):
+            os.remove(path)
+            print(f"🧹 프로젝트별 에디터 스크립트 제거 (패키지 스크립트 사용): {path}")
+
+def wrap_editor_script_for_package(script_content):
+    """생성한 C# 스크립트를 패키지 Editor 어셈블리용으로 변환합니다.
+
+    패키지 asmdef는 모든 플랫폼을 포함하므로 UNITY_EDITOR 조건으로 감싸고, 네임스페이스를 붙입니다.
+    프로젝트별 스크립트와 메뉴 경로가 겹치지 않도록 메뉴는 Dannect/ 아래에 둡니다.
+    """
+    usings, _, body = script_content.partition("\npublic class ")
+    body = body.replace('[MenuItem("', '[MenuItem("Dannect/')
+    body = textwrap.indent("public class " + body.rstrip() + "\n", "    ", lambda line: line.strip("\n") != "")
+    return f"#if UNITY_EDITOR\n{usings.strip()}\n\nnamespace {config.EDITOR_SCRIPTS_NAMESPACE}\n{{\n{body}}}\n#endif\n"
+
+def install_package_editor_scripts():
+    """에디터 스크립트를 이 패키지의 Editor/Scripts 폴더(Dannect.Toolkit.Editor 어셈블리)에 기록합니다.
+
+    각 프로젝트는 패키지를 통해 스크립트를 한 번만 받으므로 실행마다 프로젝트 스크립트를 다시 컴파일하지 않습니다.
+    """
+    package_root = os.path.dirname(config.TOOLKIT_DIR)
+    scripts_dir = os.path.join(package_root, "Editor", "Scripts")
+    scripts = {
+        # 출력 경로는 실행 시 -buildOutput으로 전달, 기본값은 프로젝트 기준 상대 경로
+        "AutoWebGLBuildScript.cs": render_unity_webgl_build_script("", f"{config.BUILD_OUTPUT_DIR}/WebGL"),
+        "AutoBatchProcessor.cs": unity.render_unity_batch_script(),
+    }
+    
+    print(f"\n=== 패키지 에디터 스크립트 설치: {scripts_dir} ===")
+    for filename, content in scripts.items():
+        script_path = os.path.join(scripts_dir, filename)
+        if fileutil.write_file_if_changed(script_path, wrap_editor_script_for_package(content)):
+            print(f"✅ {filename} 기록 완료")
+        else:
+            print(f"⚪ {filename} 변경 없음")
+        
+        meta_path = script_path + ".meta"
+        if not os.path.exists(meta_path):
+            with open(meta_path, "w", encoding="utf-8", newline="\n") as f:
+                f.write(f"fileFormatVersion: 2\nguid: {uuid.uuid4().hex}")
+            print(f"✅ {filename}.meta 생성")
+    print(f"💡 EDITOR_SCRIPTS_MODE = \"package\"로 설정하면 프로젝트별 스크립트 대신 이 스크립트를 사용합니다.")
+# endregion
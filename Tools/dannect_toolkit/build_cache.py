@@ -0,0 +1,220 @@
+"""WebGL 빌드 캐시 (입력 fingerprint 기반 결과 재사용)."""
+import os
+import hashlib
+import shutil
+import threading
+import time
+
+from . import build, config, fileutil, journal, locks, run_history, trash
+
+
+# =========================
+# #region WebGL 빌드 캐시 (입력 fingerprint 기반 결과 재사용)
+# =========================
+build_cache_stats = {"hits": 0, "misses": 0, "stored": 0, "restored_bytes": 0}
+_build_cache_lock = threading.Lock()
+
+# 생성되는 빌드 스크립트는 템플릿 해시로 따로 반영하므로 폴더 해시에서 제외
+BUILD_FINGERPRINT_EXCLUDES = {
+    "Assets/Editor/AutoWebGLBuildScript.cs",
+    "Assets/Editor/AutoWebGLBuildScript.cs.meta",
+}
+
+def get_project_build_cache_dir(project_path):
+    """프로젝트별 빌드 캐시 폴더 경로를 반환합니다."""
+    return os.path.join(config.BUILD_CACHE_DIR, fileutil.get_project_name_from_path(project_path))
+
+def get_unity_editor_version(project_path):
+    """ProjectVersion.txt에서 프로젝트의 Unity 에디터 버전을 읽습니다."""
+    version_file = os.path.join(project_path, "ProjectSettings", "ProjectVersion.txt")
+    try:
+        with open(version_file, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("m_EditorVersion:"):
+                    return line.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return ""
+
+def compute_build_fingerprint(project_path):
+    """WebGL 빌드 입력(Assets, Packages, ProjectSettings, 에디터 버전, 빌드 스크립트)의 fingerprint를 계산합니다.
+
+    파일 해시는 (크기, 수정 시간)이 같으면 이전 실행의 값을 재사용하므로
+    변경되지 않은 대형 에셋을 매번 다시 읽지 않습니다.
+    """
+    stat_cache_path = os.path.join(get_project_build_cache_dir(project_path), "file_hashes.json")
+    old_stat_cache = fileutil.load_json_file(stat_cache_path, {})
+    new_stat_cache = {}
+    
+    digest = hashlib.sha256()
+    digest.update(f"editor:{config.UNITY_EDITOR_PATH}|{get_unity_editor_version(project_path)}\n".encode("utf-8"))
+    digest.update(f"target:{config.BUILD_TARGET}\n".encode("utf-8"))
+    template = build.render_unity_webgl_build_script(project_path)
+    digest.update(f"template:{hashlib.sha256(template.encode('utf-8')).hexdigest()}\n".encode("utf-8"))
+    
+    for folder in config.BUILD_FINGERPRINT_DIRS:
+        folder_path = os.path.join(project_path, folder)
+        if not os.path.isdir(folder_path):
+            digest.update(f"missing:{folder}\n".encode("utf-8"))
+            continue
+        
+        for root, dirs, files in os.walk(folder_path):
+            # Unity가 무시하는 숨김 폴더와 '~' 폴더는 제외, 순서는 항상 고정
+            dirs[:] = sorted(d for d in dirs if not d.startswith('.') and not d.endswith('~'))
+            for file in sorted(files):
+                if file.startswith('.'):
+                    continue
+                filepath = os.path.join(root, file)
+                relative_path = os.path.relpath(filepath, project_path).replace(os.sep, '/')
+                if relative_path in BUILD_FINGERPRINT_EXCLUDES:
+                    continue
+                
+                stat = os.stat(filepath)
+                cached = old_stat_cache.get(relative_path)
+                if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+                    file_hash = cached[2]
+                else:
+                    file_hash = fileutil.hash_file(filepath)
+                new_stat_cache[relative_path] = [stat.st_size, stat.st_mtime_ns, file_hash]
+                digest.update(f"{relative_path}\0{file_hash}\n".encode("utf-8"))
+    
+    fileutil.save_json_file(stat_cache_path, new_stat_cache)
+    return digest.hexdigest()
+
+def restore_build_cache(project_path, fingerprint):
+    """fingerprint가 일치하는 캐시 항목이 있으면 빌드 출력물을 복원합니다."""
+    cache_dir = get_project_build_cache_dir(project_path)
+    index = fileutil.load_json_file(os.path.join(cache_dir, "index.json"), {})
+    info = index.get(fingerprint)
+    if not info:
+        return False
+    
+    cached_build_dir = os.path.join(cache_dir, "entries", info["entry"], config.BUILD_OUTPUT_DIR)
+    if not os.path.isdir(cached_build_dir):
+        return False
+    
+    build_dir = os.path.join(project_path, config.BUILD_OUTPUT_DIR)
+    if os.path.exists(build_dir):
+        trash.move_to_trash(build_dir, project_path)
+    shutil.copytree(cached_build_dir, build_dir)
+    
+    with _build_cache_lock:
+        build_cache_stats["restored_bytes"] += info.get("size", 0)
+    return True
+
+def store_build_cache(project_path, fingerprints):
+    """빌드 출력물을 캐시에 저장하고 주어진 fingerprint들을 해당 항목에 연결합니다.
+
+    빌드 중 Unity가 ProjectSettings 등을 다시 저장할 수 있으므로
+    빌드 전/후 fingerprint를 모두 같은 항목에 연결합니다.
+    """
+    build_dir = os.path.join(project_path, config.BUILD_OUTPUT_DIR)
+    if not os.path.isdir(build_dir):
+        return False
+    
+    cache_dir = get_project_build_cache_dir(project_path)
+    entry_id = fingerprints[-1]
+    entry_dir = os.path.join(cache_dir, "entries", entry_id)
+    
+    if not os.path.isdir(entry_dir):
+        tmp_dir = f"{entry_dir}.{os.getpid()}.tmp"
+        if os.path.exists(tmp_dir):
+            shutil.rmtree(tmp_dir)
+        shutil.copytree(build_dir, os.path.join(tmp_dir, config.BUILD_OUTPUT_DIR))
+        os.rename(tmp_dir, entry_dir)
+    
+    index_path = os.path.join(cache_dir, "index.json")
+    index = fileutil.load_json_file(index_path, {})
+    size = fileutil.get_directory_size(entry_dir)
+    for fingerprint in fingerprints:
+        index[fingerprint] = {"entry": entry_id, "stored_at": time.time(), "size": size}
+    
+    # 오래된 캐시 항목 정리 (최근 BUILD_CACHE_MAX_ENTRIES개만 유지)
+    latest_by_entry = {}
+    for info in index.values():
+        latest_by_entry[info["entry"]] = max(latest_by_entry.get(info["entry"], 0), info["stored_at"])
+    keep_entries = set(sorted(latest_by_entry, key=latest_by_entry.get, reverse=True)[:config.BUILD_CACHE_MAX_ENTRIES])
+    for old_entry in set(latest_by_entry) - keep_entries:
+        shutil.rmtree(os.path.join(cache_dir, "entries", old_entry), ignore_errors=True)
+    index = {fp: info for fp, info in index.items() if info["entry"] in keep_entries}
+    
+    fileutil.save_json_file(index_path, index)
+    return True
+
+@locks.leased("unity")
+@journal.journaled("build", skipped=True, succeeded=bool, forced=lambda force=False: force)
+def build_webgl_project_cached(project_path, force=False):
+    """빌드 입력이 바뀌지 않았으면 캐시에서 결과를 복원하고, 바뀐 경우에만 Unity WebGL 빌드를 실행합니다."""
+    with run_history.record_stage(project_path, "build") as stage:
+        success = _build_webgl_project_cached(project_path, force, stage)
+        if stage["outcome"] == "success" and not success:
+            stage["outcome"] = "failed"
+        if success:
+            build_dir = os.path.join(project_path, config.BUILD_OUTPUT_DIR)
+            stage["build_size"] = fileutil.get_directory_size(build_dir) if os.path.isdir(build_dir) else 0
+    return success
+
+def _build_webgl_project_cached(project_path, force, stage):
+    """build_webgl_project_cached의 본문입니다. 캐시 적중 여부를 stage 기록에 남깁니다."""
+    project_name = fileutil.get_project_name_from_path(project_path)
+    
+    if not config.BUILD_CACHE_ENABLED:
+        success = build.run_unity_webgl_build(project_path)
+        run_history.record_unity_result_metrics(project_path, stage)
+        return success
+    
+    try:
+        fingerprint = compute_build_fingerprint(project_path)
+    except Exception as e:
+        print(f"⚠️ {project_name} 빌드 fingerprint 계산 실패, 캐시 없이 빌드합니다: {e}")
+        success = build.run_unity_webgl_build(project_path)
+        run_history.record_unity_result_metrics(project_path, stage)
+        return success
+    
+    if not force:
+        try:
+            if restore_build_cache(project_path, fingerprint):
+                with _build_cache_lock:
+                    build_cache_stats["hits"] += 1
+                stage["outcome"] = "cache_hit"
+                print(f"♻️ {project_name} 빌드 입력 변경 없음, 캐시된 빌드 결과 복원 ({fingerprint[:12]})")
+                return True
+        except Exception as e:
+            print(f"⚠️ {project_name} 빌드 캐시 복원 실패, 다시 빌드합니다: {e}")
+    
+    with _build_cache_lock:
+        build_cache_stats["misses"] += 1
+    
+    success = build.run_unity_webgl_build(project_path)
+    run_history.record_unity_result_metrics(project_path, stage)
+    if not success:
+        return False
+    
+    try:
+        fingerprints = [fingerprint]
+        post_build_fingerprint = compute_build_fingerprint(project_path)
+        if post_build_fingerprint != fingerprint:
+            fingerprints.append(post_build_fingerprint)
+        if store_build_cache(project_path, fingerprints):
+            with _build_cache_lock:
+                build_cache_stats["stored"] += 1
+            print(f"💾 {project_name} 빌드 결과 캐시 저장 ({fingerprints[-1][:12]})")
+    except Exception as e:
+        print(f"⚠️ {project_name} 빌드 캐시 저장 실패: {e}")
+    
+    return True
+
+def print_build_cache_stats():
+    """빌드 캐시 적중 통계를 출력합니다."""
+    hits = build_cache_stats["hits"]
+    misses = build_cache_stats["misses"]
+    total = hits + misses
+    if total == 0:
+        return
+    
+    print(f"\n=== 빌드 캐시 통계 ===")
+    print(f"♻️ 캐시 적중: {hits}개 (적중률 {hits / total * 100:.1f}%)")
+    print(f"🔨 실제 빌드: {misses}개")
+    print(f"💾 새로 저장: {build_cache_stats['stored']}개")
+    print(f"📦 복원 용량: {fileutil.format_bytes(build_cache_stats['restored_bytes'])}")
+# endregion
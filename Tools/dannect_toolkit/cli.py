@@ -0,0 +1,711 @@
+"""명령행 진입점 (하위 명령과 기존 플래그 방식 실행)."""
+import os
+import sys
+
+from . import config, fileutil, logs
+
+
+# =========================
+# #region 메인 실행부
+# =========================
+def get_option_value(argv, option, default=None):
+    """명령행 인수 목록 argv에서 '--option 값' 형태의 값을 반환합니다."""
+    if option in argv:
+        index = argv.index(option)
+        if index + 1 < len(argv) and not argv[index + 1].startswith("--"):
+            return argv[index + 1]
+    return default
+
+def print_usage():
+    """사용법을 출력합니다."""
+    print("=== Unity 프로젝트 자동화 도구 사용법 ===")
+    print("python dannect.unity.toolkit.py [옵션]")
+    print("python -m dannect_toolkit <명령> [옵션]   (명령: " + ", ".join(COMMANDS) + ", 명령별 도움말: <명령> --help)")
+    print("")
+    print("옵션:")
+    print("  --help           이 도움말을 표시합니다")
+    print("  --skip-git       Git 작업을 건너뜁니다 (UTF-8 변환과 패키지 추가만 실행)")
+    print("  --git-only       Git 작업만 실행합니다 (UTF-8 변환과 패키지 추가 건너뜀)")
+    print("  --unity-batch    Unity 배치 모드로 Editor 스크립트 실행 (40개 프로젝트 자동화)")
+    print("  --full-auto      모든 작업 + Unity 배치 모드 실행 (완전 자동화)")
+    print("  --parallel       Unity 배치 모드를 병렬로 실행 (빠른 처리, 메모리 사용량 증가)")
+    print("  --build-webgl    Unity WebGL 빌드 자동화 (Player Settings 완전 반영)")
+    print("  --build-parallel WebGL 빌드를 병렬로 실행 (2개씩 동시 빌드)")
+    print("  --force          빌드 캐시를 무시하고 모든 프로젝트를 다시 빌드")
+    print("  --clean-builds   모든 빌드 출력물 정리")
+    print("  --fix-unity6     Unity 6 deprecated API 자동 수정 (FindObjectOfType 등)")
+    print("  --check-unity6   Unity 6 호환성 검사 보고서 생성")
+    print("  --history        최근 실행 기록 목록 출력")
+    print("  --history-trend 프로젝트명 [단계]  프로젝트 단계별 소요 시간 추이 출력 (기본 단계: build)")
+    print("  --history-regressions  최근 1주일간 느려진 프로젝트/단계 출력")
+    print("  --ingest-build-reports  각 프로젝트 Builds 폴더의 BuildReport 요약을 실행 기록에 수집")
+    print("  --largest-assets [N]    전체 프로젝트 최근 빌드에서 용량이 큰 에셋 상위 N개 출력")
+    print("  --slowest-steps [N]     전체 프로젝트 최근 빌드에서 오래 걸린 빌드 단계 상위 N개 출력")
+    print("  --trace 파일.json  실행 구간을 Chrome trace-event 형식으로 저장 (Perfetto/chrome://tracing)")
+    print("  --install-editor-scripts  빌드/배치 에디터 스크립트를 패키지 Editor 어셈블리에 기록 (EDITOR_SCRIPTS_MODE=\"package\"용)")
+    print("  --keep-builds N   --clean-builds 시 프로젝트별 최근 빌드 N개를 휴지통에 보관")
+    print("  --trash-report    휴지통 항목과 확보 가능한 용량 출력")
+    print("  --precompress     WebGL 빌드 출력물을 .br/.gz로 사전 압축 (빌드 옵션과 함께 쓰면 빌드 후 실행)")
+    print("  --package         빌드 결과를 배포 번들(전체 + 이전 버전 대비 증분)로 패키징")
+    print("  --package-format zip|tar.zst  배포 번들 형식 (기본: zip)")
+    print("  --payload-check   WebGL 빌드 출력물(해시 파일명)의 원본/gzip 크기를 예산 및 기준과 비교 (빌드 후에는 자동 실행)")
+    print("  --payload-accept  이번 측정값을 프로젝트별 페이로드 기준으로 저장 (의도한 크기 증가 승인)")
+    print("  --payload-strict  페이로드 예산 초과/회귀 시 종료 코드 1로 실패 처리 (기본: 경고만)")
+    print("  --pin-packages    Git 패키지를 커밋 해시로 고정하여 manifest.json과 packages-lock.json에 기록")
+    print("  --no-pin          Git 패키지를 커밋 고정 없이 URL만 기록 (Unity가 열 때마다 원격 HEAD 조회)")
+    print("  --mirror-packages Git 패키지 로컬 bare 미러를 만들거나 갱신 (오프라인에서도 커밋 조회 가능)")
+    print("  --use-mirror      Unity 실행 전 manifest의 Git 패키지를 미러에서 꺼낸 로컬 폴더(file:)로 전환 (빌드 팜용, 커밋하지 않음)")
+    print("  --pipeline        1~7단계를 프로젝트마다 독립적으로 진행 (단계별 전체 대기 없음, CPU/네트워크/Unity 자원별 동시 실행 한도)")
+    print("  --coordinator     Unity 배치/빌드를 직접 실행하지 않고 HTTP로 워커들에게 배정 (--unity-batch/--build-webgl과 함께, --port N)")
+    print("  --worker URL      분산 빌드 워커로 실행 (예: --worker http://빌드서버:8765, --worker-slots N, --worker-name 이름)")
+    print("  --resume          중단된 실행 이어서 진행 (저널에 완료로 기록되고 입력이 같은 프로젝트/단계는 건너뜀)")
+    print("  --wait-locks [초] 다른 실행이 잠근 프로젝트를 기다림 (기본: 건너뜀, 초 생략 시 3600초)")
+    print("  --dedupe          빌드 출력물/빌드 캐시의 동일 파일을 저장소 객체 하나로 공유 (하드링크/reflink)")
+    print("  --artifact-verify 아티팩트 저장소 객체를 다시 해시하여 손상 여부 검사")
+    print("  --artifact-gc     더 이상 사용되지 않는 아티팩트 저장소 객체 삭제")
+    print("  --metrics-file 파일.prom  단계 시간/결과/빌드 크기를 OpenMetrics 텍스트 파일로 기록 (node-exporter 수집용)")
+    print("  --quiet           실행 요약과 오류만 출력")
+    print("  --log-json        출력을 한 줄에 하나씩 JSON 레코드로 기록 (시각, 레벨, 프로젝트, 단계, 메시지)")
+    print("  --log-level 레벨  출력할 최소 레벨 (debug, info, warning, error, 기본: LOG_LEVEL), debug면 파일별 결과도 출력")
+    print("")
+    print("기본 동작:")
+    print("1. C# 파일 UTF-8 변환")
+    print("2. Unity 6 deprecated API 자동 수정")
+    print("3. Unity 패키지 추가 (Git 패키지는 커밋 해시로 고정, packages-lock.json 기록)")
+    print("4. Git 커밋 및 푸시 (계층구조 최하위 브랜치 또는 dev 브랜치)")
+    print("")
+    print("Unity 6 호환성 수정 (--fix-unity6):")
+    print("- FindObjectOfType -> FindFirstObjectByType 자동 교체")
+    print("- FindObjectsOfType -> FindObjectsByType 자동 교체")
+    print("- PlayerSettings.GetIconsForTargetGroup -> PlayerSettings.GetIcons 교체")
+    print("- 기타 Unity 6에서 deprecated된 API들 일괄 수정")
+    print("- 모든 C# 스크립트 파일을 자동으로 스캔하여 수정")
+    print("- 변경 내용 상세 로그 출력")
+    print("")
+    print("Unity 배치 모드 (--unity-batch, --full-auto):")
+    print("- Unity Editor를 배치 모드로 실행하여 Editor 스크립트 자동 실행")
+    print("- PackageAssetCopier 등의 [InitializeOnLoad] 스크립트 실행")
+    print("- 40개 프로젝트를 순차적으로 자동 처리 (기본)")
+    print("- --parallel 옵션으로 병렬 처리 가능 (3개씩 동시 실행)")
+    print("- Unity GUI 없이 백그라운드에서 실행")
+    print("- 프로젝트 잠금, 라이선스, 패키지 캐시 경합 등 일시적 실패는 마지막에 백오프 후 자동 재시도")
+    print("- 컴파일 오류 등 영구 실패는 재시도하지 않음")
+    print("")
+    print("Unity WebGL 빌드 자동화 (--build-webgl):")
+    print("- Unity CLI를 사용하여 WebGL 프로젝트를 자동 빌드")
+    print("- Player Settings 완전 반영 (제품명, 회사명, 버전, WebGL 설정 등)")
+    print("- Build Settings의 활성화된 씬만 빌드")
+    print("- Development Build, Profiler 등 빌드 옵션 자동 적용")
+    print("- WebGL 전용 최적화 설정 적용 (메모리, 압축, 템플릿 등)")
+    print("- 과학실험 시뮬레이션에 최적화된 WebGL 빌드")
+    print("- 빌드 출력: 각 프로젝트의 Builds/WebGL 폴더")
+    print("- --build-parallel로 병렬 빌드 가능 (2개씩 동시 빌드)")
+    print("- 빌드 시간: 프로젝트당 5-15분 (WebGL 최적화 포함)")
+    print("- 빌드 캐시: Assets/Packages/ProjectSettings, 에디터 버전, 빌드 스크립트가 같으면")
+    print("  Unity 실행 없이 이전 빌드 결과를 복원 (--force로 무시)")
+    print("- 페이로드 예산: 빌드 후 해시 파일명 출력물(wasm, data, framework.js 등)의 원본/gzip 크기를")
+    print("  PAYLOAD_BUDGETS 및 프로젝트별 기준과 비교하여 초과/회귀 보고 (--payload-strict로 실패 처리)")
+    print("")
+    print("Git 브랜치 전략:")
+    print("- 브랜치 계층구조에서 가장 깊은(아래) 브랜치를 우선 사용")
+    print("- 커밋 수가 많고 최근에 작업된 브랜치 선택")
+    print("- 적절한 브랜치가 없으면 dev 브랜치 사용/생성")
+    print("=====================================")
+
+def run_unity_batch(project_dirs, parallel=False):
+    """모든 프로젝트에 배치 스크립트를 만들고 Unity 배치 모드를 실행합니다. 모두 성공하면 True를 반환합니다."""
+    from . import unity
+    
+    print(f"총 {len(project_dirs)}개 프로젝트 처리 예정")
+    
+    # 모든 프로젝트에 배치 스크립트 생성
+    print("배치 스크립트 생성 중...")
+    for project_dir in project_dirs:
+        if os.path.exists(project_dir):
+            unity.create_unity_batch_script(project_dir)
+    
+    if parallel:
+        # 병렬 처리
+        print("병렬 처리 모드로 실행합니다...")
+        results = unity.process_multiple_projects_parallel(project_dirs, max_workers=3)
+        return all(success for _, success in results)
+    else:
+        # 순차 처리 (기본)
+        print("순차 처리 모드로 실행합니다...")
+        success_count = 0
+        fail_count = 0
+        failed_project_dirs = []
+        
+        for i, project_dir in enumerate(project_dirs, 1):
+            project_name = fileutil.get_project_name_from_path(project_dir)
+            print(f"\n[{i}/{len(project_dirs)}] {project_name} 처리 중...")
+            
+            if not os.path.exists(project_dir):
+                print(f"프로젝트 폴더 없음: {project_dir}")
+                fail_count += 1
+                continue
+            
+            # Unity 배치 모드 실행
+            if unity.process_unity_project_batch(project_dir):
+                success_count += 1
+                print(f"✅ {project_name} 처리 완료")
+            else:
+                fail_count += 1
+                failed_project_dirs.append(project_dir)
+                print(f"❌ {project_name} 처리 실패")
+        
+        # 일시적 실패는 마지막에 백오프 후 재시도
+        recovered = unity.retry_transient_unity_failures(failed_project_dirs, unity.process_unity_project_batch, "Unity 배치")
+        recovered_count = sum(1 for ok in recovered.values() if ok)
+        success_count += recovered_count
+        fail_count -= recovered_count
+        
+        logs.log_summary(f"\n=== Unity 배치 모드 결과 ===")
+        logs.log_summary(f"성공: {success_count}개")
+        logs.log_summary(f"실패: {fail_count}개")
+        logs.log_summary(f"총 처리: {success_count + fail_count}개")
+        return fail_count == 0
+
+def run_webgl_builds(project_dirs, parallel=False, force=False):
+    """WebGL 빌드를 실행하고 결과 요약을 출력합니다. [(프로젝트명, 성공 여부)]를 반환합니다."""
+    from . import build, build_cache
+    
+    print(f"🌐 빌드 타겟: WebGL")
+    print(f"📊 총 {len(project_dirs)}개 프로젝트 빌드 예정")
+    print("🎯 WebGL Player Settings 완전 반영 빌드 모드")
+    print("📚 과학실험 시뮬레이션 최적화 적용")
+    
+    # WebGL 빌드 실행
+    build_results = build.build_multiple_webgl_projects(
+        project_dirs, 
+        parallel=parallel,
+        max_workers=2 if parallel else 1,
+        force=force
+    )
+    
+    # 빌드 결과 요약
+    success_builds = sum(1 for _, success in build_results if success)
+    fail_builds = len(build_results) - success_builds
+    
+    logs.log_summary(f"\n=== 최종 WebGL 빌드 결과 ===")
+    logs.log_summary(f"✅ 성공: {success_builds}개")
+    logs.log_summary(f"❌ 실패: {fail_builds}개")
+    logs.log_summary(f"📊 총 빌드: {len(build_results)}개")
+    
+    if success_builds > 0:
+        logs.log_summary(f"\n🌐 WebGL 빌드 완료된 프로젝트들:")
+        for project_name, success in build_results:
+            if success:
+                logs.log_summary(f"  - {project_name}")
+    
+    if fail_builds > 0:
+        logs.log_summary(f"\n❌ WebGL 빌드 실패한 프로젝트들:")
+        for project_name, success in build_results:
+            if not success:
+                logs.log_summary(f"  - {project_name}")
+    
+    build_cache.print_build_cache_stats()
+    return build_results
+
+def run_flags(argv):
+    """기존 플래그 방식(--full-auto, --build-webgl 등)으로 전체 작업을 실행합니다. (argv: 프로그램 이름을 뺀 인수 목록)"""
+    from . import (
+        artifact_store, build, build_cache, distributed, gitops, journal, locks, manifests,
+        metrics_export, mirror, packaging, payload_budget, precompression, run_history, sources, stage_pipeline,
+        tracing, trash,
+    )
+    
+    # 도움말 요청 확인
+    if "--help" in argv or "-h" in argv:
+        print_usage()
+        return
+    
+    print("=== Unity 프로젝트 자동화 도구 시작 ===\n")
+    
+    # 명령행 인수 확인
+    skip_git = "--skip-git" in argv
+    git_only = "--git-only" in argv
+    unity_batch = "--unity-batch" in argv
+    full_auto = "--full-auto" in argv
+    parallel = "--parallel" in argv
+    build_webgl = "--build-webgl" in argv
+    build_parallel = "--build-parallel" in argv
+    clean_builds = "--clean-builds" in argv
+    fix_unity6 = "--fix-unity6" in argv
+    check_unity6 = "--check-unity6" in argv
+    force_build = "--force" in argv
+    precompress = "--precompress" in argv
+    dedupe = "--dedupe" in argv
+    package = "--package" in argv
+    package_format = get_option_value(argv, "--package-format", config.PACKAGE_FORMAT)
+    payload_check = "--payload-check" in argv
+    payload_accept = "--payload-accept" in argv
+    payload_strict = "--payload-strict" in argv or config.PAYLOAD_ON_VIOLATION == "fail"
+    payload_violations = {}
+    pin_packages = config.GIT_PACKAGE_PINNING and "--no-pin" not in argv
+    use_mirror = "--use-mirror" in argv
+    pipeline = "--pipeline" in argv
+    resume = "--resume" in argv
+    coordinator = "--coordinator" in argv
+    
+    # 실행 기록 조회 명령
+    if "--history" in argv:
+        run_history.print_history_runs()
+        return
+    if "--history-trend" in argv:
+        project_name = get_option_value(argv, "--history-trend")
+        if not project_name:
+            print("프로젝트명을 지정하세요: --history-trend 프로젝트명 [단계]")
+            return
+        index = argv.index("--history-trend")
+        stage = argv[index + 2] if index + 2 < len(argv) and not argv[index + 2].startswith("--") else "build"
+        run_history.print_history_trend(project_name, stage)
+        return
+    if "--history-regressions" in argv:
+        run_history.print_history_regressions()
+        return
+    if "--ingest-build-reports" in argv:
+        ingested = sum(1 for project_dir in config.project_dirs if run_history.ingest_build_report(project_dir))
+        print(f"빌드 리포트 {ingested}개 새로 수집")
+        return
+    if "--largest-assets" in argv:
+        run_history.print_largest_assets(int(get_option_value(argv, "--largest-assets", 20)))
+        return
+    if "--slowest-steps" in argv:
+        run_history.print_slowest_build_steps(int(get_option_value(argv, "--slowest-steps", 20)))
+        return
+    
+    clean_keep = int(get_option_value(argv, "--keep-builds", config.CLEAN_KEEP_BUILDS))
+    if "--trash-report" in argv:
+        trash.print_trash_report(config.project_dirs, clean_keep)
+        return
+    
+    if "--install-editor-scripts" in argv:
+        build.install_package_editor_scripts()
+        return
+    
+    # 아티팩트 저장소 관리 명령
+    if "--artifact-verify" in argv:
+        if not artifact_store.verify_artifact_store():
+            sys.exit(1)
+        return
+    if "--artifact-gc" in argv:
+        artifact_store.gc_artifact_store()
+        return
+    
+    run_history.history_start_run(" ".join(argv) or "(기본 실행)")
+    journal.journal_start(resume)
+    
+    trace_path = get_option_value(argv, "--trace")
+    if trace_path:
+        tracing.trace_start(trace_path)
+    
+    metrics_path = get_option_value(argv, "--metrics-file", config.METRICS_TEXTFILE_PATH)
+    if metrics_path:
+        metrics_export.metrics_start(metrics_path)
+    
+    # 잠긴 프로젝트 대기 (기본: 건너뛰고 일시적 실패로 처리)
+    if "--wait-locks" in argv:
+        locks.set_lease_wait_timeout(float(get_option_value(argv, "--wait-locks", 3600)))
+    
+    # 분산 빌드 워커: 코디네이터가 배정하는 Unity 배치/빌드 작업만 처리
+    worker_url = get_option_value(argv, "--worker")
+    if worker_url:
+        slots = get_option_value(argv, "--worker-slots")
+        distributed.run_build_worker(worker_url, config.project_dirs, slots=int(slots) if slots else None,
+                         name=get_option_value(argv, "--worker-name"))
+        return 0
+    
+    # 코디네이터를 열 수 없는 설정이면 소스 변환/커밋 전에 중단
+    if coordinator and (unity_batch or build_webgl) and not distributed.check_coordinator_host(config.DISTRIBUTED_HOST):
+        return 1
+    
+    if full_auto:
+        print("완전 자동화 모드: 모든 작업 + Unity 배치 모드 실행...\n")
+        unity_batch = True  # full_auto는 unity_batch 포함
+    elif unity_batch:
+        print("Unity 배치 모드만 실행합니다...\n")
+        skip_git = True  # unity_batch만 실행할 때는 다른 작업 건너뜀
+    elif git_only:
+        print("Git 작업만 실행합니다...\n")
+    elif skip_git:
+        print("Git 작업을 건너뜁니다...\n")
+    
+    # Unity 6 호환성 검사만 실행하는 경우
+    if check_unity6:
+        sources.create_unity6_compatibility_report(config.project_dirs)
+        return
+    
+    # Git 패키지 추가/커밋 고정만 실행하는 경우
+    if "--pin-packages" in argv:
+        manifests.add_git_packages_to_projects(config.project_dirs, config.git_packages, pin=True,
+                                     remove=config.remove_packages, registries=config.scoped_registries)
+        return
+    
+    # Git 패키지 미러 갱신/적용만 실행하는 경우
+    if "--mirror-packages" in argv:
+        mirror.refresh_package_mirrors(config.git_packages)
+        return
+    if use_mirror and not (unity_batch or build_webgl):
+        mirror.use_package_mirrors(config.project_dirs, config.git_packages)
+        return
+    
+    # Unity 6 호환성 수정만 실행하는 경우
+    if fix_unity6:
+        sources.process_unity6_compatibility(config.project_dirs)
+        return
+    
+    # 기존 빌드 출력물 예산 검사/사전 압축/패키징/중복 제거만 실행하는 경우
+    if (payload_check or payload_accept or precompress or package or dedupe) and not build_webgl:
+        if payload_check or payload_accept:
+            payload_violations = payload_budget.check_payload_budgets(config.project_dirs, accept=payload_accept)
+        if precompress:
+            precompression.precompress_build_outputs(config.project_dirs)
+        if package:
+            packaging.package_build_outputs(config.project_dirs, package_format)
+        if dedupe:
+            artifact_store.dedupe_build_artifacts(config.project_dirs)
+        return 1 if payload_strict and payload_violations else 0
+    
+    # 프로젝트별 단계 파이프라인 (pipeline인 경우 1~7단계를 단계별 전체 대기 없이 프로젝트마다 진행)
+    if pipeline:
+        pipeline_stages = []
+        if not git_only:
+            pipeline_stages += ["convert", "fix", "manifest"]
+        if not skip_git:
+            pipeline_stages.append("git")
+        if use_mirror and (unity_batch or build_webgl):
+            pipeline_stages.append("mirror")
+        if unity_batch and not coordinator:
+            pipeline_stages.append("batch")
+        if clean_builds:
+            pipeline_stages.append("clean")
+        if build_webgl and not coordinator:
+            pipeline_stages.append("build")
+        
+        # 패키지 커밋 고정은 모든 프로젝트가 같은 값을 쓰도록 파이프라인 시작 전에 한 번만 조회
+        pins = manifests.resolve_git_package_pins(config.git_packages) if pin_packages and not git_only else None
+        options = {
+            "package_versions": {name: pin["version"] for name, pin in pins.items()} if pins else config.git_packages,
+            "package_pins": pins,
+            "clean_keep": clean_keep,
+            "force": force_build,
+        }
+        build_results = stage_pipeline.run_project_pipeline(config.project_dirs, pipeline_stages, options)
+        if build_webgl and not coordinator:
+            build_cache.print_build_cache_stats()
+            succeeded = {name for name, success in build_results if success}
+            built_dirs = [d for d in config.project_dirs if fileutil.get_project_name_from_path(d) in succeeded]
+    
+    # 1. UTF-8 변환 (git-only가 아닌 경우에만 실행)
+    unity6_changes_made = False
+    if not git_only and not pipeline:
+        print("1. C# 파일 UTF-8 변환 작업 시작...")
+        with tracing.trace_span("convert_to_utf8", "stage"):
+            for project_dir in config.project_dirs:
+                sources.convert_project_to_utf8(project_dir)
+        
+        # 2. Unity 6 deprecated API 자동 수정
+        print("\n2. Unity 6 deprecated API 자동 수정 시작...")
+        unity6_changes_made = sources.process_unity6_compatibility(config.project_dirs)
+        
+        # 3. 각 프로젝트에 패키지 추가
+        print("\n3. Unity 패키지 추가 작업 시작...")
+        manifests.add_git_packages_to_projects(config.project_dirs, config.git_packages, pin=pin_packages,
+                                     remove=config.remove_packages, registries=config.scoped_registries)
+    
+    # 4. Git 커밋 및 푸시 (skip-git가 아닌 경우에만 실행)
+    if not skip_git and not pipeline:
+        print("\n4. Git 커밋 및 푸시 작업 시작...")
+        
+        # 커밋 메시지 생성 (Unity 6 호환성 수정 포함)
+        commit_message = gitops.get_auto_commit_message(unity6_changes_made)
+        
+        with tracing.trace_span("commit_and_push_changes", "stage"):
+            for project_dir in config.project_dirs:
+                if os.path.exists(project_dir):
+                    with run_history.record_stage(project_dir, "git") as stage:
+                        if not gitops.commit_and_push_changes(project_dir, commit_message):
+                            stage["outcome"] = "failed"
+                else:
+                    print(f"프로젝트 폴더 없음: {project_dir}")
+    
+    # Unity 실행 전 Git 패키지를 로컬 미러 폴더로 전환 (use-mirror인 경우에만, Git 커밋 이후)
+    if use_mirror and (unity_batch or build_webgl) and not pipeline:
+        mirror.use_package_mirrors(config.project_dirs, config.git_packages)
+    
+    # 5·7. 분산 Unity 작업 (coordinator인 경우 배치/빌드를 워커들에게 배정)
+    if coordinator and (unity_batch or build_webgl):
+        kinds = [kind for kind, enabled in (("batch", unity_batch), ("build", build_webgl)) if enabled]
+        print(f"\n5·7. 분산 Unity 작업 시작 ({', '.join(kinds)})...")
+        distributed_results = distributed.run_build_coordinator(
+            config.project_dirs, kinds, force=force_build,
+            port=int(get_option_value(argv, "--port", config.DISTRIBUTED_PORT))
+        )
+        build_results = distributed_results.get("build", [])
+        # 빌드 출력물은 각 워커에 있으므로 8~11단계는 워커 장비에서 --payload-check, --precompress 등으로 실행
+        built_dirs = []
+    
+    # 5. Unity 배치 모드 실행 (unity-batch 또는 full-auto인 경우에만 실행)
+    if unity_batch and not pipeline and not coordinator:
+        print("\n5. Unity 배치 모드 실행 시작...")
+        run_unity_batch(config.project_dirs, parallel)
+    
+    # 6. 빌드 출력물 정리 (clean-builds인 경우에만 실행)
+    if clean_builds and not pipeline:
+        print("\n6. 빌드 출력물 정리 시작...")
+        trash.clean_build_outputs(config.project_dirs, clean_keep)
+    
+    # 7. Unity WebGL 프로젝트 빌드 (build-webgl인 경우에만 실행)
+    if build_webgl and not pipeline and not coordinator:
+        print(f"\n7. Unity WebGL 프로젝트 빌드 시작...")
+        build_results = run_webgl_builds(config.project_dirs, parallel=build_parallel, force=force_build)
+        succeeded = {name for name, success in build_results if success}
+        built_dirs = [d for d in config.project_dirs if fileutil.get_project_name_from_path(d) in succeeded]
+    
+    # 8. WebGL 페이로드 예산 검사 (빌드 성공한 프로젝트만)
+    if build_webgl and not coordinator and (config.PAYLOAD_CHECK_ENABLED or payload_check or payload_accept):
+        print(f"\n8. WebGL 페이로드 예산 검사 시작...")
+        payload_violations = payload_budget.check_payload_budgets(built_dirs, accept=payload_accept)
+    
+    # 9. 빌드 출력물 사전 압축 (precompress인 경우에만 실행)
+    if build_webgl and not coordinator and precompress:
+        print(f"\n9. WebGL 빌드 출력물 사전 압축 시작...")
+        precompression.precompress_build_outputs(config.project_dirs)
+    
+    # 10. 배포 번들 패키징 (package인 경우에만, 빌드 성공한 프로젝트만)
+    if build_webgl and not coordinator and package:
+        print(f"\n10. 배포 번들 패키징 시작...")
+        packaging.package_build_outputs(built_dirs, package_format)
+    
+    # 11. 빌드 출력물 중복 제거 (dedupe인 경우에만 실행)
+    if build_webgl and not coordinator and dedupe:
+        print(f"\n11. 빌드 출력물 중복 제거 시작...")
+        artifact_store.dedupe_build_artifacts(config.project_dirs)
+    
+    logs.log_summary("\n=== 모든 작업 완료 ===")
+    
+    if payload_strict and payload_violations:
+        print(f"❌ 페이로드 예산 초과/회귀로 실패 처리합니다. ({len(payload_violations)}개 프로젝트)")
+        return 1
+    return 0
+
+def run_legacy(argv):
+    """기존 플래그 방식으로 실행하고 실행 기록, 추적, 메트릭을 마무리합니다.
+
+    run_flags가 중간에 반환하거나 예외가 나도 백그라운드 삭제 대기와 저널 마무리는 항상 실행합니다.
+    """
+    from . import journal, metrics_export, run_history, sources, tracing, trash, unity
+    
+    log_level = get_option_value(argv, "--log-level")
+    if log_level not in (None, "debug", "info", "warning", "error"):
+        print(f"⚠️ 알 수 없는 로그 레벨: {log_level} (debug, info, warning, error 중 하나)")
+        log_level = None
+    log_format = "json" if "--log-json" in argv else "quiet" if "--quiet" in argv else None
+    logs.log_start(log_level, log_format)
+    try:
+        exit_code = run_flags(argv)
+        run_history.history_finish_run("failed" if exit_code else "completed")
+        return exit_code or 0
+    except KeyboardInterrupt:
+        unity.cancel_event.set()
+        run_history.history_finish_run("cancelled")
+        print("\n⛔ 사용자에 의해 작업이 취소되었습니다.")
+        return 130
+    except Exception:
+        run_history.history_finish_run("error")
+        raise
+    finally:
+        trash.wait_for_trash_deletes()
+        journal.journal_finish()
+        sources.shutdown_source_process_pool()
+        tracing.trace_finish()
+        metrics_export.metrics_finish()
+        logs.log_finish()
+
+# 하위 명령: 필요한 모듈만 불러오므로 status, clean처럼 짧은 명령은 바로 시작합니다.
+COMMANDS = ("convert", "fix", "report", "manifest", "git", "batch", "build", "clean", "status")
+
+def select_projects(names):
+    """--project로 지정한 프로젝트만 남깁니다. (폴더명 기준, 지정하지 않으면 전체)"""
+    if not names:
+        return list(config.project_dirs)
+    selected = [d for d in config.project_dirs if fileutil.get_project_name_from_path(d) in names]
+    unknown = set(names) - {fileutil.get_project_name_from_path(d) for d in selected}
+    for name in sorted(unknown):
+        print(f"⚠️ project_dirs에 없는 프로젝트: {name}")
+    return selected
+
+def command_convert(args, project_dirs):
+    from . import sources, tracing
+    
+    with tracing.trace_span("convert_to_utf8", "stage"):
+        for project_dir in project_dirs:
+            sources.convert_project_to_utf8(project_dir)
+    return 0
+
+def command_fix(args, project_dirs):
+    from . import sources
+    
+    sources.process_unity6_compatibility(project_dirs)
+    return 0
+
+def command_report(args, project_dirs):
+    from . import sources
+    
+    sources.create_unity6_compatibility_report(project_dirs)
+    return 0
+
+def command_manifest(args, project_dirs):
+    from . import manifests
+    
+    manifests.add_git_packages_to_projects(project_dirs, config.git_packages,
+                                           pin=config.GIT_PACKAGE_PINNING and not args.no_pin,
+                                           remove=config.remove_packages, registries=config.scoped_registries)
+    return 0
+
+def command_git(args, project_dirs):
+    from . import gitops, run_history, tracing
+    
+    failed = 0
+    with tracing.trace_span("commit_and_push_changes", "stage"):
+        for project_dir in project_dirs:
+            if not os.path.exists(project_dir):
+                print(f"프로젝트 폴더 없음: {project_dir}")
+                failed += 1
+                continue
+            with run_history.record_stage(project_dir, "git") as stage:
+                if not gitops.commit_and_push_changes(project_dir, args.message):
+                    stage["outcome"] = "failed"
+                    failed += 1
+    return 1 if failed else 0
+
+def command_batch(args, project_dirs):
+    return 0 if run_unity_batch(project_dirs, args.parallel) else 1
+
+def command_build(args, project_dirs):
+    from . import payload_budget
+    
+    build_results = run_webgl_builds(project_dirs, parallel=args.parallel, force=args.force)
+    succeeded = {name for name, success in build_results if success}
+    violations = {}
+    if config.PAYLOAD_CHECK_ENABLED:
+        built_dirs = [d for d in project_dirs if fileutil.get_project_name_from_path(d) in succeeded]
+        violations = payload_budget.check_payload_budgets(built_dirs)
+    if violations and config.PAYLOAD_ON_VIOLATION == "fail":
+        return 1
+    return 0 if len(succeeded) == len(build_results) else 1
+
+def command_clean(args, project_dirs):
+    from . import trash
+    
+    if args.report:
+        trash.print_trash_report(project_dirs, args.keep)
+        return 0
+    trash.clean_build_outputs(project_dirs, args.keep)
+    return 0
+
+def command_status(args, project_dirs):
+    from . import fleet_status
+    
+    fleet_status.show_fleet_status(project_dirs, as_json=args.json, refresh=args.refresh, fetch=args.fetch)
+    return 0
+
+def build_parser():
+    """하위 명령 인수 파서를 만듭니다."""
+    import argparse
+    
+    parser = argparse.ArgumentParser(prog="dannect-toolkit", description="Unity 프로젝트 자동화 도구")
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--project", action="append", dest="projects", metavar="이름",
+                        help="이 프로젝트만 처리 (폴더명, 여러 번 지정 가능)")
+    common.add_argument("--resume", action="store_true", help="저널에 완료로 기록되고 입력이 같은 단계는 건너뜀")
+    common.add_argument("--wait-locks", type=float, nargs="?", const=3600, default=None, metavar="초",
+                        help="다른 실행이 잠근 프로젝트를 기다림 (초 생략 시 3600초)")
+    common.add_argument("--trace", metavar="파일.json", help="실행 구간을 Chrome trace-event 형식으로 저장")
+    common.add_argument("--metrics-file", metavar="파일.prom", help="OpenMetrics 텍스트 파일로 메트릭 기록")
+    # 로그 출력 옵션 (status는 자체 --json 출력을 사용하므로 제외)
+    output = argparse.ArgumentParser(add_help=False)
+    output.add_argument("--log-level", choices=("debug", "info", "warning", "error"),
+                        help="출력할 최소 레벨 (기본: LOG_LEVEL 설정), debug면 파일별 결과도 출력")
+    output_format = output.add_mutually_exclusive_group()
+    output_format.add_argument("--quiet", action="store_const", const="quiet", dest="log_format",
+                               help="실행 요약과 오류만 출력")
+    output_format.add_argument("--log-json", action="store_const", const="json", dest="log_format",
+                               help="한 줄에 하나씩 JSON 레코드로 출력")
+    
+    commands = parser.add_subparsers(dest="command", metavar="명령")
+    commands.required = True
+    commands.add_parser("convert", parents=[common, output], help="C# 파일 UTF-8 변환")
+    commands.add_parser("fix", parents=[common, output], help="Unity 6 deprecated API 자동 수정")
+    commands.add_parser("report", parents=[common, output], help="Unity 6 호환성 검사 보고서 생성")
+    manifest = commands.add_parser("manifest", parents=[common, output], help="Git 패키지 추가/커밋 고정")
+    manifest.add_argument("--no-pin", action="store_true", help="커밋 고정 없이 URL만 기록")
+    git = commands.add_parser("git", parents=[common, output], help="Git 커밋 및 푸시")
+    git.add_argument("-m", "--message", default="Auto commit: Unity project updates", help="커밋 메시지")
+    batch = commands.add_parser("batch", parents=[common, output], help="Unity 배치 모드 실행")
+    batch.add_argument("--parallel", action="store_true", help="3개씩 동시 실행")
+    build = commands.add_parser("build", parents=[common, output], help="Unity WebGL 빌드")
+    build.add_argument("--parallel", action="store_true", help="2개씩 동시 빌드")
+    build.add_argument("--force", action="store_true", help="빌드 캐시를 무시하고 다시 빌드")
+    clean = commands.add_parser("clean", parents=[common, output], help="빌드 출력물 정리 (휴지통으로 이동)")
+    clean.add_argument("--keep", type=int, default=config.CLEAN_KEEP_BUILDS, metavar="N",
+                       help="프로젝트별 최근 빌드 N개를 휴지통에 보관")
+    clean.add_argument("--report", action="store_true", help="휴지통 항목과 확보 가능한 용량만 출력")
+    status = commands.add_parser("status", parents=[common], help="프로젝트별 브랜치/변경/동기화/최근 커밋·빌드 요약")
+    status.add_argument("--json", action="store_true", help="표 대신 JSON으로 출력")
+    status.add_argument("--refresh", action="store_true", help="캐시를 쓰지 않고 다시 조회")
+    status.add_argument("--fetch", action="store_true", help="원격을 먼저 fetch하여 ahead/behind 갱신 (캐시 사용 안 함)")
+    return parser
+
+def run_command(argv):
+    """하위 명령을 실행합니다. status는 읽기 전용이므로 실행 기록 없이 바로 실행합니다."""
+    args = build_parser().parse_args(argv)
+    handler = globals()[f"command_{args.command}"]
+    project_dirs = select_projects(args.projects)
+    if args.command == "status":
+        return handler(args, project_dirs)
+    
+    from . import journal, locks, metrics_export, run_history, sources, tracing, trash
+    
+    logs.log_start(args.log_level, args.log_format)
+    run_history.history_start_run(" ".join(argv))
+    journal.journal_start(args.resume)
+    if args.trace:
+        tracing.trace_start(args.trace)
+    metrics_path = args.metrics_file or config.METRICS_TEXTFILE_PATH
+    if metrics_path:
+        metrics_export.metrics_start(metrics_path)
+    if args.wait_locks is not None:
+        locks.set_lease_wait_timeout(args.wait_locks)
+    try:
+        exit_code = handler(args, project_dirs)
+        run_history.history_finish_run("failed" if exit_code else "completed")
+        return exit_code
+    except KeyboardInterrupt:
+        from . import unity
+        
+        unity.cancel_event.set()
+        run_history.history_finish_run("cancelled")
+        print("\n⛔ 사용자에 의해 작업이 취소되었습니다.")
+        return 130
+    except Exception:
+        run_history.history_finish_run("error")
+        raise
+    finally:
+        trash.wait_for_trash_deletes()
+        journal.journal_finish()
+        sources.shutdown_source_process_pool()
+        tracing.trace_finish()
+        metrics_export.metrics_finish()
+        logs.log_finish()
+
+def main(argv=None):
+    """첫 인수가 명령이면 하위 명령으로, 옵션(--)이거나 없으면 기존 플래그 방식으로 실행합니다."""
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and not argv[0].startswith("-"):
+        # 잘못 입력한 명령이 기본 전체 작업으로 실행되지 않도록 파서가 오류를 출력
+        return run_command(argv)
+    return run_legacy(argv)
+
+# endregion
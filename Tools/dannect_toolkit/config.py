@@ -0,0 +1,208 @@
+"""툴킷 설정 (프로젝트 목록, 패키지, Unity/빌드/캐시 경로 등). 실행 중 변경은 config.X로 참조하는 모든 모듈에 반영됩니다."""
+import os
+
+
+# =========================
+# #region 프로젝트 폴더 및 패키지 정보 (최상단에 위치)
+# =========================
+project_dirs = [
+
+    r"E:\5.1.3.2_SolubilityObservation",
+    r"E:\5.1.3.3_SolubilityWeight",
+    # ... 필요시 추가
+]
+
+def get_unity_projects_from_directory(base_dir):
+    """지정된 디렉토리에서 Unity 프로젝트들을 자동으로 찾습니다."""
+    unity_projects = []
+    
+    if not os.path.exists(base_dir):
+        print(f"기본 디렉토리가 존재하지 않습니다: {base_dir}")
+        return unity_projects
+    
+    try:
+        for item in os.listdir(base_dir):
+            item_path = os.path.join(base_dir, item)
+            if os.path.isdir(item_path):
+                # Unity 프로젝트인지 확인 (ProjectSettings 폴더 존재 여부)
+                project_settings = os.path.join(item_path, "ProjectSettings")
+                assets_folder = os.path.join(item_path, "Assets")
+                
+                if os.path.exists(project_settings) and os.path.exists(assets_folder):
+                    unity_projects.append(item_path)
+                    print(f"Unity 프로젝트 발견: {item}")
+    
+    except Exception as e:
+        print(f"디렉토리 스캔 오류: {e}")
+    
+    return unity_projects
+
+# 자동 스캔을 사용하려면 아래 주석을 해제하고 경로를 수정하세요
+# project_dirs.extend(get_unity_projects_from_directory(r"E:\UnityProjects"))
+
+git_packages = {
+    "com.boxqkrtm.ide.cursor": "https://github.com/boxqkrtm/com.unity.ide.cursor.git",
+    "com.dannect.toolkit": "https://github.com/mmporong/SimGround_Package.git"
+    
+    # 필요시 추가
+}
+
+# manifest에서 제거할 패키지 (필요시 추가)
+remove_packages = [
+]
+
+# manifest에 추가/갱신할 scoped registry (이름 또는 URL이 같으면 갱신)
+scoped_registries = [
+    # {"name": "package.openupm.com", "url": "https://package.openupm.com", "scopes": ["com.openupm"]},
+]
+
+# Git 설정
+GIT_BASE_URL = "https://github.com/mmporong/"
+DEFAULT_BRANCH = "main"
+DEV_BRANCH = "dev"
+
+# Git 패키지 커밋 고정 설정 (manifest에 URL#커밋 해시, packages-lock.json에 같은 커밋 기록)
+GIT_PACKAGE_PINNING = True  # False 또는 --no-pin이면 기존처럼 URL만 기록 (Unity가 열 때마다 원격 HEAD 조회)
+GIT_PACKAGE_RESOLVE_WORKERS = 4  # 패키지 커밋 조회 스레드 수
+MANIFEST_EDIT_WORKERS = 8  # manifest.json/packages-lock.json을 동시에 편집할 프로젝트 수
+GIT_PACKAGE_MIRROR_ENABLED = True  # 원격마다 로컬 bare 미러를 두고 실행마다 한 번만 갱신 (커밋 조회/package.json을 로컬에서 처리)
+
+# Unity CLI 설정
+UNITY_EDITOR_PATH = r"D:\Unity\6000.0.30f1\Editor\Unity.exe"  # Unity 설치 경로
+UNITY_TIMEOUT = 300  # Unity 실행 타임아웃 (초)
+UNITY_INACTIVITY_TIMEOUT = 180  # 로그 출력이 없으면 멈춘 것으로 판단하는 시간 (초)
+UNITY_KILL_GRACE = 10  # 종료 요청 후 프로세스 트리를 강제 종료하기까지 대기 시간 (초)
+UNITY_RETRY_MAX_ATTEMPTS = 2  # 일시적 실패(잠금, 라이선스, 패키지 캐시 등) 최대 재시도 횟수
+UNITY_RETRY_BACKOFF = 30  # 첫 재시도 전 대기 시간 (초), 재시도마다 2배로 증가
+UNITY_LOG_LEVEL = "info"  # Unity 로그 레벨 (debug, info, warning, error)
+
+# Unity WebGL 빌드 설정
+BUILD_TARGET = "WebGL"  # WebGL 전용
+DEFAULT_BUILD_TARGET = "webgl"
+BUILD_OUTPUT_DIR = "Builds"  # 프로젝트 내 빌드 출력 폴더
+BUILD_TIMEOUT = 1800  # WebGL 빌드 타임아웃 (30분)
+BUILD_INACTIVITY_TIMEOUT = 600  # 빌드 중 로그 없이 허용하는 시간 (IL2CPP 링크 등 고려, 초)
+BUILD_REPORT_FILENAME = ".build_report.json"  # 빌드 스크립트가 Builds 폴더에 남기는 BuildReport 요약
+BUILD_REPORT_MAX_ASSETS = 200  # 리포트에 기록할 에셋 수 (크기순 상위)
+
+# 에디터 스크립트(AutoWebGLBuildScript, AutoBatchProcessor) 설치 방식
+# "project": 프로젝트마다 Assets/Editor에 생성 (내용이 바뀐 경우에만 기록)
+# "package": 공용 패키지의 Editor 어셈블리에 포함된 스크립트 사용 (--install-editor-scripts로 갱신)
+EDITOR_SCRIPTS_MODE = "project"
+EDITOR_SCRIPTS_PACKAGE = "com.dannect.toolkit"
+EDITOR_SCRIPTS_NAMESPACE = "Dannect.Toolkit.Editor"
+
+# 빌드 출력물 정리 설정 (휴지통 폴더로 이름만 바꾸고 실제 삭제는 백그라운드에서 진행)
+CLEAN_TRASH_DIRNAME = ".dannect_trash"  # 볼륨 최상위(권한이 없으면 프로젝트 상위 폴더)에 생성
+CLEAN_DELETE_WORKERS = 4  # 백그라운드 삭제 스레드 수
+CLEAN_KEEP_BUILDS = 0  # 프로젝트별로 휴지통에 남겨 둘 최근 빌드 수 (--keep-builds로 변경)
+
+# 툴킷 폴더 (패키지의 Tools 폴더, 호환성 보고서 저장 위치)
+TOOLKIT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 툴킷 로컬 상태 저장 위치 (빌드 캐시 등, 실행 간 유지)
+TOOLKIT_STATE_DIR = os.path.join(os.path.expanduser("~"), ".dannect_toolkit")
+
+# WebGL 빌드 캐시 설정
+BUILD_CACHE_ENABLED = True
+BUILD_CACHE_DIR = os.path.join(TOOLKIT_STATE_DIR, "build_cache")
+BUILD_CACHE_MAX_ENTRIES = 3  # 프로젝트당 보관할 빌드 결과 개수
+BUILD_FINGERPRINT_DIRS = ["Assets", "Packages", "ProjectSettings"]  # 빌드 입력으로 간주할 폴더
+
+# 빌드 스케줄링 설정 (과거 빌드 시간 기반, 오래 걸리는 프로젝트부터 실행)
+BUILD_DURATIONS_PATH = os.path.join(TOOLKIT_STATE_DIR, "build_durations.json")
+BUILD_DURATION_HISTORY = 5  # 프로젝트별로 보관할 최근 빌드 시간 개수
+BUILD_DEFAULT_DURATION = 600  # 기록이 없는 프로젝트의 예상 빌드 시간 (초)
+
+# WebGL 빌드 출력물 사전 압축 설정 (Unity 압축은 끄고 빌드 후 별도로 .br/.gz 생성)
+PRECOMPRESS_EXTENSIONS = (".wasm", ".data", ".js", ".json", ".html", ".css", ".svg")
+PRECOMPRESS_MIN_SIZE = 1024  # 이보다 작은 파일은 압축하지 않음 (바이트)
+PRECOMPRESS_WORKERS = None  # 압축 프로세스 수 (None이면 CPU 코어 수)
+PRECOMPRESS_BROTLI_QUALITY = 11  # brotli 압축 품질 (0~11)
+PRECOMPRESS_GZIP_LEVEL = 9  # gzip 압축 레벨 (1~9)
+
+# WebGL 페이로드 예산 설정 (학생이 실제로 내려받는 크기, gzip 기준)
+PAYLOAD_CHECK_ENABLED = True  # WebGL 빌드 후 자동으로 검사 (--payload-check로 단독 실행 가능)
+PAYLOAD_BASELINE_PATH = os.path.join(TOOLKIT_STATE_DIR, "payload_baselines.json")
+PAYLOAD_BUDGETS = {  # 프로젝트명별 예산 (바이트, "total" 또는 역할: wasm, data, framework.js 등), "*"는 모든 프로젝트 기본값
+    "*": {"total": 40 * 1024 * 1024, "wasm": 25 * 1024 * 1024, "data": 30 * 1024 * 1024},
+}
+PAYLOAD_REGRESSION_THRESHOLD = 0.1  # 기준보다 이 비율 이상 커지면 회귀로 보고 (10%)
+PAYLOAD_REGRESSION_MIN_BYTES = 256 * 1024  # 이보다 작은 증가는 비율과 관계없이 무시
+PAYLOAD_ON_VIOLATION = "warn"  # "warn" 또는 "fail" (fail이면 종료 코드 1, --payload-strict로도 지정)
+PAYLOAD_WORKERS = 4  # gzip 크기 측정 스레드 수
+
+# Git 패키지 정보 캐시 (커밋은 바뀌지 않으므로 영구 보관)
+GIT_PACKAGE_CACHE_DIR = os.path.join(TOOLKIT_STATE_DIR, "git_packages")  # package.json 조회용 얕은 bare 저장소
+GIT_PACKAGE_INFO_PATH = os.path.join(TOOLKIT_STATE_DIR, "git_package_info.json")  # 커밋별 package.json 의존성
+GIT_PACKAGE_MIRROR_DIR = os.path.join(TOOLKIT_STATE_DIR, "package_mirrors")  # bare 미러와 커밋별로 꺼낸 패키지 폴더 (--use-mirror)
+
+# 내용 주소 기반 아티팩트 저장소 설정 (동일한 빌드 출력 파일을 하나로 공유)
+ARTIFACT_STORE_DIR = os.path.join(TOOLKIT_STATE_DIR, "artifacts")  # 프로젝트와 같은 볼륨이어야 하드링크 가능
+ARTIFACT_LINK_MODE = "hardlink"  # "hardlink" 또는 "reflink" (Btrfs/XFS/APFS 등 복사 시 쓰기(CoW) 지원 파일시스템)
+ARTIFACT_HASH_WORKERS = 4  # 파일 해시 계산 스레드 수
+
+# 배포 번들 설정 (빌드 결과를 결정적 아카이브 + 파일 해시 manifest로 패키징)
+PACKAGE_OUTPUT_DIR = os.path.join(TOOLKIT_STATE_DIR, "packages")  # 프로젝트별 번들 저장 위치
+PACKAGE_FORMAT = "zip"  # "zip" 또는 "tar.zst" (zstandard 모듈 필요)
+PACKAGE_WORKERS = os.cpu_count() or 4  # 동시에 패키징할 프로젝트 수
+PACKAGE_KEEP_VERSIONS = 5  # 프로젝트별로 보관할 번들 버전 수
+PACKAGE_ZSTD_LEVEL = 10  # tar.zst 압축 레벨
+
+# 실행 기록(SQLite) 설정
+HISTORY_ENABLED = True
+HISTORY_DB_PATH = os.path.join(TOOLKIT_STATE_DIR, "history.db")
+HISTORY_FLUSH_SIZE = 200  # 메모리에 모아 두었다가 한 번에 기록할 행 수
+HISTORY_REGRESSION_THRESHOLD = 0.2  # 이 비율 이상 느려지면 성능 저하로 보고 (20%)
+HISTORY_REGRESSION_WINDOW_DAYS = 7  # 최근 구간과 비교 구간의 길이 (일)
+
+# 메트릭(OpenMetrics 텍스트 파일) 설정 - node-exporter textfile collector 수집용
+METRICS_TEXTFILE_PATH = ""  # 예: "/var/lib/node_exporter/textfile/dannect_toolkit.prom" (빈 값이면 비활성, --metrics-file로 지정 가능)
+METRICS_WRITE_INTERVAL = 60  # 실행 중 메트릭 파일을 갱신하는 주기 (초)
+METRICS_DURATION_BUCKETS = [1, 5, 15, 30, 60, 120, 300, 600, 1200, 1800, 3600]  # 단계 시간 히스토그램 구간 (초)
+METRICS_GIT_PUSH_BUCKETS = [0.5, 1, 2, 5, 10, 30, 60, 120]  # git push 시간 히스토그램 구간 (초)
+
+# 프로젝트별 단계 파이프라인 설정 (--pipeline)
+PIPELINE_CPU_WORKERS = os.cpu_count() or 4  # 소스 변환/manifest 단계 동시 실행 수 (파일 처리는 SOURCE_PROCESS_WORKERS 프로세스에서)
+PIPELINE_NETWORK_LIMIT = 4  # 동시 git push 수
+PIPELINE_UNITY_MAX_SLOTS = 4  # 동시에 실행할 Unity 인스턴스 최대 수
+PIPELINE_UNITY_MEMORY_PER_SLOT = 6 * 1024 ** 3  # Unity 인스턴스 하나에 잡아 둘 메모리 (WebGL/IL2CPP 빌드 기준, 바이트)
+
+# C# 소스 처리 설정 (UTF-8 변환, Unity 6 API 수정은 GIL을 잡는 순수 Python 작업이므로 프로세스 풀에서 실행)
+SOURCE_PROCESS_WORKERS = None  # 파일 처리 프로세스 수 (None이면 CPU 코어 수, 여러 프로젝트가 함께 사용)
+SOURCE_PROCESS_MIN_FILES = 32  # C# 파일이 이보다 적은 프로젝트는 프로세스 풀 없이 바로 처리
+
+# 분산 빌드 설정 (--coordinator / --worker)
+DISTRIBUTED_HOST = "127.0.0.1"  # 코디네이터가 요청을 받을 주소 (다른 장비의 워커를 받으려면 "0.0.0.0", DISTRIBUTED_TOKEN 필요)
+DISTRIBUTED_PORT = 8765  # 코디네이터 포트 (--port로 변경)
+DISTRIBUTED_TOKEN = os.environ.get("DANNECT_TOOLKIT_TOKEN", "")  # 코디네이터와 워커가 공유하는 비밀 값 (빈 값이면 인증 없음)
+DISTRIBUTED_HEARTBEAT_INTERVAL = 5  # 워커가 하트비트와 Unity 로그를 보내는 주기 (초)
+DISTRIBUTED_LEASE_TIMEOUT = 60  # 이 시간 동안 하트비트가 없으면 워커가 죽은 것으로 보고 작업을 다시 배정 (초)
+DISTRIBUTED_MAX_ATTEMPTS = 3  # 워커 중단으로 같은 작업을 다시 배정할 최대 횟수
+DISTRIBUTED_POLL_INTERVAL = 3  # 배정할 작업이 없을 때 워커가 다시 요청하기까지 대기 시간 (초)
+DISTRIBUTED_LOG_DIR = os.path.join(TOOLKIT_STATE_DIR, "distributed_logs")  # 코디네이터에 모이는 작업별 Unity 로그
+DISTRIBUTED_ARTIFACTS_PATH = os.path.join(TOOLKIT_STATE_DIR, "distributed_artifacts.json")  # 프로젝트별 최근 빌드 출력물 해시
+
+# 프로젝트 잠금 설정 (동시에 실행된 툴킷끼리 같은 프로젝트를 겹쳐 처리하지 않도록)
+LOCK_ENABLED = True
+LOCK_LEASE_TIMEOUT = 300  # 갱신 없이 이 시간이 지난 잠금은 버려진 것으로 판단 (다른 호스트의 잠금 기준, 초)
+LOCK_RENEW_INTERVAL = 60  # 잡고 있는 잠금의 만료 시각을 연장하는 주기 (초)
+LOCK_WAIT_TIMEOUT = 0  # 잠긴 프로젝트를 기다릴 최대 시간 (0이면 건너뜀, --wait-locks로 지정, 초)
+LOCK_POLL_INTERVAL = 5  # 잠금 대기 중 다시 시도하는 주기 (초)
+
+# 실행 저널 설정 (중단된 실행을 --resume으로 이어서 진행)
+RUN_JOURNAL_ENABLED = True
+RUN_JOURNAL_PATH = os.path.join(TOOLKIT_STATE_DIR, "run_journal.jsonl")  # 프로젝트/단계 완료 기록 (JSONL, 추가 전용)
+RUN_JOURNAL_MAX_RECORDS = 20000  # 시작할 때 이보다 많으면 단계별 마지막 기록만 남기고 정리
+
+# 프로젝트 상태 요약 설정 (status 명령)
+STATUS_WORKERS = 16  # 동시에 조회할 프로젝트 수
+STATUS_CACHE_TTL = 30  # 조회 결과 재사용 시간 (초), HEAD/index/원격 참조가 바뀐 프로젝트는 다시 조회
+STATUS_CACHE_PATH = os.path.join(TOOLKIT_STATE_DIR, "status_cache.json")
+
+# 로그 출력 설정
+LOG_LEVEL = "info"  # 출력할 최소 레벨 (debug, info, warning, error), debug면 파일별 처리 결과도 출력
+LOG_FORMAT = "text"  # text: 사람이 읽는 형식, quiet: 요약과 오류만, json: 한 줄에 하나씩 JSON 레코드 (--quiet, --log-json)
+LOG_BUFFER_LINES = 200  # 프로젝트별 버퍼에 이만큼 쌓이면 중간에 한 번에 출력
+LOG_BUFFER_SECONDS = 5  # 프로젝트별 버퍼의 가장 오래된 줄이 이 시간을 넘으면 중간에 한 번에 출력 (초)
+# endregion
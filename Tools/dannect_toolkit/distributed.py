@@ -0,0 +1,488 @@
+"""분산 빌드 (코디네이터/워커, HTTP 작업 임대)."""
+import os
+import json
+import collections
+import hmac
+import http.server
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from . import build_cache, config, fileutil, gitops, locks, logs, manifests, schedule, stage_pipeline, tracing, unity
+
+
+# =========================
+# #region 분산 빌드 (코디네이터/워커, HTTP 작업 임대, --coordinator/--worker)
+# =========================
+# 코디네이터는 Unity 배치/빌드 작업 목록을 들고 HTTP로 워커에게 하나씩 임대합니다.
+# 워커는 하트비트와 함께 Unity 로그를 보내고, 끝나면 결과와 빌드 출력물 해시를 보고합니다.
+# 하트비트가 DISTRIBUTED_LEASE_TIMEOUT 동안 끊긴 작업은 다른 워커에게 다시 배정됩니다.
+#
+#   POST /lease      {"worker", "projects", "kinds"}   -> {"job": 작업 또는 null, "done": 모든 작업 종료 여부}
+#   POST /heartbeat  {"worker", "job_id", "lines"}     -> {"ok": 임대 유지 여부}
+#   POST /complete   {"worker", "job_id", "success", "category", "lines", "unity_duration", "artifacts"}
+#   GET  /status                                        -> 작업별 상태 목록
+
+DISTRIBUTED_JOB_KINDS = ("batch", "build")
+DISTRIBUTED_TOKEN_HEADER = "X-Dannect-Token"
+DISTRIBUTED_MAX_REQUEST_BYTES = 16 * 1024 * 1024
+DISTRIBUTED_FINISHED_STATUSES = ("success", "failed", "skipped")
+
+class BuildCoordinator:
+    """분산 빌드 작업 상태를 관리합니다. (HTTP 요청 스레드들이 공유하므로 모든 변경은 lock 안에서 수행)"""
+    
+    def __init__(self, project_dirs, kinds, force=False):
+        self.lock = threading.Lock()
+        self.project_paths = {}
+        self.jobs = []
+        
+        # 과거 빌드 시간이 긴 프로젝트부터 배정 (LPT), 같은 프로젝트의 빌드는 배치가 성공한 뒤에 배정
+        estimates = schedule.estimate_build_durations(project_dirs)
+        for project_dir in schedule.order_longest_first(project_dirs, estimates):
+            project_name = fileutil.get_project_name_from_path(project_dir)
+            self.project_paths[project_name] = project_dir
+            revision = ""
+            if gitops.is_git_repository(project_dir):
+                success, stdout, _ = gitops.run_git_command("git rev-parse HEAD", project_dir)
+                revision = stdout if success else ""
+            for kind in kinds:
+                self.jobs.append({
+                    "id": f"{project_name}:{kind}",
+                    "kind": kind,
+                    "project": project_name,
+                    "revision": revision,
+                    "force": force,
+                    "after": f"{project_name}:batch" if kind == "build" and "batch" in kinds else None,
+                    "status": "queued",
+                    "worker": None,
+                    "attempts": 0,
+                    "expires": 0.0,
+                    "not_before": 0.0,
+                    "started": None,
+                    "duration": None,
+                    "category": None,
+                })
+        self.jobs_by_id = {job["id"]: job for job in self.jobs}
+        os.makedirs(config.DISTRIBUTED_LOG_DIR, exist_ok=True)
+    
+    def get_log_path(self, job):
+        return os.path.join(config.DISTRIBUTED_LOG_DIR, f"{job['project']}.{job['kind']}.log")
+    
+    def append_log(self, job, lines):
+        if lines:
+            with open(self.get_log_path(job), "a", encoding="utf-8") as f:
+                f.writelines(str(line) for line in lines)
+    
+    def finish(self, job, status, category=None):
+        """작업을 종료 상태로 바꾸고, 실패했으면 이 작업을 기다리던 작업도 건너뜁니다."""
+        job["status"] = status
+        job["category"] = category
+        job["worker"] = None
+        finished = sum(1 for j in self.jobs if j["status"] in DISTRIBUTED_FINISHED_STATUSES)
+        icon = {"success": "✅", "failed": "❌", "skipped": "⏭️"}[status]
+        detail = f" ({category})" if category else ""
+        print(f"{icon} [{finished}/{len(self.jobs)}] {job['project']}: {job['kind']} {status}{detail}")
+        if status != "success":
+            for dependent in self.jobs:
+                if dependent["after"] == job["id"] and dependent["status"] == "queued":
+                    self.finish(dependent, "skipped", f"{job['kind']} {status}")
+    
+    def expire_leases(self):
+        """하트비트가 끊긴 작업을 다시 대기열에 넣습니다. (lock 안에서 호출)"""
+        now = time.time()
+        for job in self.jobs:
+            if job["status"] != "leased" or job["expires"] > now:
+                continue
+            print(f"💀 {job['worker']} 응답 없음 ({config.DISTRIBUTED_LEASE_TIMEOUT}초): {job['project']} {job['kind']}")
+            if job["attempts"] >= config.DISTRIBUTED_MAX_ATTEMPTS:
+                self.finish(job, "failed", "worker_lost")
+            else:
+                job["status"] = "queued"
+                job["worker"] = None
+                print(f"🔁 {job['project']}: {job['kind']} 다른 워커에 다시 배정 대기")
+    
+    def check_leases(self):
+        with self.lock:
+            self.expire_leases()
+    
+    def lease(self, worker, projects, kinds):
+        """워커가 가진 프로젝트 중 지금 실행할 수 있는 첫 작업을 임대합니다. 없으면 None"""
+        with self.lock:
+            self.expire_leases()
+            now = time.time()
+            for job in self.jobs:
+                if job["status"] != "queued" or job["kind"] not in kinds or job["project"] not in projects:
+                    continue
+                if job["not_before"] > now:
+                    continue
+                if job["after"] and self.jobs_by_id[job["after"]]["status"] != "success":
+                    continue
+                
+                job["status"] = "leased"
+                job["worker"] = worker
+                job["attempts"] += 1
+                job["started"] = now
+                job["expires"] = now + config.DISTRIBUTED_LEASE_TIMEOUT
+                mode = "w" if job["attempts"] == 1 else "a"
+                with open(self.get_log_path(job), mode, encoding="utf-8") as f:
+                    f.write(f"=== {job['kind']} 시도 {job['attempts']} ({worker}) ===\n")
+                print(f"📤 {job['project']}: {job['kind']} → {worker} (시도 {job['attempts']})")
+                return {key: job[key] for key in ("id", "kind", "project", "revision", "force")}
+            return None
+    
+    def heartbeat(self, worker, job_id, lines):
+        """임대를 연장하고 받은 로그를 기록합니다. 이미 회수된 임대면 False"""
+        with self.lock:
+            job = self.jobs_by_id.get(job_id)
+            if not job or job["status"] != "leased" or job["worker"] != worker:
+                return False
+            job["expires"] = time.time() + config.DISTRIBUTED_LEASE_TIMEOUT
+            self.append_log(job, lines)
+            return True
+    
+    def complete(self, worker, job_id, report):
+        """워커의 작업 결과를 반영합니다. 일시적 실패는 백오프 후 다시 배정합니다."""
+        with self.lock:
+            job = self.jobs_by_id.get(job_id)
+            if not job or job["status"] != "leased" or job["worker"] != worker:
+                return False
+            self.append_log(job, report.get("lines", []))
+            job["duration"] = time.time() - job["started"]
+            
+            if report.get("success"):
+                project_path = self.project_paths[job["project"]]
+                if job["kind"] == "build" and report.get("unity_duration"):
+                    schedule.record_build_duration(project_path, report["unity_duration"])
+                if report.get("artifacts") is not None:
+                    self.save_artifacts(job, worker, report["artifacts"])
+                self.finish(job, "success")
+                return True
+            
+            category = report.get("category") or "unknown"
+            retries = job["attempts"] - 1
+            if category in unity.TRANSIENT_FAILURE_CATEGORIES and retries < config.UNITY_RETRY_MAX_ATTEMPTS:
+                delay = config.UNITY_RETRY_BACKOFF * (2 ** retries)
+                job["status"] = "queued"
+                job["worker"] = None
+                job["not_before"] = time.time() + delay
+                print(f"🔁 {job['project']}: {job['kind']} 일시적 실패 ({category}), {delay}초 후 다시 배정")
+            else:
+                self.finish(job, "failed", category)
+            return True
+    
+    def save_artifacts(self, job, worker, artifacts):
+        """빌드 출력물 해시를 프로젝트별로 기록합니다. (배포 전 워커 간 결과 비교용)"""
+        records = fileutil.load_json_file(config.DISTRIBUTED_ARTIFACTS_PATH, {})
+        records[job["project"]] = {
+            "worker": worker,
+            "revision": job["revision"],
+            "finished": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "files": artifacts,
+        }
+        fileutil.save_json_file(config.DISTRIBUTED_ARTIFACTS_PATH, records)
+    
+    def is_done(self):
+        with self.lock:
+            return all(job["status"] in DISTRIBUTED_FINISHED_STATUSES for job in self.jobs)
+    
+    def get_status(self):
+        with self.lock:
+            return [
+                {key: job[key] for key in ("id", "status", "worker", "attempts", "duration", "category")}
+                for job in self.jobs
+            ]
+    
+    def get_results(self, kind):
+        """작업 종류별 결과를 [(프로젝트명, 성공 여부)]로 반환합니다."""
+        return [(job["project"], job["status"] == "success") for job in self.jobs if job["kind"] == kind]
+
+class CoordinatorRequestHandler(http.server.BaseHTTPRequestHandler):
+    """코디네이터 HTTP 요청을 server.coordinator(BuildCoordinator)로 전달합니다."""
+    
+    def log_message(self, format, *args):
+        pass  # 요청마다 출력하지 않음 (하트비트가 많음)
+    
+    def send_json(self, status, data):
+        body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def is_authorized(self):
+        if not config.DISTRIBUTED_TOKEN:
+            return True
+        return hmac.compare_digest(self.headers.get(DISTRIBUTED_TOKEN_HEADER, ""), config.DISTRIBUTED_TOKEN)
+    
+    def do_GET(self):
+        if not self.is_authorized():
+            self.send_json(401, {"error": "unauthorized"})
+        elif self.path == "/status":
+            self.send_json(200, self.server.coordinator.get_status())
+        else:
+            self.send_json(404, {"error": "not found"})
+    
+    def do_POST(self):
+        if not self.is_authorized():
+            self.send_json(401, {"error": "unauthorized"})
+            return
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > DISTRIBUTED_MAX_REQUEST_BYTES:
+            self.send_json(413, {"error": "request too large"})
+            return
+        try:
+            request = json.loads(self.rfile.read(length).decode("utf-8")) if length else {}
+        except (ValueError, UnicodeDecodeError):
+            self.send_json(400, {"error": "invalid json"})
+            return
+        
+        coordinator = self.server.coordinator
+        worker = str(request.get("worker", ""))
+        if self.path == "/lease":
+            job = coordinator.lease(worker, set(request.get("projects", [])), set(request.get("kinds", DISTRIBUTED_JOB_KINDS)))
+            self.send_json(200, {"job": job, "done": job is None and coordinator.is_done()})
+        elif self.path == "/heartbeat":
+            self.send_json(200, {"ok": coordinator.heartbeat(worker, request.get("job_id"), request.get("lines", []))})
+        elif self.path == "/complete":
+            self.send_json(200, {"ok": coordinator.complete(worker, request.get("job_id"), request)})
+        else:
+            self.send_json(404, {"error": "not found"})
+
+def check_coordinator_host(host):
+    """공유 토큰 없이 다른 장비에서 접속할 수 있는 주소로 코디네이터를 열지 않도록 확인합니다."""
+    import ipaddress
+    
+    if config.DISTRIBUTED_TOKEN or host == "localhost":
+        return True
+    try:
+        if ipaddress.ip_address(host).is_loopback:
+            return True
+    except ValueError:
+        pass
+    print(f"❌ 공유 토큰 없이 {host} 주소로 코디네이터를 열 수 없습니다. "
+          f"DANNECT_TOOLKIT_TOKEN을 설정하거나 DISTRIBUTED_HOST를 127.0.0.1로 지정하세요.")
+    return False
+
+@tracing.traced("stage")
+def run_build_coordinator(project_dirs, kinds, force=False, host=config.DISTRIBUTED_HOST, port=config.DISTRIBUTED_PORT):
+    """Unity 배치/빌드 작업을 워커들에게 배정하고 모든 작업이 끝날 때까지 기다립니다.
+    
+    반환값: {작업 종류: [(프로젝트명, 성공 여부)]}
+    """
+    project_dirs = [d for d in project_dirs if os.path.exists(d)]
+    kinds = [kind for kind in DISTRIBUTED_JOB_KINDS if kind in kinds]
+    if not check_coordinator_host(host):
+        return {kind: [(fileutil.get_project_name_from_path(d), False) for d in project_dirs] for kind in kinds}
+    coordinator = BuildCoordinator(project_dirs, kinds, force)
+    
+    server = http.server.ThreadingHTTPServer((host, port), CoordinatorRequestHandler)
+    server.daemon_threads = True
+    server.coordinator = coordinator
+    server_thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.5}, daemon=True)
+    server_thread.start()
+    
+    print(f"\n=== 분산 빌드 코디네이터 시작 (http://{host}:{server.server_address[1]}) ===")
+    print(f"📋 작업 {len(coordinator.jobs)}개 ({', '.join(kinds)}, {len(project_dirs)}개 프로젝트)")
+    print(f"🔐 인증: {'공유 토큰' if config.DISTRIBUTED_TOKEN else '없음 (DANNECT_TOOLKIT_TOKEN으로 설정)'}")
+    print(f"📝 작업 로그: {config.DISTRIBUTED_LOG_DIR}")
+    
+    started = time.time()
+    try:
+        while not coordinator.is_done():
+            if unity.cancel_event.wait(1):
+                break
+            coordinator.check_leases()
+        
+        # 대기 중인 워커가 종료 응답을 받을 수 있도록 잠시 더 응답한 뒤 종료
+        unity.cancel_event.wait(config.DISTRIBUTED_POLL_INTERVAL + 1)
+    finally:
+        server.shutdown()
+        server.server_close()
+    
+    logs.log_summary(f"\n=== 분산 빌드 결과 ({fileutil.format_duration(time.time() - started)}) ===")
+    for kind in kinds:
+        counts = collections.Counter(job["status"] for job in coordinator.jobs if job["kind"] == kind)
+        logs.log_summary(f"  {kind:<6} 성공 {counts['success']}개, 실패 {counts['failed']}개, 건너뜀 {counts['skipped'] + counts['queued'] + counts['leased']}개")
+    for job in coordinator.jobs:
+        if job["status"] == "failed":
+            logs.log_summary(f"  ❌ {job['project']}: {job['kind']} 실패 ({job['category']}), 로그: {coordinator.get_log_path(job)}")
+    
+    return {kind: coordinator.get_results(kind) for kind in kinds}
+
+def post_coordinator(url, path, data, timeout=30):
+    """코디네이터에 JSON 요청을 보내고 응답을 반환합니다."""
+    import urllib.request
+    
+    request = urllib.request.Request(
+        url.rstrip("/") + path,
+        data=json.dumps(data, ensure_ascii=False).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+        method="POST",
+    )
+    if config.DISTRIBUTED_TOKEN:
+        request.add_header(DISTRIBUTED_TOKEN_HEADER, config.DISTRIBUTED_TOKEN)
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        return json.loads(response.read().decode("utf-8"))
+
+def sync_project_revision(project_path, revision):
+    """워커의 프로젝트를 코디네이터가 작업을 만든 커밋으로 맞춥니다. (fast-forward만 허용)"""
+    if not revision:
+        return True
+    if not manifests.is_commit_hash(revision):
+        print(f"❌ 잘못된 커밋 해시: {revision}")
+        return False
+    
+    success, head, _ = gitops.run_git_command("git rev-parse HEAD", project_path)
+    if success and head == revision:
+        return True
+    
+    project_name = fileutil.get_project_name_from_path(project_path)
+    print(f"🔄 {project_name}: 코디네이터 커밋 {revision[:12]}로 동기화")
+    gitops.run_git_command("git fetch origin", project_path)
+    success, _, error = gitops.run_git_command(f"git merge --ff-only {revision}", project_path)
+    if not success:
+        print(f"❌ {project_name} 동기화 실패 (fast-forward 불가): {error}")
+    return success
+
+def collect_artifact_hashes(project_path):
+    """빌드 출력물 파일별 SHA-256을 {상대 경로: 해시}로 반환합니다."""
+    build_dir = os.path.join(project_path, config.BUILD_OUTPUT_DIR)
+    filepaths = [
+        os.path.join(root, filename)
+        for root, _, files in os.walk(build_dir)
+        for filename in files
+    ]
+    with ThreadPoolExecutor(max_workers=config.ARTIFACT_HASH_WORKERS) as executor:
+        hashes = list(executor.map(fileutil.hash_file, filepaths))
+    return {
+        os.path.relpath(filepath, build_dir).replace(os.sep, "/"): file_hash
+        for filepath, file_hash in zip(filepaths, hashes)
+    }
+
+def run_worker_job(job, project_path):
+    """임대받은 작업을 실행하고 코디네이터에 보낼 결과를 반환합니다."""
+    unity.unity_run_results.pop(project_path, None)
+    # 같은 프로젝트에서 커밋/변환 중인 로컬 실행 아래에서 HEAD를 옮기지 않도록 worktree 잠금 안에서 동기화
+    # (Unity 작업은 unity → worktree 순서로 다시 잡으므로 동기화가 끝나면 놓음)
+    with locks.project_lease(project_path, "worktree", "sync") as acquired:
+        if not acquired:
+            return {"success": False, "category": "project_locked"}
+        if not sync_project_revision(project_path, job.get("revision")):
+            return {"success": False, "category": "sync"}
+    
+    if job["kind"] == "batch":
+        unity.create_unity_batch_script(project_path)
+        success = unity.process_unity_project_batch(project_path)
+    else:
+        success = build_cache.build_webgl_project_cached(project_path, job.get("force", False))
+    
+    result = unity.unity_run_results.get(project_path)
+    return {
+        "success": success,
+        "category": None if success else unity.classify_unity_failure(result),
+        "unity_duration": result.duration if success and result else None,
+        "artifacts": collect_artifact_hashes(project_path) if success and job["kind"] == "build" else None,
+    }
+
+def run_leased_job(url, worker, job, project_path):
+    """작업을 실행하는 동안 하트비트로 임대를 유지하고 Unity 로그를 코디네이터로 보냅니다."""
+    lines = []
+    lines_lock = threading.Lock()
+    stop = threading.Event()
+    
+    def take_lines():
+        with lines_lock:
+            taken = lines[:]
+            del lines[:]
+        return taken
+    
+    def add_line(line):
+        with lines_lock:
+            lines.append(line)
+    
+    def send_heartbeats():
+        while not stop.wait(config.DISTRIBUTED_HEARTBEAT_INTERVAL):
+            taken = take_lines()
+            try:
+                response = post_coordinator(url, "/heartbeat", {"worker": worker, "job_id": job["id"], "lines": taken})
+                if not response.get("ok"):
+                    print(f"⚠️ {job['project']}: {job['kind']} 임대가 회수되었습니다 (결과는 무시됨)")
+            except (OSError, ValueError):
+                # 코디네이터에 닿지 않으면 로그를 다음 하트비트로 미룸
+                with lines_lock:
+                    lines[:0] = taken
+    
+    unity.unity_output_listeners[project_path] = add_line
+    heartbeat = threading.Thread(target=send_heartbeats, daemon=True)
+    heartbeat.start()
+    try:
+        report = run_worker_job(job, project_path)
+    except Exception as e:
+        print(f"❌ {job['project']}: {job['kind']} 예외 - {e}")
+        report = {"success": False, "category": "error"}
+    finally:
+        stop.set()
+        heartbeat.join()
+        unity.unity_output_listeners.pop(project_path, None)
+    
+    report.update(worker=worker, job_id=job["id"], lines=take_lines())
+    for attempt in range(3):
+        try:
+            post_coordinator(url, "/complete", report)
+            break
+        except (OSError, ValueError) as e:
+            print(f"⚠️ 결과 보고 실패 ({attempt + 1}/3): {e}")
+            unity.cancel_event.wait(config.DISTRIBUTED_POLL_INTERVAL)
+    return report["success"]
+
+def run_worker_slot(url, worker, projects, kinds):
+    """코디네이터에서 작업을 하나씩 임대받아 실행합니다. 모든 작업이 끝나거나 연결이 끊기면 종료합니다."""
+    names = sorted(projects)
+    last_contact = time.time()
+    completed = 0
+    while not unity.cancel_event.is_set():
+        try:
+            response = post_coordinator(url, "/lease", {"worker": worker, "projects": names, "kinds": kinds})
+            last_contact = time.time()
+        except (OSError, ValueError) as e:
+            if time.time() - last_contact > config.DISTRIBUTED_LEASE_TIMEOUT:
+                print(f"🔌 {worker}: 코디네이터 연결 끊김 ({e}), 종료")
+                break
+            unity.cancel_event.wait(config.DISTRIBUTED_POLL_INTERVAL)
+            continue
+        
+        job = response.get("job")
+        if job:
+            run_leased_job(url, worker, job, projects[job["project"]])
+            completed += 1
+        elif response.get("done"):
+            break
+        else:
+            unity.cancel_event.wait(config.DISTRIBUTED_POLL_INTERVAL)
+    return completed
+
+def run_build_worker(url, project_dirs, kinds=DISTRIBUTED_JOB_KINDS, slots=None, name=None):
+    """분산 빌드 워커를 실행합니다. 슬롯마다 코디네이터에서 작업을 받아 동시에 처리합니다."""
+    projects = {fileutil.get_project_name_from_path(d): d for d in project_dirs if os.path.exists(d)}
+    slots = slots or stage_pipeline.get_unity_slot_count()
+    name = name or f"{socket.gethostname()}-{os.getpid()}"
+    print(f"\n=== 분산 빌드 워커 시작: {name} ===")
+    print(f"🔗 코디네이터: {url}")
+    print(f"⚙️ 슬롯 {slots}개, 프로젝트 {len(projects)}개, 작업 종류: {', '.join(kinds)}")
+    
+    with ThreadPoolExecutor(max_workers=slots, thread_name_prefix="build-agent") as executor:
+        futures = [
+            executor.submit(run_worker_slot, url, f"{name}/{index + 1}", projects, list(kinds))
+            for index in range(slots)
+        ]
+        try:
+            completed = sum(future.result() for future in futures)
+        except KeyboardInterrupt:
+            unity.cancel_event.set()
+            raise
+    
+    print(f"\n=== 워커 종료: {name} (처리한 작업 {completed}개) ===")
+    return completed
+# endregion
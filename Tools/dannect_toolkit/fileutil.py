@@ -0,0 +1,98 @@
+"""공용 파일 유틸리티 (JSON/텍스트 저장, 해시, 크기/시간 표시)."""
+import os
+import json
+import hashlib
+import threading
+
+
+# =========================
+# #region 공용 파일 유틸리티
+# =========================
+def load_json_file(path, default):
+    """JSON 파일을 읽습니다. 파일이 없거나 손상된 경우 기본값을 반환합니다."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return default
+
+def save_json_file(path, data):
+    """JSON 파일을 임시 파일에 쓴 뒤 교체하여 원자적으로 저장합니다."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+def save_text_file(path, text):
+    """텍스트 파일을 임시 파일에 쓴 뒤 교체하여 원자적으로 저장합니다."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8", newline="\n") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+def write_file_if_changed(path, content):
+    """내용이 실제로 바뀐 경우에만 파일을 원자적으로 기록하고, 기록했는지 여부를 반환합니다.
+
+    같은 내용을 다시 쓰면 수정 시간만 바뀌어 Unity 재컴파일과 Git 변경이 생기므로 해시로 비교합니다.
+    """
+    data = content.replace("\n", os.linesep).encode("utf-8")
+    try:
+        if hash_file(path) == hashlib.sha256(data).hexdigest():
+            return False
+    except OSError:
+        pass
+    
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    return True
+
+def hash_file(filepath, chunk_size=1024 * 1024):
+    """파일 내용의 SHA-256 해시를 계산합니다. (큰 파일도 청크 단위로 읽음)"""
+    digest = hashlib.sha256()
+    with open(filepath, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def get_directory_size(path):
+    """폴더 내 모든 파일의 크기 합계(바이트)를 반환합니다."""
+    total = 0
+    for root, dirs, files in os.walk(path):
+        for file in files:
+            try:
+                total += os.path.getsize(os.path.join(root, file))
+            except OSError:
+                continue
+    return total
+
+def format_bytes(num_bytes):
+    """바이트 수를 사람이 읽기 쉬운 단위로 변환합니다."""
+    size = float(num_bytes)
+    for unit in ["B", "KB", "MB", "GB"]:
+        if abs(size) < 1024:
+            return f"{size:.1f} {unit}" if unit != "B" else f"{int(size)} B"
+        size /= 1024
+    return f"{size:.1f} TB"
+
+def get_project_name_from_path(project_path):
+    """프로젝트 경로에서 프로젝트명을 추출합니다."""
+    return os.path.basename(project_path.rstrip(os.sep))
+
+def format_duration(seconds):
+    """초 단위 시간을 '1시간 5분', '3분 20초' 형태로 변환합니다."""
+    seconds = int(round(seconds))
+    hours, remainder = divmod(seconds, 3600)
+    minutes, secs = divmod(remainder, 60)
+    if hours:
+        return f"{hours}시간 {minutes}분"
+    if minutes:
+        return f"{minutes}분 {secs}초"
+    return f"{secs}초"
+# endregion
@@ -0,0 +1,161 @@
+"""프로젝트 상태 요약 (브랜치, 변경, ahead/behind, 최근 커밋/빌드를 병렬 수집, 짧은 TTL 캐시)."""
+import os
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from . import config, fileutil, gitops
+
+
+# =========================
+# #region 프로젝트 상태 요약 (status 명령)
+# =========================
+# 프로젝트마다 Git 명령은 status(브랜치/업스트림/ahead·behind/변경 파일)와 log -1 두 번만 실행하고,
+# 여러 프로젝트를 동시에 조회합니다. 결과는 STATUS_CACHE_TTL 동안 재사용하되,
+# HEAD/index/원격 참조 파일이나 주요 폴더(파일 추가/삭제)의 수정 시각이 바뀐 프로젝트는 TTL 안이라도 다시 조회합니다.
+STATUS_SIGNATURE_FILES = (".git/HEAD", ".git/index", ".git/FETCH_HEAD", ".git/ORIG_HEAD", ".git/packed-refs",
+                          ".git/logs/HEAD", ".", "Assets", "Packages", "ProjectSettings")
+
+def get_status_signature(project_dir, upstream=None):
+    """상태가 바뀌면 달라지는 파일/폴더들의 수정 시각을 반환합니다. (.git이 폴더가 아니면 None)"""
+    if not os.path.isdir(os.path.join(project_dir, ".git")):
+        return None
+    names = list(STATUS_SIGNATURE_FILES)
+    if upstream:
+        names.append(".git/refs/remotes/" + upstream)
+    signature = []
+    for name in names:
+        try:
+            signature.append(os.stat(os.path.join(project_dir, *name.split("/"))).st_mtime_ns)
+        except OSError:
+            signature.append(0)
+    return signature
+
+def parse_porcelain_v2(output):
+    """git status --porcelain=v2 --branch 출력에서 브랜치, 업스트림, ahead/behind, 변경 파일 수를 읽습니다."""
+    info = {"branch": None, "upstream": None, "ahead": None, "behind": None, "changed": 0, "untracked": 0}
+    for line in output.splitlines():
+        if line.startswith("# branch.head "):
+            head = line[len("# branch.head "):]
+            info["branch"] = None if head == "(detached)" else head
+        elif line.startswith("# branch.upstream "):
+            info["upstream"] = line[len("# branch.upstream "):]
+        elif line.startswith("# branch.ab "):
+            ahead, behind = line.split()[2:4]
+            info["ahead"], info["behind"] = int(ahead), -int(behind)
+        elif line.startswith("? "):
+            info["untracked"] += 1
+        elif line and not line.startswith("#"):
+            info["changed"] += 1  # 1/2(변경, 이름 변경), u(충돌)
+    return info
+
+def collect_git_status(project_dir, fetch=False):
+    """프로젝트 하나의 Git 상태와 마지막 커밋을 조회합니다."""
+    if fetch:
+        gitops.run_git_command("git fetch --quiet", project_dir)
+    # 조회만 하므로 index 갱신/잠금을 하지 않음 (동시에 실행 중인 커밋 작업과 충돌 방지)
+    success, output, error = gitops.run_git_command("git --no-optional-locks status --porcelain=v2 --branch", project_dir)
+    if not success:
+        return {"error": error.splitlines()[0] if error else "git status 실패"}
+    info = parse_porcelain_v2(output)
+    info["last_commit"] = None
+    success, output, _ = gitops.run_git_command('git log -1 "--format=%h %ct %s"', project_dir)
+    if success and output:
+        sha, committed, subject = (output.split(" ", 2) + [""])[:3]
+        info["last_commit"] = {"sha": sha, "time": int(committed), "subject": subject}
+    return info
+
+def collect_fleet_status(project_dirs, refresh=False, fetch=False, max_workers=config.STATUS_WORKERS):
+    """모든 프로젝트의 상태를 동시에 조회합니다. 캐시가 유효한 프로젝트는 Git 명령을 실행하지 않습니다."""
+    from . import run_history
+    
+    now = time.time()
+    cache = {
+        path: cached for path, cached in fileutil.load_json_file(config.STATUS_CACHE_PATH, {}).items()
+        if now - cached["time"] < config.STATUS_CACHE_TTL
+    }
+    use_cache = not (refresh or fetch)
+    
+    def collect(project_dir):
+        path = os.path.abspath(project_dir)
+        entry = {"project": fileutil.get_project_name_from_path(project_dir), "path": path}
+        if not os.path.isdir(project_dir):
+            entry["error"] = "폴더 없음"
+            return entry, None
+        if not gitops.is_git_repository(project_dir):
+            entry["error"] = "Git 저장소 아님"
+            return entry, None
+        
+        cached = cache.get(path) if use_cache else None
+        if cached and cached["signature"] == get_status_signature(project_dir, cached["git"].get("upstream")):
+            entry.update(cached["git"], cached=True)
+            return entry, cached
+        
+        git_info = collect_git_status(project_dir, fetch)
+        entry.update(git_info, cached=False)
+        if "error" in git_info:
+            return entry, None
+        return entry, {"time": now, "signature": get_status_signature(project_dir, git_info.get("upstream")), "git": git_info}
+    
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="status") as executor:
+        results = list(executor.map(collect, project_dirs))
+    
+    # --project로 일부만 조회한 경우에도 다른 프로젝트의 캐시는 유지
+    cache.update((entry["path"], cache_entry) for entry, cache_entry in results if cache_entry and cache_entry["signature"])
+    fileutil.save_json_file(config.STATUS_CACHE_PATH, cache)
+    
+    last_builds = run_history.get_latest_stage_results("build")
+    entries = []
+    for entry, _ in results:
+        entry["last_build"] = last_builds.get(entry["project"])
+        entries.append(entry)
+    return entries
+
+def format_age(timestamp, now):
+    """시각을 '3분 전' 형태로 변환합니다."""
+    return f"{fileutil.format_duration(max(0, now - timestamp))} 전"
+
+def print_fleet_status(entries, elapsed):
+    """프로젝트 상태를 한 줄씩 표로 출력합니다."""
+    now = time.time()
+    name_width = max([len(entry["project"]) for entry in entries] + [8])
+    print(f"{'프로젝트':<{name_width}}  {'브랜치':<16} {'변경':<9} {'동기화':<9} {'최근 커밋':<34} 최근 빌드")
+    for entry in entries:
+        if "error" in entry:
+            print(f"{entry['project']:<{name_width}}  ({entry['error']})")
+            continue
+        changes = " ".join(text for text in (
+            f"M{entry['changed']}" if entry["changed"] else "",
+            f"?{entry['untracked']}" if entry["untracked"] else "",
+        ) if text) or "깨끗함"
+        if entry["upstream"] is None:
+            sync = "업스트림 없음"
+        elif entry["ahead"] or entry["behind"]:
+            sync = f"↑{entry['ahead']} ↓{entry['behind']}"
+        else:
+            sync = "최신"
+        commit = entry["last_commit"]
+        commit_text = f"{commit['sha']} {format_age(commit['time'], now)} {commit['subject']}"[:34] if commit else "-"
+        build = entry["last_build"]
+        build_text = f"{build['outcome']} ({format_age(build['ended'], now)})" if build else "-"
+        print(f"{entry['project']:<{name_width}}  {entry['branch'] or '(detached)':<16} {changes:<9} {sync:<9} "
+              f"{commit_text:<34} {build_text}")
+    
+    dirty = sum(1 for entry in entries if entry.get("changed") or entry.get("untracked"))
+    ahead = sum(1 for entry in entries if entry.get("ahead"))
+    behind = sum(1 for entry in entries if entry.get("behind"))
+    failed = sum(1 for entry in entries if entry.get("last_build") and entry["last_build"]["outcome"] not in ("success", "cache_hit"))
+    cached = sum(1 for entry in entries if entry.get("cached"))
+    print(f"\n프로젝트 {len(entries)}개: 변경 있음 {dirty}, 푸시 안 됨 {ahead}, 뒤처짐 {behind}, 최근 빌드 실패 {failed} "
+          f"(조회 {elapsed:.2f}초, 캐시 사용 {cached}개)")
+
+def show_fleet_status(project_dirs, as_json=False, refresh=False, fetch=False):
+    """프로젝트 상태를 표 또는 JSON으로 출력합니다."""
+    started = time.perf_counter()
+    entries = collect_fleet_status(project_dirs, refresh=refresh, fetch=fetch)
+    if as_json:
+        print(json.dumps(entries, ensure_ascii=False, indent=2))
+    else:
+        print_fleet_status(entries, time.perf_counter() - started)
+    return entries
+# endregion
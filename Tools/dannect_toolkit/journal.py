@@ -0,0 +1,206 @@
+"""실행 저널 (프로젝트/단계 완료 기록, --resume)."""
+import os
+import json
+import functools
+import hashlib
+import threading
+import time
+
+from . import config, fileutil
+
+
+# =========================
+# #region 실행 저널 (프로젝트/단계 완료 기록, --resume)
+# =========================
+# 단계가 성공할 때마다 완료 직후 상태의 fingerprint를 JSONL 한 줄로 추가하고(--resume 여부와 관계없이 항상 기록,
+# 중간에 죽은 실행도 이어서 실행할 수 있게 함), --resume이면 기록된 fingerprint와 현재 상태가 같은 단계는 다시 실행하지 않습니다.
+# fingerprint는 이미 계산해 둔 값을 재사용합니다: C# 파일 해시는 실행 안에서 (크기, 수정 시각)으로 기억하고,
+# 배치/빌드는 빌드 캐시의 파일 해시 캐시를 쓰는 빌드 fingerprint, Git은 HEAD와 작업 트리 상태만 읽습니다.
+# 한 줄을 O_APPEND 쓰기 한 번으로 기록하고 fsync하므로 병렬 작업이나 여러 프로세스가 함께 써도 줄이 섞이지 않고,
+# 비정상 종료로 잘린 마지막 줄은 읽을 때 무시합니다.
+# 툴킷이 Unity 실행 직전에 만드는 에디터 스크립트는 앞 단계(소스 수정, Git)의 입력으로 보지 않습니다.
+JOURNAL_IGNORED_PATHS = ("Assets/Editor/BatchScripts/", "Assets/Editor/AutoWebGLBuildScript.cs")
+
+_journal_state = {"resume": False, "completed": {}, "run": os.urandom(6).hex(), "skipped": 0, "tail_checked": False,
+                  "file_hashes": {}}  # 파일 경로 → (크기, 수정 시각, 해시), 같은 실행에서 바뀌지 않은 파일은 다시 읽지 않음
+_journal_lock = threading.Lock()
+
+def load_run_journal():
+    """저널에서 (프로젝트 경로, 단계)별 마지막 완료 기록과 전체 줄 수를 읽습니다."""
+    completed = {}
+    lines = 0
+    try:
+        with open(config.RUN_JOURNAL_PATH, "r", encoding="utf-8") as f:
+            for line in f:
+                lines += 1
+                try:
+                    record = json.loads(line)
+                    completed[(record["project"], record["stage"])] = record
+                except (ValueError, KeyError, TypeError):
+                    continue  # 비정상 종료로 잘린 줄
+    except OSError:
+        pass
+    return completed, lines
+
+def repair_journal_tail():
+    """비정상 종료로 줄바꿈 없이 끝난 마지막 줄을 닫아, 다음 기록이 잘린 줄에 이어 붙지 않게 합니다. (lock 안에서 호출)"""
+    _journal_state["tail_checked"] = True
+    try:
+        with open(config.RUN_JOURNAL_PATH, "rb+") as f:
+            f.seek(0, os.SEEK_END)
+            if f.tell() == 0:
+                return
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                f.seek(0, os.SEEK_END)
+                f.write(b"\n")
+    except FileNotFoundError:
+        pass
+
+def journal_start(resume=False):
+    """저널을 읽어 둡니다. 기록이 RUN_JOURNAL_MAX_RECORDS를 넘으면 단계별 마지막 기록만 남깁니다."""
+    completed, lines = load_run_journal()
+    if lines > config.RUN_JOURNAL_MAX_RECORDS:
+        # 정리 중 다른 프로세스가 추가한 줄은 사라질 수 있으나, 그 단계는 다음 --resume에서 다시 실행될 뿐입니다.
+        fileutil.save_text_file(config.RUN_JOURNAL_PATH, "".join(
+            json.dumps(record, ensure_ascii=False) + "\n" for record in completed.values()
+        ))
+    _journal_state.update(resume=resume, completed=completed, skipped=0, file_hashes={})
+    if resume:
+        print(f"⏩ 이어서 실행: 저널의 완료 기록 {len(completed)}개 중 입력이 같은 단계는 건너뜁니다")
+
+def append_journal_record(project_dir, stage, fingerprint):
+    """단계 완료 기록을 저널 끝에 한 줄로 추가합니다."""
+    record = {
+        "run": _journal_state["run"],
+        "project": os.path.abspath(project_dir),
+        "stage": stage,
+        "fingerprint": fingerprint,
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+    data = (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+    with _journal_lock:
+        _journal_state["completed"][(record["project"], stage)] = record
+        os.makedirs(os.path.dirname(config.RUN_JOURNAL_PATH), exist_ok=True)
+        if not _journal_state["tail_checked"]:
+            repair_journal_tail()
+        fd = os.open(config.RUN_JOURNAL_PATH, os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0), 0o644)
+        try:
+            os.write(fd, data)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+def get_git_state_fingerprint(project_dir):
+    """HEAD, 업스트림 커밋, 작업 트리 변경 내용으로 Git 단계 fingerprint를 계산합니다."""
+    from . import gitops
+    
+    _, head, _ = gitops.run_git_command("git rev-parse HEAD", project_dir)
+    _, upstream, _ = gitops.run_git_command('git rev-parse "@{u}"', project_dir)
+    _, status, _ = gitops.run_git_command("git status --porcelain --untracked-files=all", project_dir)
+    changes = [line for line in status.splitlines() if not line[3:].strip('"').startswith(JOURNAL_IGNORED_PATHS)]
+    state = "\n".join([head, upstream] + changes)
+    return hashlib.sha256(state.encode("utf-8")).hexdigest()
+
+def hash_source_file(filepath):
+    """파일 해시를 반환합니다. 크기와 수정 시각이 이전에 계산할 때와 같으면 다시 읽지 않습니다. (읽을 수 없으면 "unreadable")"""
+    try:
+        stat = os.stat(filepath)
+    except OSError:
+        return "unreadable"  # 깨진 링크 등은 단계에서 이미 실패로 출력했으므로 기록만 다르게 남김
+    cached = _journal_state["file_hashes"].get(filepath)
+    if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+        return cached[2]
+    try:
+        file_hash = fileutil.hash_file(filepath)
+    except OSError:
+        return "unreadable"
+    _journal_state["file_hashes"][filepath] = (stat.st_size, stat.st_mtime_ns, file_hash)
+    return file_hash
+
+def hash_project_sources(project_dir):
+    """Assets 폴더 C# 파일들의 경로와 내용으로 fingerprint를 계산합니다."""
+    digest = hashlib.sha256()
+    for root, dirs, files in os.walk(os.path.join(project_dir, "Assets")):
+        dirs.sort()
+        for file in sorted(files):
+            if file.endswith(".cs"):
+                filepath = os.path.join(root, file)
+                relative_path = os.path.relpath(filepath, project_dir).replace(os.sep, "/")
+                if not relative_path.startswith(JOURNAL_IGNORED_PATHS):
+                    digest.update(f"{relative_path}\0{hash_source_file(filepath)}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+def compute_stage_fingerprint(project_dir, stage, args=()):
+    """단계 완료 여부를 판단할 fingerprint를 단계가 읽고 쓰는 입력만으로 계산합니다.
+
+    convert/fix: C# 소스 (fix는 교체 규칙 버전 포함), manifest: manifest.json/packages-lock.json과 편집 인수,
+    git: 저장소 상태, batch/build: 빌드 입력 fingerprint (build는 출력물 유무 포함)
+    """
+    from . import build_cache, sources
+    
+    if stage == "git":
+        return get_git_state_fingerprint(project_dir)
+    
+    digest = hashlib.sha256()
+    if stage in ("convert", "fix"):
+        digest.update(hash_project_sources(project_dir).encode("utf-8"))
+        if stage == "fix":
+            # 교체 규칙이 바뀌면 다시 실행
+            digest.update(f"rules {sources.FIX_RULES_VERSION}".encode("utf-8"))
+    elif stage == "manifest":
+        for filename in ("manifest.json", "packages-lock.json"):
+            filepath = os.path.join(project_dir, "Packages", filename)
+            digest.update((fileutil.hash_file(filepath) if os.path.exists(filepath) else "missing").encode("utf-8"))
+        digest.update(json.dumps(args, sort_keys=True, default=str).encode("utf-8"))
+    else:
+        digest.update(build_cache.compute_build_fingerprint(project_dir).encode("utf-8"))
+        if stage == "build":
+            digest.update(b"output" if os.path.isdir(os.path.join(project_dir, config.BUILD_OUTPUT_DIR)) else b"no output")
+    return digest.hexdigest()
+
+def is_stage_journaled(project_dir, stage, fingerprint):
+    """저널(이번 실행에서 추가한 기록 포함)에 같은 fingerprint로 완료된 단계인지 확인합니다."""
+    record = _journal_state["completed"].get((os.path.abspath(project_dir), stage))
+    return bool(record) and record["fingerprint"] == fingerprint
+
+def journaled(stage, skipped, succeeded=None, refreshes=(), forced=None):
+    """단계 완료를 저널에 기록하고, --resume이면 입력이 같은 완료 단계를 건너뛰는 데코레이터입니다.
+    
+    skipped는 건너뛸 때 반환할 값(완료된 단계의 성공 값), succeeded는 반환값으로 성공 여부를 판단하는 함수입니다.
+    forced는 프로젝트 경로 뒤의 인수를 받아 명시적으로 다시 실행을 요청했는지(--force) 판단하는 함수이며,
+    요청한 경우 완료 기록이 있어도 건너뛰지 않습니다.
+    refreshes는 앞 단계의 결과를 유지한 채 그 입력을 바꾸는 경우 지정하며, 실행 전에 완료 상태였던 앞 단계는
+    완료 기록을 새 fingerprint로 다시 남깁니다. (예: Unity 6 API 수정은 C# 파일을 바꾸지만 UTF-8 변환 결과는 유지)
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(project_dir, *args, **kwargs):
+            if not config.RUN_JOURNAL_ENABLED or not os.path.isdir(project_dir):
+                return func(project_dir, *args, **kwargs)
+            
+            if _journal_state["resume"] and not (forced and forced(*args, **kwargs)) and is_stage_journaled(
+                    project_dir, stage, compute_stage_fingerprint(project_dir, stage, [args, kwargs])):
+                with _journal_lock:
+                    _journal_state["skipped"] += 1
+                print(f"⏩ {fileutil.get_project_name_from_path(project_dir)}: {stage} 이전 실행에서 완료됨 (입력 동일), 건너뜀")
+                return skipped
+            
+            completed_before = [
+                previous for previous in refreshes
+                if is_stage_journaled(project_dir, previous, compute_stage_fingerprint(project_dir, previous))
+            ]
+            result = func(project_dir, *args, **kwargs)
+            if succeeded is None or succeeded(result):
+                append_journal_record(project_dir, stage, compute_stage_fingerprint(project_dir, stage, [args, kwargs]))
+                for previous in completed_before:
+                    append_journal_record(project_dir, previous, compute_stage_fingerprint(project_dir, previous))
+            return result
+        return wrapper
+    return decorator
+
+def journal_finish():
+    """--resume 실행에서 건너뛴 단계 수를 출력합니다."""
+    if _journal_state["resume"]:
+        print(f"⏩ 저널 기준으로 건너뛴 단계: {_journal_state['skipped']}개")
+# endregion
@@ -0,0 +1,249 @@
+"""프로젝트 잠금 (프로세스 간 임대 잠금, .git/dannect-locks)."""
+import os
+import json
+import contextlib
+import functools
+import sys
+import threading
+import time
+
+from . import config, fileutil
+
+
+# =========================
+# #region 프로젝트 잠금 (프로세스 간 임대 잠금, .git/dannect-locks)
+# =========================
+# 동시에 실행된 툴킷(다른 작업자, cron)이 같은 프로젝트에서 checkout/커밋이나 Unity를 겹쳐 실행하지 않도록
+# 프로젝트와 자원별로 잠금 파일을 둡니다. 잠금 파일에는 PID, 호스트, 만료 시각을 기록하고,
+# 같은 호스트에서 PID가 종료되었거나 만료 시각이 지나면(다른 호스트) 버려진 잠금으로 보고 가져옵니다.
+#
+#   worktree  소스 변환, Unity 6 API 수정, manifest 편집 (로컬 미러 적용 포함), Git 커밋/푸시, 분산 워커의 커밋 동기화
+#   unity     Unity 배치 모드, WebGL 빌드 (빌드 캐시 복원 포함)
+#
+# Unity는 실행 중 프로젝트 파일을 읽고 쓰므로 worktree 잠금도 함께 잡아, 다른 실행의 checkout/커밋이
+# Unity 작업 아래에서 진행되지 않게 합니다. (항상 unity → worktree 순서로 잡으므로 교착 없음)
+LEASE_RESOURCES = {"unity": ("unity", "worktree")}
+_lease_state = {"wait": config.LOCK_WAIT_TIMEOUT, "held": {}, "renewer": None}
+_lease_lock = threading.Lock()
+_lease_released = threading.Condition(_lease_lock)  # 이 프로세스의 다른 스레드가 잠금을 놓을 때 알림
+
+def set_lease_wait_timeout(seconds):
+    """잠긴 프로젝트를 기다릴 최대 시간을 지정합니다. (0이면 기다리지 않고 건너뜀)"""
+    _lease_state["wait"] = seconds
+
+def get_project_lock_dir(project_dir):
+    """프로젝트 잠금 폴더 경로를 반환합니다. (Git 저장소가 아니면 Library 폴더 사용, Temp는 Unity가 지움)"""
+    git_dir = os.path.join(project_dir, ".git")
+    if os.path.isdir(git_dir):
+        return os.path.join(git_dir, "dannect-locks")
+    return os.path.join(project_dir, "Library", "dannect-locks")
+
+def is_process_alive(pid):
+    """같은 호스트의 프로세스가 실행 중인지 확인합니다."""
+    if os.name == "nt":
+        import ctypes
+        
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.OpenProcess(0x1000, False, pid)  # PROCESS_QUERY_LIMITED_INFORMATION
+        if not handle:
+            return False
+        exit_code = ctypes.c_ulong()
+        kernel32.GetExitCodeProcess(handle, ctypes.byref(exit_code))
+        kernel32.CloseHandle(handle)
+        return exit_code.value == 259  # STILL_ACTIVE
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+def read_lease_file(lock_path):
+    """잠금 파일 내용을 그대로 읽습니다. 없으면 None."""
+    try:
+        with open(lock_path, "rb") as f:
+            return f.read()
+    except OSError:
+        return None
+
+def is_lease_stale(lock_path, content):
+    """읽어 둔 잠금 파일 내용으로 소유 프로세스가 종료되었거나 갱신이 끊겼는지 확인합니다."""
+    import socket
+    
+    try:
+        info = json.loads(content.decode("utf-8"))
+    except ValueError:
+        info = None
+    if not isinstance(info, dict):
+        # 쓰는 중이거나 손상된 잠금은 파일 시각 기준으로만 판단
+        try:
+            return time.time() - os.path.getmtime(lock_path) > config.LOCK_LEASE_TIMEOUT
+        except OSError:
+            return True
+    if info.get("expires", 0) < time.time():
+        return True
+    return info.get("host") == socket.gethostname() and not is_process_alive(info.get("pid", 0))
+
+def describe_lease(lock_path):
+    """잠금 소유자를 '호스트 PID 12345 (build, 3분 전부터)' 형태로 반환합니다."""
+    info = fileutil.load_json_file(lock_path, None)
+    if not info:
+        return "알 수 없음"
+    return (f"{info.get('host')} PID {info.get('pid')} ({info.get('stage')}, "
+            f"{fileutil.format_duration(time.time() - info.get('started', time.time()))} 전부터)")
+
+def write_lease_file(lock_path, info, create=False):
+    """잠금 파일을 기록합니다. create=True면 이미 있을 때 FileExistsError가 발생합니다."""
+    info["expires"] = time.time() + config.LOCK_LEASE_TIMEOUT
+    if not create:
+        fileutil.save_json_file(lock_path, info)
+        return
+    fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(info, f, ensure_ascii=False)
+
+def take_over_stale_lease(lock_path, content):
+    """버려진 잠금 파일을 치웁니다. 치웠거나 이미 없으면 True를 반환합니다.
+    
+    두 실행이 동시에 같은 잠금을 버려진 것으로 판단할 수 있으므로 바로 지우지 않고 고유한 이름으로 옮긴 뒤,
+    옮긴 파일이 판단할 때 읽은 내용과 같을 때만 지웁니다. 그 사이 다른 실행이 새로 잡은 잠금이면 되돌려 놓습니다.
+    """
+    stale_path = f"{lock_path}.{os.getpid()}.{threading.get_ident()}.stale"
+    try:
+        os.rename(lock_path, stale_path)
+    except FileNotFoundError:
+        return True
+    if read_lease_file(stale_path) == content:
+        os.remove(stale_path)
+        return True
+    try:
+        os.link(stale_path, lock_path)
+    except OSError:
+        pass  # 그 사이 또 다른 실행이 잠금을 만들었으면 그 잠금을 유지
+    os.remove(stale_path)
+    return False
+
+def try_acquire_lease(lock_path, stage):
+    """잠금을 한 번 시도합니다. 이 프로세스의 같은 스레드가 이미 가진 잠금이면 중첩하여 획득합니다.
+    
+    이 프로세스의 다른 스레드(파이프라인의 다른 단계)가 가진 잠금이면 건너뛰지 않고 놓을 때까지 기다립니다.
+    """
+    import socket
+    from . import unity
+    
+    with _lease_released:
+        held = _lease_state["held"].get(lock_path)
+        while held and held["thread"] != threading.get_ident():
+            if unity.cancel_event.is_set():
+                return False
+            _lease_released.wait(1)
+            held = _lease_state["held"].get(lock_path)
+        if held:
+            held["count"] += 1
+            return True
+        
+        info = {"pid": os.getpid(), "host": socket.gethostname(), "stage": stage,
+                "started": time.time(), "command": " ".join(sys.argv[1:])}
+        for _ in range(2):
+            try:
+                write_lease_file(lock_path, info, create=True)
+                break
+            except FileExistsError:
+                content = read_lease_file(lock_path)
+                if content is None:
+                    continue  # 그 사이 소유자가 놓음
+                if not is_lease_stale(lock_path, content):
+                    return False
+                print(f"🔓 버려진 잠금 정리: {lock_path} ({describe_lease(lock_path)})")
+                if not take_over_stale_lease(lock_path, content):
+                    return False
+        else:
+            return False
+        
+        _lease_state["held"][lock_path] = {"thread": threading.get_ident(), "count": 1, "info": info}
+        if not _lease_state["renewer"]:
+            _lease_state["renewer"] = threading.Thread(target=renew_leases, daemon=True, name="lease-renewer")
+            _lease_state["renewer"].start()
+        return True
+
+def release_lease(lock_path):
+    """잠금을 놓습니다. 중첩하여 잡은 경우 마지막으로 놓을 때 잠금 파일을 삭제합니다."""
+    with _lease_lock:
+        held = _lease_state["held"][lock_path]
+        held["count"] -= 1
+        if held["count"] > 0:
+            return
+        del _lease_state["held"][lock_path]
+        try:
+            os.remove(lock_path)
+        except FileNotFoundError:
+            pass
+        _lease_released.notify_all()
+
+def renew_leases():
+    """이 프로세스가 가진 잠금의 만료 시각을 주기적으로 연장합니다. (긴 빌드 중 만료 방지)"""
+    while True:
+        time.sleep(config.LOCK_RENEW_INTERVAL)
+        with _lease_lock:
+            for lock_path, held in _lease_state["held"].items():
+                try:
+                    write_lease_file(lock_path, held["info"])
+                except OSError as e:
+                    print(f"⚠️ 잠금 갱신 실패: {lock_path} ({e})")
+
+@contextlib.contextmanager
+def project_lease(project_dir, resource, stage=None):
+    """프로젝트 자원 잠금을 잡습니다. 잡지 못하면 False를 넘깁니다. (with project_lease(...) as acquired)
+    
+    다른 실행이 잡고 있으면 set_lease_wait_timeout으로 지정한 시간까지 기다립니다.
+    """
+    from . import unity
+    
+    if not config.LOCK_ENABLED or not os.path.isdir(project_dir):
+        yield True
+        return
+    
+    lock_dir = get_project_lock_dir(project_dir)
+    os.makedirs(lock_dir, exist_ok=True)
+    lock_path = os.path.join(lock_dir, f"{resource}.lock")
+    deadline = time.time() + _lease_state["wait"]
+    acquired = try_acquire_lease(lock_path, stage or resource)
+    if not acquired and _lease_state["wait"] > 0:
+        print(f"⏳ {fileutil.get_project_name_from_path(project_dir)}: {resource} 잠금 대기 ({describe_lease(lock_path)})")
+        while not acquired and time.time() < deadline and not unity.cancel_event.is_set():
+            unity.cancel_event.wait(config.LOCK_POLL_INTERVAL)
+            acquired = try_acquire_lease(lock_path, stage or resource)
+    if not acquired:
+        print(f"🔒 {fileutil.get_project_name_from_path(project_dir)}: 다른 실행이 {resource} 사용 중, 건너뜀 ({describe_lease(lock_path)})")
+        yield False
+        return
+    try:
+        yield True
+    finally:
+        release_lease(lock_path)
+
+def leased(resource, skipped=False):
+    """첫 번째 인수(프로젝트 경로)의 자원 잠금을 잡고 함수를 실행하는 데코레이터입니다.
+    
+    잠금을 잡지 못하면 함수를 실행하지 않고 skipped를 반환합니다.
+    Unity 자원이면 일시적 실패(project_locked)로 기록하여 기존 재시도 로직이 처리하도록 합니다.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(project_dir, *args, **kwargs):
+            from . import unity
+            
+            with contextlib.ExitStack() as stack:
+                acquired = all(
+                    stack.enter_context(project_lease(project_dir, name, func.__name__))
+                    for name in LEASE_RESOURCES.get(resource, (resource,))
+                )
+                if acquired:
+                    return func(project_dir, *args, **kwargs)
+            if resource == "unity":
+                unity.unity_run_results[project_dir] = unity.UnityRunResult(None, "", "locked", 0.0)
+            return skipped
+        return wrapper
+    return decorator
+# endregion
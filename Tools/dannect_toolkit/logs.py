@@ -0,0 +1,156 @@
+"""로그 출력 (레벨, 프로젝트별 버퍼, 요약만 출력하는 quiet 모드와 JSON 모드)."""
+import sys
+import json
+import time
+import contextlib
+import threading
+
+from . import config, fileutil
+
+
+# =========================
+# #region 로그 출력 (레벨, 프로젝트별 버퍼, quiet/JSON 모드)
+# =========================
+# log_start는 sys.stdout을 바꿔 끼워 기존 print 출력도 줄 단위로 모은 뒤 레벨을 붙여 처리합니다.
+# 프로젝트 단계(run_history.record_stage) 안에서 나온 줄은 스레드별 버퍼에 쌓았다가 한 번에 출력하므로
+# 병렬 실행 중에도 한 프로젝트의 출력이 다른 프로젝트의 출력과 섞이지 않습니다.
+# summary는 quiet 모드에서도 출력되는 실행 요약 전용 레벨입니다.
+LOG_LEVELS = {"debug": 10, "info": 20, "warning": 30, "error": 40, "summary": 50}
+LOG_LEVEL_PREFIXES = (("❌", "error"), ("⛔", "error"), ("⚠", "warning"))  # print 출력의 레벨 추정 (줄 앞 기호)
+
+_log_state = {"started": False, "stream": None, "threshold": LOG_LEVELS["info"], "format": "text", "last_key": None}
+_log_lock = threading.Lock()
+_log_local = threading.local()
+_log_pending = {}  # 스레드 ident → 아직 줄바꿈이 오지 않은 출력 (log_finish가 모든 스레드의 것을 내보냄)
+
+class _ConsoleStream:
+    """sys.stdout 대신 사용하는 스트림입니다. 스레드별로 줄을 완성한 뒤 레벨을 추정해 log_emit으로 넘깁니다."""
+    def __init__(self, stream):
+        self.stream = stream
+    
+    def write(self, text):
+        ident = threading.get_ident()
+        with _log_lock:
+            *lines, pending = (_log_pending.pop(ident, "") + text).split("\n")
+            if pending:
+                _log_pending[ident] = pending
+        for line in lines:
+            log_emit(guess_log_level(line), line)
+        return len(text)
+    
+    def flush(self):
+        self.stream.flush()
+    
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+def guess_log_level(line):
+    """print로 출력된 줄의 앞 기호로 레벨을 추정합니다. (❌ 오류, ⚠️ 경고, 나머지 info)"""
+    stripped = line.lstrip()
+    for prefix, level in LOG_LEVEL_PREFIXES:
+        if stripped.startswith(prefix):
+            return level
+    return "info"
+
+def log_start(level=None, log_format=None):
+    """로그 출력을 시작합니다. 레벨/형식을 지정하지 않으면 LOG_LEVEL, LOG_FORMAT 설정을 사용합니다."""
+    log_format = log_format or config.LOG_FORMAT
+    threshold = LOG_LEVELS[level or config.LOG_LEVEL]
+    if log_format == "quiet":
+        threshold = max(threshold, LOG_LEVELS["error"])
+    if not _log_state["started"]:
+        _log_state.update(started=True, stream=sys.stdout)
+        sys.stdout = _ConsoleStream(sys.stdout)
+    _log_state.update(threshold=threshold, format=log_format, last_key=None)
+
+def log_finish():
+    """모든 스레드에서 줄바꿈 없이 남은 출력을 내보내고 sys.stdout을 원래대로 되돌립니다."""
+    if not _log_state["started"]:
+        return
+    with _log_lock:
+        pending = list(_log_pending.values())
+        _log_pending.clear()
+    for text in pending:
+        log_emit(guess_log_level(text), text)
+    sys.stdout = _log_state["stream"]
+    _log_state.update(started=False, stream=None)
+    sys.stdout.flush()
+
+def write_log_records(records, project=None, stage=None, continued=False):
+    """레코드 묶음을 문자열 하나로 만들어 잠금 안에서 한 번에 출력합니다."""
+    if _log_state["format"] == "json":
+        lines = [
+            json.dumps({"time": round(logged, 3), "level": level, "project": project, "stage": stage,
+                        "message": message.strip("\n")}, ensure_ascii=False)
+            for logged, level, message in records if message.strip()
+        ]
+    else:
+        lines = [message for _, _, message in records]
+    if not lines:
+        return
+    key = (project, stage) if project else None
+    with _log_lock:
+        # 중간에 내보낸 프로젝트 버퍼 사이에 다른 출력이 끼었으면 어느 프로젝트의 출력인지 다시 표시
+        if continued and key != _log_state["last_key"] and _log_state["format"] != "json":
+            lines.insert(0, f"── {project} ({stage}) 계속 ──")
+        _log_state["last_key"] = key
+        (_log_state["stream"] or sys.stdout).write("\n".join(lines) + "\n")
+
+def flush_project_log():
+    """현재 스레드의 프로젝트 버퍼를 한 번에 출력합니다."""
+    buffer = _log_local.buffer
+    if buffer:
+        write_log_records(buffer, _log_local.project, _log_local.stage, _log_local.continued)
+        _log_local.continued = True
+        del buffer[:]
+
+def log_emit(level, message):
+    """설정한 레벨 이상이면 프로젝트 단계 안에서는 버퍼에 쌓고, 밖에서는 바로 출력합니다."""
+    threshold = _log_state["threshold"] if _log_state["started"] else LOG_LEVELS[config.LOG_LEVEL]
+    if LOG_LEVELS[level] < threshold:
+        return
+    record = (time.time(), level, message)
+    buffer = getattr(_log_local, "buffer", None)
+    if buffer is None:
+        write_log_records([record])
+        return
+    buffer.append(record)
+    if len(buffer) >= config.LOG_BUFFER_LINES or record[0] - buffer[0][0] >= config.LOG_BUFFER_SECONDS:
+        flush_project_log()
+
+def log_debug(message):
+    """파일별 처리 결과처럼 많고 자세한 출력 (LOG_LEVEL = "debug"일 때만 출력)"""
+    log_emit("debug", message)
+
+def log_info(message):
+    log_emit("info", message)
+
+def log_warning(message):
+    log_emit("warning", message)
+
+def log_error(message):
+    log_emit("error", message)
+
+def log_summary(message):
+    """실행 결과 요약 (quiet 모드에서도 출력)"""
+    log_emit("summary", message)
+
+@contextlib.contextmanager
+def project_log(project_dir, stage):
+    """with 블록 안에서 현재 스레드가 출력한 줄을 프로젝트 버퍼에 모았다가 끝날 때 한 번에 출력합니다.
+
+    로그 출력을 시작하지 않았거나 이미 다른 프로젝트 버퍼 안이면 그대로 출력합니다.
+    """
+    if not _log_state["started"] or getattr(_log_local, "buffer", None) is not None:
+        yield
+        return
+    _log_local.buffer = []
+    _log_local.project = fileutil.get_project_name_from_path(project_dir)
+    _log_local.stage = stage
+    _log_local.continued = False
+    try:
+        yield
+    finally:
+        flush_project_log()
+        _log_local.buffer = None
+# endregion
@@ -0,0 +1,443 @@
+"""Git 패키지 추가 (서식을 유지하는 manifest.json/packages-lock.json 편집)."""
+import os
+import json
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from . import config, fileutil, gitops, journal, locks, mirror, run_history, tracing, unity
+
+
+# =========================
+# #region Git 패키지 추가 함수 (서식을 유지하는 manifest 편집)
+# =========================
+def parse_json_layout(text):
+    """JSON 텍스트에서 각 값의 위치를 담은 트리를 반환합니다. (서식을 유지한 채 부분만 고치기 위함)
+
+    노드: {"type": "object" | "array" | "value", "start", "end", "entries": [(키 또는 None, 시작 위치, 값 노드)]}
+    올바른 JSON만 넘겨야 합니다. (호출 전에 json.loads로 검사)
+    """
+    def skip_whitespace(i):
+        while i < len(text) and text[i] in " \t\r\n":
+            i += 1
+        return i
+    
+    def string_end(i):
+        i += 1
+        while text[i] != '"':
+            i += 2 if text[i] == "\\" else 1
+        return i + 1
+    
+    def parse_value(i):
+        i = skip_whitespace(i)
+        char = text[i]
+        if char in "{[":
+            closing = "}" if char == "{" else "]"
+            node = {"type": "object" if char == "{" else "array", "start": i, "entries": []}
+            i = skip_whitespace(i + 1)
+            while text[i] != closing:
+                entry_start = i
+                key = None
+                if char == "{":
+                    key_end = string_end(i)
+                    key = json.loads(text[i:key_end])
+                    i = skip_whitespace(key_end) + 1  # ':' 건너뜀
+                value = parse_value(i)
+                node["entries"].append((key, entry_start, value))
+                i = skip_whitespace(value["end"])
+                if text[i] == ",":
+                    i = skip_whitespace(i + 1)
+            node["end"] = i + 1
+            return node
+        if char == '"':
+            return {"type": "value", "start": i, "end": string_end(i), "entries": []}
+        end = i
+        while end < len(text) and text[end] not in ",}] \t\r\n":
+            end += 1
+        return {"type": "value", "start": i, "end": end, "entries": []}
+    
+    return parse_value(0)
+
+def get_line_indent(text, position):
+    """position이 있는 줄의 앞쪽 공백을 반환합니다."""
+    line_start = text.rfind("\n", 0, position) + 1
+    indent_end = line_start
+    while indent_end < len(text) and text[indent_end] in " \t":
+        indent_end += 1
+    return text[line_start:indent_end]
+
+def detect_json_indent(text, root):
+    """최상위 항목의 들여쓰기 단위를 반환합니다. (알 수 없으면 Unity 기본값인 공백 2칸)"""
+    if root["entries"] and "\n" in text[root["start"]:root["entries"][0][1]]:
+        return get_line_indent(text, root["entries"][0][1]) or "  "
+    return "  "
+
+def render_json_value(value, indent, newline, indent_unit):
+    """값을 JSON으로 만들고 두 번째 줄부터 indent만큼 들여씁니다."""
+    rendered = json.dumps(value, indent=indent_unit, ensure_ascii=False)
+    return rendered.replace("\n", newline + indent)
+
+def find_json_entry(node, key):
+    """객체 노드에서 키의 (순서, 값 노드)를 반환합니다. 없으면 (None, None)."""
+    for index, (entry_key, _, value) in enumerate(node["entries"]):
+        if entry_key == key:
+            return index, value
+    return None, None
+
+def get_sorted_insert_index(node, key):
+    """기존 키가 정렬되어 있으면 정렬 위치를, 아니면 맨 끝 위치를 반환합니다."""
+    keys = [entry[0] for entry in node["entries"]]
+    if keys != sorted(keys):
+        return len(keys)
+    return sum(1 for existing in keys if existing < key)
+
+def insert_json_entry(text, node, index, key, value, newline, indent_unit):
+    """객체/배열 노드의 index 위치에 항목을 끼워 넣습니다. (배열이면 key는 None, 주변 줄바꿈/들여쓰기 유지)"""
+    entries = node["entries"]
+    if not entries:
+        # 빈 {} / []는 여러 줄 형식으로 펼침
+        closing_indent = get_line_indent(text, node["start"])
+        indent = closing_indent + indent_unit
+        entry = (json.dumps(key, ensure_ascii=False) + ": " if key is not None else "") + \
+            render_json_value(value, indent, newline, indent_unit)
+        return text[:node["start"] + 1] + newline + indent + entry + newline + closing_indent + text[node["end"] - 1:]
+    
+    multiline = "\n" in text[node["start"]:entries[0][1]]
+    indent = get_line_indent(text, entries[0][1]) if multiline else ""
+    separator = "," + (newline + indent if multiline else " ")
+    entry = (json.dumps(key, ensure_ascii=False) + ": " if key is not None else "") + \
+        render_json_value(value, indent, newline, indent_unit)
+    if index < len(entries):
+        position = entries[index][1]
+        return text[:position] + entry + separator + text[position:]
+    position = entries[-1][2]["end"]
+    return text[:position] + separator + entry + text[position:]
+
+def replace_json_value(text, value_node, value, newline, indent_unit):
+    """값 노드의 텍스트만 새 값으로 바꿉니다."""
+    indent = get_line_indent(text, value_node["start"])
+    rendered = render_json_value(value, indent, newline, indent_unit)
+    return text[:value_node["start"]] + rendered + text[value_node["end"]:]
+
+def remove_json_entry(text, node, index):
+    """객체/배열 노드의 index 번째 항목을 앞뒤 쉼표와 함께 제거합니다."""
+    entries = node["entries"]
+    if index > 0:
+        start, end = entries[index - 1][2]["end"], entries[index][2]["end"]
+    elif len(entries) > 1:
+        start, end = entries[0][1], entries[1][1]
+    else:
+        start, end = node["start"] + 1, node["end"] - 1
+    return text[:start] + text[end:]
+
+def edit_manifest_text(text, add=None, remove=(), registries=(), remove_registries=()):
+    """manifest.json 텍스트에 필요한 부분만 고쳐 새 텍스트를 반환합니다. 바꿀 것이 없으면 원래 텍스트를 그대로 반환합니다.
+
+    add: {패키지명: 버전/URL} 추가 또는 갱신, remove: 제거할 패키지명
+    registries: 추가 또는 갱신할 scoped registry (이름 또는 URL이 같으면 갱신), remove_registries: 제거할 registry 이름
+    """
+    newline = "\r\n" if "\r\n" in text else "\n"
+    indent_unit = detect_json_indent(text, parse_json_layout(text))
+    
+    for name, version in (add or {}).items():
+        root = parse_json_layout(text)
+        _, dependencies = find_json_entry(root, "dependencies")
+        if dependencies is None:
+            # Unity와 같이 dependencies를 맨 앞에 둠
+            text = insert_json_entry(text, root, 0, "dependencies", {name: version}, newline, indent_unit)
+            continue
+        _, current = find_json_entry(dependencies, name)
+        if current is None:
+            text = insert_json_entry(text, dependencies, get_sorted_insert_index(dependencies, name),
+                                     name, version, newline, indent_unit)
+        elif json.loads(text[current["start"]:current["end"]]) != version:
+            text = replace_json_value(text, current, version, newline, indent_unit)
+    
+    for name in remove:
+        root = parse_json_layout(text)
+        _, dependencies = find_json_entry(root, "dependencies")
+        index = find_json_entry(dependencies, name)[0] if dependencies else None
+        if index is not None:
+            text = remove_json_entry(text, dependencies, index)
+    
+    for registry in registries:
+        root = parse_json_layout(text)
+        _, registries_node = find_json_entry(root, "scopedRegistries")
+        if registries_node is None:
+            text = insert_json_entry(text, root, len(root["entries"]), "scopedRegistries", [registry],
+                                     newline, indent_unit)
+            continue
+        existing = json.loads(text[registries_node["start"]:registries_node["end"]])
+        match = next((
+            index for index, item in enumerate(existing)
+            if isinstance(item, dict) and (item.get("name") == registry.get("name") or item.get("url") == registry.get("url"))
+        ), None)
+        if match is None:
+            text = insert_json_entry(text, registries_node, len(existing), None, registry, newline, indent_unit)
+        elif existing[match] != registry:
+            text = replace_json_value(text, registries_node["entries"][match][2], registry, newline, indent_unit)
+    
+    for registry_name in remove_registries:
+        while True:
+            root = parse_json_layout(text)
+            _, registries_node = find_json_entry(root, "scopedRegistries")
+            existing = json.loads(text[registries_node["start"]:registries_node["end"]]) if registries_node else []
+            match = next((
+                index for index, item in enumerate(existing)
+                if isinstance(item, dict) and item.get("name") == registry_name
+            ), None)
+            if match is None:
+                break
+            text = remove_json_entry(text, registries_node, match)
+    
+    return text
+
+def edit_project_manifest(project_dir, add=None, remove=(), registries=(), remove_registries=()):
+    """프로젝트 manifest.json을 기존 서식(들여쓰기, 줄바꿈, 키 순서)을 유지한 채 편집합니다.
+
+    내용이 실제로 바뀐 경우에만 원자적으로 저장하고 True를 반환합니다.
+    """
+    manifest_path = os.path.join(project_dir, "Packages", "manifest.json")
+    if not os.path.exists(manifest_path):
+        print(f"{manifest_path} 없음")
+        return False
+    
+    with open(manifest_path, "r", encoding="utf-8", newline="") as f:
+        original = f.read()
+    bom = "\ufeff" if original.startswith("\ufeff") else ""
+    text = original[len(bom):]
+    try:
+        json.loads(text)
+    except ValueError as e:
+        print(f"❌ {manifest_path} JSON 형식 오류, 편집하지 않음: {e}")
+        return False
+    
+    new_text = edit_manifest_text(text, add, remove, registries, remove_registries)
+    if new_text == text:
+        return False
+    json.loads(new_text)  # 편집 결과 검증 (실패하면 원본을 그대로 둠)
+    fileutil.save_text_file(manifest_path, bom + new_text)
+    return True
+
+def add_git_packages_to_manifest(project_dir, git_packages):
+    """manifest.json에 Git 패키지를 추가/수정합니다. 파일을 변경했으면 True를 반환합니다. (기존 서식 유지)"""
+    manifest_path = os.path.join(project_dir, "Packages", "manifest.json")
+    changed = edit_project_manifest(project_dir, add=git_packages)
+    if changed:
+        print(f"{manifest_path}에 패키지들 추가/수정 완료!")
+    elif os.path.exists(manifest_path):
+        print(f"{manifest_path} 변경 없음 (모든 패키지 이미 설치됨)")
+    return changed
+
+_git_ref_cache = {}  # (URL, 참조) → 커밋 해시, 실행 중에는 원격마다 한 번만 ls-remote
+_git_ref_cache_lock = threading.Lock()
+
+def split_git_package_url(value):
+    """manifest의 Git 패키지 값을 (저장소 URL, "?path=..." 부분, 참조)로 나눕니다. 참조가 없으면 HEAD."""
+    base, _, ref = value.partition("#")
+    url, separator, path = base.partition("?path=")
+    return url, separator + path, ref or "HEAD"
+
+def is_git_package_value(value):
+    """manifest 값이 Git 저장소를 가리키는지 확인합니다. (Unity와 같은 기준)"""
+    url = split_git_package_url(value)[0]
+    return url.endswith(".git") or url.startswith(("git@", "git+", "git://", "ssh://"))
+
+def is_commit_hash(ref):
+    """참조가 40자리 커밋 해시인지 확인합니다."""
+    return len(ref) == 40 and all(c in "0123456789abcdef" for c in ref.lower())
+
+def resolve_git_ref(url, ref):
+    """ls-remote로 브랜치/태그/HEAD를 커밋 해시로 변환합니다. 실패하면 None.
+
+    같은 실행 안에서는 결과를 재사용하므로 프로젝트가 많아도 원격 조회는 한 번입니다.
+    """
+    if is_commit_hash(ref):
+        return ref.lower()
+    
+    key = (url, ref)
+    with _git_ref_cache_lock:
+        if key in _git_ref_cache:
+            return _git_ref_cache[key]
+    
+    os.makedirs(config.TOOLKIT_STATE_DIR, exist_ok=True)
+    success, stdout, stderr = gitops.run_git_command(f'git ls-remote "{url}" "{ref}" "{ref}^{{}}"', config.TOOLKIT_STATE_DIR)
+    sha = None
+    if success:
+        refs = {}
+        for line in stdout.splitlines():
+            parts = line.split("\t")
+            if len(parts) == 2:
+                refs[parts[1]] = parts[0]
+        # 태그는 가리키는 커밋(^{})을 우선 사용
+        for candidate in (ref, f"refs/heads/{ref}", f"refs/tags/{ref}^{{}}", f"refs/tags/{ref}"):
+            if candidate in refs:
+                sha = refs[candidate]
+                break
+    if sha is None:
+        print(f"⚠️ {url} 참조 조회 실패: {ref} {stderr}")
+    
+    with _git_ref_cache_lock:
+        _git_ref_cache[key] = sha
+    return sha
+
+def get_git_package_subdir(path):
+    """"?path=/폴더" 부분에서 저장소 안의 패키지 폴더 경로를 반환합니다. (없으면 빈 문자열)"""
+    return path[len("?path="):].strip("/") if path else ""
+
+def get_git_package_cache_path(url):
+    """Git 패키지 URL의 로컬 bare 저장소 경로를 반환합니다."""
+    return os.path.join(config.GIT_PACKAGE_CACHE_DIR, hashlib.sha1(url.encode("utf-8")).hexdigest()[:16] + ".git")
+
+def fetch_git_package_manifest(url, path, ref, sha, mirror_path=None):
+    """커밋의 package.json을 dict로 반환합니다. 실패하면 None.
+
+    미러가 있으면 미러에서 바로 읽고, 없으면 package.json만 얕게(--depth 1) 받습니다.
+    """
+    repo_path = mirror_path or get_git_package_cache_path(url)
+    if not os.path.isdir(repo_path):
+        os.makedirs(repo_path)
+        gitops.run_git_command("git init --bare -q", repo_path)
+    
+    package_dir = get_git_package_subdir(path)
+    object_name = f"{sha}:{package_dir + '/' if package_dir else ''}package.json"
+    success, stdout, _ = gitops.run_git_command(f'git show "{object_name}"', repo_path)
+    if not success and mirror_path is None:
+        # 커밋 해시로 직접 받을 수 없는 서버는 참조 이름으로 받음
+        fetched, _, stderr = gitops.run_git_command(f'git fetch -q --depth 1 "{url}" {sha}', repo_path)
+        if not fetched:
+            fetched, _, stderr = gitops.run_git_command(f'git fetch -q --depth 1 "{url}" "{ref}"', repo_path)
+        if not fetched:
+            print(f"⚠️ {url} package.json 가져오기 실패: {stderr}")
+            return None
+        success, stdout, _ = gitops.run_git_command(f'git show "{object_name}"', repo_path)
+    
+    if not success:
+        print(f"⚠️ {url}@{sha[:10]}에 package.json 없음")
+        return None
+    try:
+        return json.loads(stdout)
+    except ValueError:
+        return None
+
+def resolve_git_package_pin(value, info_cache):
+    """manifest 값 하나를 커밋 고정 정보로 변환합니다. (info_cache: 커밋별 package.json 의존성)
+
+    미러를 사용하면 미러를 갱신한 뒤 참조 조회와 package.json 읽기를 로컬에서 처리합니다.
+    """
+    if not is_git_package_value(value):
+        return {"version": value, "hash": None, "source": None, "dependencies": None}
+    url, path, ref = split_git_package_url(value)
+    mirror_path = mirror.refresh_package_mirror(url) if config.GIT_PACKAGE_MIRROR_ENABLED else None
+    sha = resolve_git_ref(mirror_path or url, ref)
+    if sha is None:
+        return {"version": value, "hash": None, "source": None, "dependencies": None}
+    
+    key = f"{url}{path}#{sha}"
+    if key not in info_cache:
+        package_manifest = fetch_git_package_manifest(url, path, ref, sha, mirror_path)
+        if package_manifest is not None:
+            info_cache[key] = {"dependencies": package_manifest.get("dependencies", {})}
+    info = info_cache.get(key)
+    return {"version": key, "hash": sha, "source": "git", "dependencies": info["dependencies"] if info else None}
+
+@tracing.traced("stage")
+def resolve_git_package_pins(packages, max_workers=config.GIT_PACKAGE_RESOLVE_WORKERS):
+    """Git 패키지를 커밋 해시로 한 번만 변환하여 모든 프로젝트에 같은 고정 정보를 만듭니다.
+
+    반환값: {패키지명: {"version": manifest 값, "hash": 커밋 해시, "source": "git", "dependencies": package.json 의존성}}
+    Git 패키지가 아니거나 변환에 실패하면 원래 값을 그대로 쓰고 hash와 source는 None입니다.
+    """
+    print("\n=== Git 패키지 커밋 고정 ===")
+    info_cache = fileutil.load_json_file(config.GIT_PACKAGE_INFO_PATH, {})
+    
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pin-worker") as executor:
+        futures = {name: executor.submit(resolve_git_package_pin, value, info_cache) for name, value in packages.items()}
+        pins = {name: future.result() for name, future in futures.items()}
+    fileutil.save_json_file(config.GIT_PACKAGE_INFO_PATH, info_cache)
+    
+    for name, pin in pins.items():
+        if pin["hash"]:
+            print(f"📌 {name} → {pin['hash'][:10]} ({split_git_package_url(packages[name])[2]})")
+        else:
+            print(f"⚪ {name}: 고정하지 않음 ({pin['version']})")
+    return pins
+
+def write_packages_lock_entries(project_dir, pins):
+    """packages-lock.json의 Git 패키지 항목을 고정된 커밋(또는 로컬 미러 폴더)과 의존성으로 맞춥니다. 파일을 변경했으면 True를 반환합니다.
+
+    의존성을 알 수 없는 패키지는 잘못된 항목을 남기지 않도록 Unity가 직접 기록하게 둡니다.
+    """
+    packages_dir = os.path.join(project_dir, "Packages")
+    if not os.path.isdir(packages_dir):
+        return False
+    lock_path = os.path.join(packages_dir, "packages-lock.json")
+    lock = fileutil.load_json_file(lock_path, {})
+    dependencies = lock.setdefault("dependencies", {})
+    
+    changed = False
+    for name, pin in pins.items():
+        if pin["source"] is None or pin["dependencies"] is None:
+            continue
+        previous = dependencies.get(name, {})
+        entry = {
+            "version": pin["version"],
+            "depth": previous.get("depth", 0),
+            "source": pin["source"],
+            "dependencies": pin["dependencies"],
+        }
+        if pin["hash"]:
+            entry["hash"] = pin["hash"]
+        if previous != entry:
+            dependencies[name] = entry
+            changed = True
+    
+    if changed:
+        # Unity와 같이 패키지명 순으로 정렬
+        lock["dependencies"] = dict(sorted(dependencies.items()))
+        fileutil.save_text_file(lock_path, json.dumps(lock, indent=2, ensure_ascii=False) + "\n")
+    return changed
+
+@locks.leased("worktree", skipped=0)
+@journal.journaled("manifest", skipped=0)
+def update_project_manifest(project_dir, versions, pins=None, remove=(), registries=()):
+    """프로젝트 하나의 manifest.json(과 pins가 있으면 packages-lock.json)을 편집하고 변경한 파일 수를 반환합니다."""
+    with run_history.record_stage(project_dir, "manifest") as stage:
+        files_touched = 1 if add_git_packages_to_manifest(project_dir, versions) else 0
+        if (remove or registries) and edit_project_manifest(project_dir, remove=remove, registries=registries):
+            files_touched = 1
+        if pins:
+            files_touched += 1 if write_packages_lock_entries(project_dir, pins) else 0
+        stage["files_touched"] = files_touched
+    return files_touched
+
+@tracing.traced("stage")
+def add_git_packages_to_projects(project_dirs, packages, pin=config.GIT_PACKAGE_PINNING, remove=(), registries=(),
+                                 max_workers=config.MANIFEST_EDIT_WORKERS):
+    """모든 프로젝트의 manifest에 Git 패키지를 추가하고 remove/registries 편집을 함께 적용합니다.
+
+    pin이 True이면 커밋을 한 번만 조회해 모든 프로젝트에 고정하고 packages-lock.json도 맞춥니다.
+    프로젝트별 편집은 서로 독립적이므로 스레드 풀에서 동시에 처리합니다.
+    """
+    pins = resolve_git_package_pins(packages) if pin else None
+    versions = {name: pin_info["version"] for name, pin_info in pins.items()} if pins else packages
+    
+    touched = 0
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="manifest-worker") as executor:
+        future_to_project = {
+            executor.submit(update_project_manifest, project_dir, versions, pins, remove, registries): project_dir
+            for project_dir in project_dirs
+        }
+        try:
+            for future in as_completed(future_to_project):
+                project_name = fileutil.get_project_name_from_path(future_to_project[future])
+                try:
+                    touched += future.result()
+                except Exception as e:
+                    print(f"❌ {project_name} manifest 편집 실패: {e}")
+        except KeyboardInterrupt:
+            unity.cancel_pending_futures(future_to_project)
+            raise
+    print(f"📦 manifest 편집 완료: {len(project_dirs)}개 프로젝트, 변경된 파일 {touched}개")
+    return touched
+# endregion
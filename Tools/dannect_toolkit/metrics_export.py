@@ -0,0 +1,174 @@
+"""메트릭 내보내기 (OpenMetrics 텍스트 파일)."""
+import collections
+import threading
+import time
+
+from . import config, fileutil
+
+
+# =========================
+# #region 메트릭 내보내기 (OpenMetrics 텍스트 파일)
+# =========================
+# 실행 중 값은 메모리에 모으고, 주기적으로 + 실행 종료 시 파일 전체를 원자적으로 교체합니다.
+_metrics_state = {
+    "path": None,
+    "started": None,
+    "stage_durations": {},  # (project, stage) -> [버킷별 개수, 합계, 개수]
+    "stage_runs": collections.Counter(),  # (project, stage, outcome) -> 횟수
+    "files_touched": collections.Counter(),  # (project, stage) -> 변환/수정된 파일 수
+    "bytes_written": collections.Counter(),  # (project, stage) -> 기록한 바이트
+    "git_push": {},  # (project, result) -> [버킷별 개수, 합계, 개수]
+    "webgl_bytes": {},  # project -> 마지막 빌드 출력 크기
+    "unity_exit_codes": {},  # (project, stage) -> 마지막 Unity 종료 코드
+}
+_metrics_lock = threading.Lock()
+_metrics_stop = threading.Event()
+
+def metrics_start(path):
+    """메트릭 수집을 시작하고 주기적으로 파일을 갱신하는 스레드를 실행합니다."""
+    _metrics_state["path"] = path
+    _metrics_state["started"] = time.time()
+    _metrics_stop.clear()
+    
+    def write_periodically():
+        while not _metrics_stop.wait(config.METRICS_WRITE_INTERVAL):
+            metrics_write(in_progress=True)
+    
+    threading.Thread(target=write_periodically, name="metrics-writer", daemon=True).start()
+    metrics_write(in_progress=True)
+    print(f"📊 메트릭 파일 기록: {path} ({config.METRICS_WRITE_INTERVAL}초마다 갱신)")
+
+def _observe_histogram(histograms, key, buckets, value):
+    """히스토그램에 값을 하나 추가합니다. (버킷은 누적이 아닌 구간별 개수로 보관)"""
+    entry = histograms.setdefault(key, [[0] * (len(buckets) + 1), 0.0, 0])
+    index = len(buckets)
+    for i, bound in enumerate(buckets):
+        if value <= bound:
+            index = i
+            break
+    entry[0][index] += 1
+    entry[1] += value
+    entry[2] += 1
+
+def metrics_observe_stage(project_dir, stage, duration, metrics):
+    """record_stage가 끝날 때 단계 시간, 결과, 파일/바이트 수, 빌드 크기, 종료 코드를 반영합니다."""
+    if not _metrics_state["path"]:
+        return
+    project_name = fileutil.get_project_name_from_path(project_dir)
+    key = (project_name, stage)
+    with _metrics_lock:
+        _observe_histogram(_metrics_state["stage_durations"], key, config.METRICS_DURATION_BUCKETS, duration)
+        _metrics_state["stage_runs"][(project_name, stage, metrics.get("outcome") or "unknown")] += 1
+        if metrics.get("files_touched"):
+            _metrics_state["files_touched"][key] += metrics["files_touched"]
+        if metrics.get("bytes_written"):
+            _metrics_state["bytes_written"][key] += metrics["bytes_written"]
+        if metrics.get("build_size") is not None:
+            _metrics_state["webgl_bytes"][project_name] = metrics["build_size"]
+        if metrics.get("exit_code") is not None:
+            _metrics_state["unity_exit_codes"][key] = metrics["exit_code"]
+
+def metrics_observe_git_push(project_path, duration, success):
+    """git push 소요 시간을 기록합니다."""
+    if not _metrics_state["path"]:
+        return
+    key = (fileutil.get_project_name_from_path(project_path), "success" if success else "failed")
+    with _metrics_lock:
+        _observe_histogram(_metrics_state["git_push"], key, config.METRICS_GIT_PUSH_BUCKETS, duration)
+
+def _format_metric_labels(**labels):
+    """OpenMetrics 레이블 문자열을 만듭니다. (역슬래시, 따옴표, 줄바꿈 이스케이프)"""
+    parts = []
+    for name, value in labels.items():
+        value = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        parts.append(f'{name}="{value}"')
+    return "{" + ",".join(parts) + "}"
+
+def _format_histogram(lines, name, histograms, buckets, label_names):
+    """구간별 개수를 OpenMetrics 누적 버킷(_bucket, _sum, _count)으로 변환합니다."""
+    for key, (counts, total, count) in sorted(histograms.items()):
+        labels = dict(zip(label_names, key))
+        cumulative = 0
+        for bound, bucket_count in zip(buckets + ["+Inf"], counts):
+            cumulative += bucket_count
+            le = bound if bound == "+Inf" else float(bound)
+            lines.append(f"{name}_bucket{_format_metric_labels(**labels, le=le)} {cumulative}")
+        lines.append(f"{name}_sum{_format_metric_labels(**labels)} {total:.3f}")
+        lines.append(f"{name}_count{_format_metric_labels(**labels)} {count}")
+
+def render_metrics(in_progress=False):
+    """현재까지 수집한 값을 OpenMetrics 텍스트로 만듭니다."""
+    import copy
+    
+    with _metrics_lock:
+        state = copy.deepcopy(_metrics_state)
+    
+    lines = []
+    lines.append("# TYPE dannect_toolkit_run_in_progress gauge")
+    lines.append("# HELP dannect_toolkit_run_in_progress 툴킷 실행 중이면 1")
+    lines.append(f"dannect_toolkit_run_in_progress {1 if in_progress else 0}")
+    lines.append("# TYPE dannect_toolkit_run_start_timestamp_seconds gauge")
+    lines.append("# HELP dannect_toolkit_run_start_timestamp_seconds 현재(마지막) 실행 시작 시각")
+    lines.append(f"dannect_toolkit_run_start_timestamp_seconds {state['started'] or 0:.3f}")
+    lines.append("# TYPE dannect_toolkit_last_update_timestamp_seconds gauge")
+    lines.append("# HELP dannect_toolkit_last_update_timestamp_seconds 메트릭 파일 갱신 시각")
+    lines.append(f"dannect_toolkit_last_update_timestamp_seconds {time.time():.3f}")
+    
+    lines.append("# TYPE dannect_toolkit_stage_duration_seconds histogram")
+    lines.append("# UNIT dannect_toolkit_stage_duration_seconds seconds")
+    lines.append("# HELP dannect_toolkit_stage_duration_seconds 프로젝트/단계별 소요 시간")
+    _format_histogram(lines, "dannect_toolkit_stage_duration_seconds", state["stage_durations"],
+                      config.METRICS_DURATION_BUCKETS, ("project", "stage"))
+    
+    lines.append("# TYPE dannect_toolkit_stage_runs counter")
+    lines.append("# HELP dannect_toolkit_stage_runs 프로젝트/단계별 결과 횟수 (outcome: success, failed, cache_hit 등)")
+    for (project, stage, outcome), count in sorted(state["stage_runs"].items()):
+        lines.append(f"dannect_toolkit_stage_runs_total{_format_metric_labels(project=project, stage=stage, outcome=outcome)} {count}")
+    
+    lines.append("# TYPE dannect_toolkit_files_touched counter")
+    lines.append("# HELP dannect_toolkit_files_touched 변환(convert)/수정(fix)한 파일 수")
+    for (project, stage), count in sorted(state["files_touched"].items()):
+        lines.append(f"dannect_toolkit_files_touched_total{_format_metric_labels(project=project, stage=stage)} {count}")
+    
+    lines.append("# TYPE dannect_toolkit_written_bytes counter")
+    lines.append("# UNIT dannect_toolkit_written_bytes bytes")
+    lines.append("# HELP dannect_toolkit_written_bytes 변환/수정으로 기록한 바이트")
+    for (project, stage), count in sorted(state["bytes_written"].items()):
+        lines.append(f"dannect_toolkit_written_bytes_total{_format_metric_labels(project=project, stage=stage)} {count}")
+    
+    lines.append("# TYPE dannect_toolkit_git_push_duration_seconds histogram")
+    lines.append("# UNIT dannect_toolkit_git_push_duration_seconds seconds")
+    lines.append("# HELP dannect_toolkit_git_push_duration_seconds git push 소요 시간")
+    _format_histogram(lines, "dannect_toolkit_git_push_duration_seconds", state["git_push"],
+                      config.METRICS_GIT_PUSH_BUCKETS, ("project", "result"))
+    
+    lines.append("# TYPE dannect_toolkit_webgl_output_bytes gauge")
+    lines.append("# UNIT dannect_toolkit_webgl_output_bytes bytes")
+    lines.append("# HELP dannect_toolkit_webgl_output_bytes 마지막 WebGL 빌드 출력 크기")
+    for project, size in sorted(state["webgl_bytes"].items()):
+        lines.append(f"dannect_toolkit_webgl_output_bytes{_format_metric_labels(project=project)} {size}")
+    
+    lines.append("# TYPE dannect_toolkit_unity_exit_code gauge")
+    lines.append("# HELP dannect_toolkit_unity_exit_code 마지막 Unity 실행 종료 코드")
+    for (project, stage), code in sorted(state["unity_exit_codes"].items()):
+        lines.append(f"dannect_toolkit_unity_exit_code{_format_metric_labels(project=project, stage=stage)} {code}")
+    
+    lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+def metrics_write(in_progress=False):
+    """메트릭 파일을 원자적으로 교체합니다. (수집기가 반쯤 쓴 파일을 읽지 않도록)"""
+    if not _metrics_state["path"]:
+        return
+    try:
+        fileutil.save_text_file(_metrics_state["path"], render_metrics(in_progress))
+    except Exception as e:
+        print(f"⚠️ 메트릭 파일 기록 실패: {e}")
+
+def metrics_finish():
+    """주기 갱신을 멈추고 최종 메트릭을 기록합니다."""
+    if not _metrics_state["path"]:
+        return
+    _metrics_stop.set()
+    metrics_write(in_progress=False)
+# endregion
@@ -0,0 +1,184 @@
+"""Git 패키지 로컬 미러 (bare 미러, 커밋별 패키지 폴더, file: 참조)."""
+import os
+import collections
+import hashlib
+import io
+import shutil
+import subprocess
+import tarfile
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from . import config, fileutil, gitops, locks, manifests, run_history, tracing
+
+
+# =========================
+# #region Git 패키지 로컬 미러 (bare 미러, 커밋별 패키지 폴더, file: 참조)
+# =========================
+_mirror_state = {}  # URL → 미러 경로 (갱신 실패 시 None), 실행마다 한 번만 원격에 접속
+_mirror_locks = collections.defaultdict(threading.Lock)
+_snapshot_locks = collections.defaultdict(threading.Lock)  # 꺼낼 패키지 폴더 → 잠금 (파이프라인의 프로젝트별 mirror 단계가 동시에 꺼냄)
+_mirror_state_lock = threading.Lock()
+
+def get_git_package_mirror_path(url):
+    """Git 패키지 URL의 bare 미러 경로를 반환합니다."""
+    return os.path.join(config.GIT_PACKAGE_MIRROR_DIR, "repos", hashlib.sha1(url.encode("utf-8")).hexdigest()[:16] + ".git")
+
+def refresh_package_mirror(url):
+    """Git 패키지의 bare 미러를 만들거나 갱신하고 경로를 반환합니다.
+
+    실행마다 URL당 한 번만 원격에 접속하며, 갱신에 실패해도(오프라인 등) 기존 미러가 있으면 그대로 사용합니다.
+    미러가 없고 만들 수도 없으면 None을 반환합니다.
+    """
+    with _mirror_state_lock:
+        url_lock = _mirror_locks[url]
+    with url_lock:
+        if url in _mirror_state:
+            return _mirror_state[url]
+        
+        mirror_path = get_git_package_mirror_path(url)
+        if os.path.isdir(mirror_path):
+            success, _, stderr = gitops.run_git_command("git fetch -q --prune origin", mirror_path)
+            if success:
+                print(f"🔄 미러 갱신: {url}")
+            else:
+                print(f"⚠️ 미러 갱신 실패, 기존 미러 사용: {url} {stderr}")
+        else:
+            # 임시 폴더에 받은 뒤 이름을 바꿔 중간에 실패해도 불완전한 미러가 남지 않게 함
+            tmp_path = f"{mirror_path}.{os.getpid()}.tmp"
+            os.makedirs(os.path.dirname(mirror_path), exist_ok=True)
+            shutil.rmtree(tmp_path, ignore_errors=True)
+            success, _, stderr = gitops.run_git_command(f'git clone -q --mirror "{url}" "{tmp_path}"', config.TOOLKIT_STATE_DIR)
+            if success:
+                os.replace(tmp_path, mirror_path)
+                print(f"📥 미러 생성: {url}")
+            else:
+                shutil.rmtree(tmp_path, ignore_errors=True)
+                print(f"⚠️ 미러 생성 실패: {url} {stderr}")
+                mirror_path = None
+        
+        _mirror_state[url] = mirror_path
+        return mirror_path
+
+@tracing.traced("stage")
+def refresh_package_mirrors(packages, max_workers=config.GIT_PACKAGE_RESOLVE_WORKERS):
+    """모든 Git 패키지의 미러를 병렬로 만들거나 갱신합니다. 반환값: {URL: 미러 경로 또는 None}"""
+    print("\n=== Git 패키지 미러 갱신 ===")
+    urls = sorted({manifests.split_git_package_url(value)[0] for value in packages.values() if manifests.is_git_package_value(value)})
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="mirror-worker") as executor:
+        mirrors = dict(zip(urls, executor.map(refresh_package_mirror, urls)))
+    for url, mirror_path in mirrors.items():
+        size = fileutil.format_bytes(fileutil.get_directory_size(mirror_path)) if mirror_path else "없음"
+        print(f"  {url} → {mirror_path or '사용 불가'} ({size})")
+    return mirrors
+
+def extract_package_snapshot(name, url, path, sha):
+    """미러에서 커밋의 패키지 폴더를 꺼내 경로를 반환합니다. 커밋별로 한 번만 꺼내며, 실패하면 None."""
+    target = os.path.join(config.GIT_PACKAGE_MIRROR_DIR, "packages", f"{name}@{sha[:12]}")
+    if os.path.isfile(os.path.join(target, "package.json")):
+        return target
+    with _mirror_state_lock:
+        target_lock = _snapshot_locks[target]
+    with target_lock:
+        # 기다리는 동안 다른 스레드가 이미 꺼냈으면 그대로 사용
+        if os.path.isfile(os.path.join(target, "package.json")):
+            return target
+        return _extract_package_snapshot(name, url, path, sha, target)
+
+def _extract_package_snapshot(name, url, path, sha, target):
+    """extract_package_snapshot의 본문입니다. (target 잠금 안에서 호출)"""
+    mirror_path = refresh_package_mirror(url)
+    if mirror_path is None:
+        return None
+    package_dir = manifests.get_git_package_subdir(path)
+    cmd = ["git", "archive", "--format=tar", sha] + ([package_dir] if package_dir else [])
+    result = subprocess.run(cmd, cwd=mirror_path, capture_output=True)
+    if result.returncode != 0:
+        print(f"⚠️ {name}@{sha[:10]} 패키지 꺼내기 실패: {result.stderr.decode('utf-8', 'replace').strip()}")
+        return None
+    
+    # 임시 폴더는 실행/스레드마다 따로 만들어 다른 프로세스가 같은 커밋을 꺼내도 겹치지 않게 함
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    tmp_dir = tempfile.mkdtemp(prefix=os.path.basename(target) + ".", suffix=".tmp", dir=os.path.dirname(target))
+    try:
+        with tarfile.open(fileobj=io.BytesIO(result.stdout)) as tar:
+            tar.extractall(tmp_dir)
+        if os.path.isdir(target) and not os.path.isfile(os.path.join(target, "package.json")):
+            shutil.rmtree(target, ignore_errors=True)  # 이전에 중단된 불완전한 폴더
+        try:
+            os.replace(os.path.join(tmp_dir, package_dir) if package_dir else tmp_dir, target)
+        except OSError:
+            # 다른 프로세스가 먼저 꺼내 둔 경우
+            if not os.path.isfile(os.path.join(target, "package.json")):
+                raise
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    return target
+
+def has_package_mirror_references(project_dir):
+    """manifest.json에 로컬 미러 폴더(file:) 참조가 있는지 확인합니다. (커밋하면 안 되는 상태)"""
+    manifest = fileutil.load_json_file(os.path.join(project_dir, "Packages", "manifest.json"), {})
+    mirror_prefix = "file:" + os.path.abspath(config.GIT_PACKAGE_MIRROR_DIR).replace(os.sep, "/")
+    return any(
+        isinstance(value, str) and value.startswith(mirror_prefix)
+        for value in manifest.get("dependencies", {}).values()
+    )
+
+@locks.leased("worktree", skipped=0)
+def use_project_package_mirrors(project_dir, packages, info_cache, local_pins):
+    """프로젝트 하나의 manifest에서 Git 패키지를 로컬 미러 폴더(file:) 참조로 바꾸고 변경한 파일 수를 반환합니다.
+
+    local_pins는 프로젝트끼리 공유하는 {Git 참조 값: 로컬 폴더 고정 정보} 캐시입니다.
+    """
+    manifest = fileutil.load_json_file(os.path.join(project_dir, "Packages", "manifest.json"), None)
+    if manifest is None:
+        return 0
+    project_name = fileutil.get_project_name_from_path(project_dir)
+    pins = {}
+    for name in packages:
+        value = manifest.get("dependencies", {}).get(name)
+        if not value or not manifests.is_git_package_value(value):
+            continue
+        if value not in local_pins:
+            pin = manifests.resolve_git_package_pin(value, info_cache)
+            snapshot = None
+            if pin["hash"]:
+                url, path, _ = manifests.split_git_package_url(value)
+                snapshot = extract_package_snapshot(name, url, path, pin["hash"])
+            local_pins[value] = None if snapshot is None else {
+                "version": "file:" + os.path.abspath(snapshot).replace(os.sep, "/"),
+                "hash": None,
+                "source": "local",
+                "dependencies": pin["dependencies"],
+            }
+        if local_pins[value] is None:
+            print(f"⚠️ {project_name}: {name} 미러 사용 불가, Git 참조 유지")
+            continue
+        pins[name] = local_pins[value]
+    
+    if not pins:
+        return 0
+    with run_history.record_stage(project_dir, "mirror") as stage:
+        versions = {name: pin["version"] for name, pin in pins.items()}
+        files_touched = 1 if manifests.add_git_packages_to_manifest(project_dir, versions) else 0
+        files_touched += 1 if manifests.write_packages_lock_entries(project_dir, pins) else 0
+        stage["files_touched"] = files_touched
+    return files_touched
+
+@tracing.traced("stage")
+def use_package_mirrors(project_dirs, packages):
+    """각 프로젝트 manifest의 Git 패키지를 로컬 미러에서 꺼낸 폴더(file:)로 바꿉니다. (빌드 팜 실행용)
+
+    프로젝트에 고정된 커밋을 그대로 꺼내므로 빌드 결과는 Git 참조를 쓸 때와 같고, Unity 시작 시 네트워크를 쓰지 않습니다.
+    바뀐 manifest는 커밋하지 않으며, 다음 패키지 추가 단계에서 다시 Git 참조로 돌아갑니다.
+    """
+    print("\n=== 로컬 패키지 미러 적용 ===")
+    info_cache = fileutil.load_json_file(config.GIT_PACKAGE_INFO_PATH, {})
+    local_pins = {}  # Git 참조 값 → 로컬 폴더 고정 정보 (프로젝트끼리 같은 커밋이면 재사용)
+    
+    for project_dir in project_dirs:
+        use_project_package_mirrors(project_dir, packages, info_cache, local_pins)
+    
+    fileutil.save_json_file(config.GIT_PACKAGE_INFO_PATH, info_cache)
+# endregion
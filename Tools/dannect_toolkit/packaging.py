@@ -0,0 +1,225 @@
+"""배포 번들 패키징 (결정적 아카이브, manifest, 증분 번들)."""
+import os
+import json
+import hashlib
+import io
+import shutil
+import tarfile
+import threading
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    import zstandard  # 선택 사항 (pip install zstandard), 없으면 배포 번들을 zip으로 생성
+except ImportError:
+    zstandard = None
+
+from . import config, fileutil, run_history, tracing, unity
+
+
+# =========================
+# #region 배포 번들 패키징 (결정적 아카이브, manifest, 증분 번들)
+# =========================
+# 번들은 파일 순서, 시간, 권한을 고정해 같은 빌드 결과면 항상 같은 바이트가 나옵니다.
+# 버전은 manifest(파일 경로+해시) 내용의 해시이므로 빌드가 바뀌지 않았으면 다시 패키징하지 않습니다.
+PACKAGE_MANIFEST_NAME = "manifest.json"
+PACKAGE_STORED_EXTENSIONS = (".br", ".gz", ".png", ".jpg", ".jpeg", ".mp4", ".zip")  # 이미 압축된 파일은 그대로 저장
+PACKAGE_ZIP_DATE = (1980, 1, 1, 0, 0, 0)
+
+def build_package_manifest(project_path):
+    """빌드 폴더의 파일 목록과 해시로 manifest를 만듭니다. (파일은 청크 단위로 읽음)"""
+    build_dir = os.path.join(project_path, config.BUILD_OUTPUT_DIR)
+    files = {}
+    for root, dirs, filenames in os.walk(build_dir):
+        dirs[:] = sorted(d for d in dirs if not d.startswith('.'))
+        for filename in sorted(filenames):
+            if filename.startswith('.') or filename.endswith(".tmp"):
+                continue
+            filepath = os.path.join(root, filename)
+            relative_path = os.path.relpath(filepath, build_dir).replace(os.sep, '/')
+            files[relative_path] = {"sha256": fileutil.hash_file(filepath), "size": os.path.getsize(filepath)}
+    
+    digest = hashlib.sha256()
+    for relative_path in sorted(files):
+        digest.update(f"{relative_path}\0{files[relative_path]['sha256']}\n".encode("utf-8"))
+    return {
+        "project": fileutil.get_project_name_from_path(project_path),
+        "version": digest.hexdigest()[:16],
+        "files": files,
+    }
+
+def write_package_archive(archive_path, build_dir, manifest, relative_paths, package_format):
+    """manifest와 지정한 파일들을 결정적 아카이브로 씁니다. (임시 파일에 쓴 뒤 교체)"""
+    manifest_bytes = json.dumps(manifest, indent=2, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    tmp_path = f"{archive_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    
+    try:
+        if package_format == "tar.zst":
+            with open(tmp_path, "wb") as raw:
+                compressor = zstandard.ZstdCompressor(level=config.PACKAGE_ZSTD_LEVEL)
+                with compressor.stream_writer(raw) as writer:
+                    with tarfile.open(fileobj=writer, mode="w|", format=tarfile.PAX_FORMAT) as tar:
+                        def add_tar_entry(name, size, fileobj):
+                            info = tarfile.TarInfo(name)
+                            info.size = size
+                            info.mode = 0o644
+                            info.mtime = 0
+                            tar.addfile(info, fileobj)
+                        
+                        add_tar_entry(PACKAGE_MANIFEST_NAME, len(manifest_bytes), io.BytesIO(manifest_bytes))
+                        for relative_path in relative_paths:
+                            filepath = os.path.join(build_dir, relative_path)
+                            with open(filepath, "rb") as f:
+                                add_tar_entry(relative_path, manifest["files"][relative_path]["size"], f)
+        else:
+            with zipfile.ZipFile(tmp_path, "w") as archive:
+                def new_zip_info(name):
+                    info = zipfile.ZipInfo(name, date_time=PACKAGE_ZIP_DATE)
+                    info.external_attr = 0o644 << 16
+                    info.compress_type = (zipfile.ZIP_STORED if name.lower().endswith(PACKAGE_STORED_EXTENSIONS)
+                                          else zipfile.ZIP_DEFLATED)
+                    return info
+                
+                archive.writestr(new_zip_info(PACKAGE_MANIFEST_NAME), manifest_bytes)
+                for relative_path in relative_paths:
+                    filepath = os.path.join(build_dir, relative_path)
+                    size = manifest["files"][relative_path]["size"]
+                    with open(filepath, "rb") as src, \
+                            archive.open(new_zip_info(relative_path), "w", force_zip64=size >= zipfile.ZIP64_LIMIT) as dst:
+                        shutil.copyfileobj(src, dst, 1024 * 1024)
+        os.replace(tmp_path, archive_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def prune_package_versions(package_dir, latest):
+    """최근 PACKAGE_KEEP_VERSIONS개 버전의 번들과 그 버전으로 가는 증분 번들만 남깁니다."""
+    history = latest.get("history", [])
+    keep_versions = set(history[-config.PACKAGE_KEEP_VERSIONS:])
+    for name in os.listdir(package_dir):
+        if name == "latest.json" or name.endswith(".tmp"):
+            continue
+        # 파일명: <버전>.<확장자> 또는 <이전 버전>-to-<버전>.delta.<확장자>
+        version = name.split(".", 1)[0].split("-to-")[-1]
+        if version not in keep_versions:
+            os.remove(os.path.join(package_dir, name))
+
+def package_project_build(project_path, package_format):
+    """프로젝트 빌드 결과를 전체 번들과 이전 버전 대비 증분 번들로 패키징합니다.
+
+    반환값: 버전, 번들 경로/크기, 증분 번들 정보를 담은 dict
+    """
+    project_name = fileutil.get_project_name_from_path(project_path)
+    build_dir = os.path.join(project_path, config.BUILD_OUTPUT_DIR)
+    package_dir = os.path.join(config.PACKAGE_OUTPUT_DIR, project_name)
+    extension = "tar.zst" if package_format == "tar.zst" else "zip"
+    
+    with run_history.record_stage(project_path, "package") as stage:
+        started = time.time()
+        manifest = build_package_manifest(project_path)
+        version = manifest["version"]
+        
+        latest_path = os.path.join(package_dir, "latest.json")
+        latest = fileutil.load_json_file(latest_path, {})
+        bundle_path = os.path.join(package_dir, f"{version}.{extension}")
+        result = {"project": project_name, "version": version, "bundle": bundle_path,
+                  "files": len(manifest["files"]), "delta": None, "changed": 0, "removed": 0}
+        
+        if latest.get("version") == version and os.path.exists(bundle_path):
+            stage["outcome"] = "unchanged"
+            result["unchanged"] = True
+            result["bundle_size"] = os.path.getsize(bundle_path)
+            return result
+        
+        os.makedirs(package_dir, exist_ok=True)
+        write_package_archive(bundle_path, build_dir, manifest, sorted(manifest["files"]), package_format)
+        result["bundle_size"] = os.path.getsize(bundle_path)
+        written = result["bundle_size"]
+        
+        # 이전 버전 대비 바뀐 파일만 담은 증분 번들
+        previous_manifest = latest.get("manifest")
+        if previous_manifest and latest.get("version") != version:
+            previous_files = previous_manifest.get("files", {})
+            changed = sorted(
+                path for path, info in manifest["files"].items()
+                if previous_files.get(path, {}).get("sha256") != info["sha256"]
+            )
+            removed = sorted(set(previous_files) - set(manifest["files"]))
+            delta_manifest = {
+                "project": project_name,
+                "version": version,
+                "base_version": latest["version"],
+                "files": {path: manifest["files"][path] for path in changed},
+                "removed": removed,
+            }
+            delta_path = os.path.join(package_dir, f"{latest['version']}-to-{version}.delta.{extension}")
+            write_package_archive(delta_path, build_dir, delta_manifest, changed, package_format)
+            result.update(delta=delta_path, delta_size=os.path.getsize(delta_path),
+                          changed=len(changed), removed=len(removed))
+            written += result["delta_size"]
+        
+        history = [v for v in latest.get("history", []) if v != version] + [version]
+        latest = {
+            "version": version,
+            "bundle": os.path.basename(bundle_path),
+            "delta": os.path.basename(result["delta"]) if result["delta"] else None,
+            "packaged_at": time.time(),
+            "history": history,
+            "manifest": manifest,
+        }
+        fileutil.save_json_file(latest_path, latest)
+        prune_package_versions(package_dir, latest)
+        
+        stage["files_touched"] = result["files"]
+        stage["bytes_written"] = written
+        result["elapsed"] = time.time() - started
+        return result
+
+@tracing.traced("stage")
+def package_build_outputs(project_dirs, package_format=config.PACKAGE_FORMAT, max_workers=config.PACKAGE_WORKERS):
+    """빌드 결과가 있는 프로젝트들을 병렬로 패키징합니다."""
+    print("\n=== 배포 번들 패키징 시작 ===")
+    
+    if package_format == "tar.zst" and zstandard is None:
+        print("⚠️ zstandard 모듈이 없어 zip으로 패키징합니다. (pip install zstandard)")
+        package_format = "zip"
+    
+    targets = [d for d in project_dirs if os.path.isdir(os.path.join(d, config.BUILD_OUTPUT_DIR))]
+    if not targets:
+        print("⚪ 패키징할 빌드 결과가 없습니다.")
+        return []
+    print(f"📦 {len(targets)}개 프로젝트 패키징 ({package_format}, 동시 {min(max_workers, len(targets))}개)")
+    
+    results = []
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="package-worker") as executor:
+        future_to_project = {
+            executor.submit(package_project_build, project_dir, package_format): project_dir
+            for project_dir in targets
+        }
+        try:
+            for future in as_completed(future_to_project):
+                project_name = fileutil.get_project_name_from_path(future_to_project[future])
+                try:
+                    result = future.result()
+                except Exception as e:
+                    print(f"❌ {project_name} 패키징 실패: {e}")
+                    continue
+                results.append(result)
+                if result.get("unchanged"):
+                    print(f"⚪ {project_name}: 변경 없음 (버전 {result['version']})")
+                    continue
+                delta = ""
+                if result["delta"]:
+                    delta = (f", 증분 {fileutil.format_bytes(result['delta_size'])} "
+                             f"(변경 {result['changed']}개, 삭제 {result['removed']}개)")
+                print(f"✅ {project_name}: 버전 {result['version']}, 전체 {fileutil.format_bytes(result['bundle_size'])}{delta} "
+                      f"({result['elapsed']:.1f}초)")
+        except KeyboardInterrupt:
+            unity.cancel_pending_futures(future_to_project)
+            raise
+    
+    print(f"📁 번들 위치: {config.PACKAGE_OUTPUT_DIR}")
+    return results
+# endregion
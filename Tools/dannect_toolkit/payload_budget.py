@@ -0,0 +1,206 @@
+"""WebGL 페이로드 예산 (해시 파일명 기준 크기 추적, 회귀 감지)."""
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from . import config, fileutil, run_history, tracing, unity
+
+
+# =========================
+# #region WebGL 페이로드 예산 (해시 파일명 기준 크기 추적, 회귀 감지)
+# =========================
+# nameFilesAsHashes로 생성된 "<md5>.<역할>" 파일만 비교 (로더, index.html, TemplateData는 제외)
+PAYLOAD_HASHED_NAME_PATTERN = r"^[0-9a-f]{32}\.(.+)$"
+PAYLOAD_COMPRESSED_SUFFIXES = (".gz", ".br", ".unityweb")
+
+def get_payload_role(filename, sibling_names):
+    """해시 파일명에서 역할(wasm, data, framework.js 등)과 Unity 압축 여부를 반환합니다.
+
+    비교 대상이 아니면 (None, False)를 반환합니다.
+    """
+    import re
+    match = re.match(PAYLOAD_HASHED_NAME_PATTERN, filename)
+    if not match:
+        return None, False
+    
+    role = match.group(1)
+    for suffix in PAYLOAD_COMPRESSED_SUFFIXES:
+        if role.endswith(suffix):
+            # --precompress로 만든 .br/.gz는 원본과 같은 내용이므로 제외
+            if filename[:-len(suffix)] in sibling_names:
+                return None, False
+            return role[:-len(suffix)], True
+    return role, False
+
+def collect_payload_files(project_dir):
+    """빌드 폴더의 해시 파일명 출력물을 역할별로 찾습니다. 반환값: {역할: (경로, Unity 압축 여부)}"""
+    build_dir = os.path.join(project_dir, config.BUILD_OUTPUT_DIR)
+    files = {}
+    for root, dirs, names in os.walk(build_dir):
+        sibling_names = set(names)
+        for name in names:
+            role, compressed = get_payload_role(name, sibling_names)
+            if role is None:
+                continue
+            filepath = os.path.join(root, name)
+            # 이전 빌드의 파일이 남아 있으면 가장 최근 파일만 사용
+            previous = files.get(role)
+            if previous is None or os.path.getmtime(filepath) > os.path.getmtime(previous[0]):
+                files[role] = (filepath, compressed)
+    return files
+
+def measure_gzip_size(filepath, level=config.PRECOMPRESS_GZIP_LEVEL, chunk_size=1024 * 1024):
+    """파일을 gzip으로 압축했을 때의 크기를 계산합니다. (압축 결과는 저장하지 않음)"""
+    import zlib
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    size = 0
+    with open(filepath, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            size += len(compressor.compress(chunk))
+    return size + len(compressor.flush())
+
+def get_payload_budget(project_name):
+    """프로젝트의 예산을 반환합니다. (기본값 "*"에 프로젝트별 값을 덮어씀)"""
+    budget = dict(config.PAYLOAD_BUDGETS.get("*", {}))
+    budget.update(config.PAYLOAD_BUDGETS.get(project_name, {}))
+    return budget
+
+def get_payload_entry(payload, key):
+    """측정 결과에서 "total" 또는 역할별 항목을 반환합니다."""
+    if not payload:
+        return None
+    return payload["total"] if key == "total" else payload["roles"].get(key)
+
+def evaluate_payload(project_name, current, baseline):
+    """예산 초과와 기준 대비 회귀를 찾아 설명 목록으로 반환합니다."""
+    budget = get_payload_budget(project_name)
+    problems = []
+    for key in ["total"] + sorted(current["roles"]):
+        size = get_payload_entry(current, key)["gz"]
+        if key in budget and size > budget[key]:
+            problems.append(f"{key} 예산 초과 {fileutil.format_bytes(size)} > {fileutil.format_bytes(budget[key])}")
+        
+        base = get_payload_entry(baseline, key)
+        if not base:
+            continue
+        growth = size - base["gz"]
+        if growth >= config.PAYLOAD_REGRESSION_MIN_BYTES and growth > base["gz"] * config.PAYLOAD_REGRESSION_THRESHOLD:
+            problems.append(f"{key} 회귀 {fileutil.format_bytes(base['gz'])} → {fileutil.format_bytes(size)} "
+                            f"(+{growth / base['gz'] * 100:.0f}%)")
+    return problems
+
+def print_payload_result(project_name, current, baseline, problems):
+    """프로젝트의 전송(gzip)/원본 크기와 기준 대비 변화를 출력합니다."""
+    def describe(key):
+        entry = get_payload_entry(current, key)
+        text = f"{fileutil.format_bytes(entry['gz'])} (원본 {fileutil.format_bytes(entry['raw'])})"
+        base = get_payload_entry(baseline, key)
+        if base and base["gz"] and entry["gz"] != base["gz"]:
+            change = entry["gz"] - base["gz"]
+            sign = "+" if change > 0 else "-"
+            text += f", 기준 대비 {sign}{fileutil.format_bytes(abs(change))} ({change / base['gz'] * 100:+.1f}%)"
+        return text
+    
+    icon = "❌" if problems else "✅"
+    print(f"{icon} {project_name}: 전송 {describe('total')}")
+    for role in sorted(current["roles"]):
+        print(f"    {role}: {describe(role)}")
+    for problem in problems:
+        print(f"    ⚠️ {problem}")
+
+@tracing.traced("stage")
+def check_payload_budgets(project_dirs, accept=False):
+    """WebGL 빌드 출력물의 원본/gzip 크기를 기준과 비교하여 예산 초과와 회귀를 보고합니다.
+
+    해시 파일명이 같으면 내용도 같으므로 이전 측정값을 재사용하고, 바뀐 파일만 gzip 크기를 계산합니다.
+    기준이 없는 프로젝트는 이번 측정값이 기준이 되며, accept가 True이면 모든 프로젝트의 기준을 갱신합니다.
+    반환값: {프로젝트명: [위반 내용]} (위반이 있는 프로젝트만)
+    """
+    print("\n=== WebGL 페이로드 예산 검사 시작 ===")
+    state = fileutil.load_json_file(config.PAYLOAD_BASELINE_PATH, {})
+    
+    targets = {}
+    for project_dir in project_dirs:
+        files = collect_payload_files(project_dir)
+        if files:
+            targets[project_dir] = files
+        elif os.path.isdir(os.path.join(project_dir, config.BUILD_OUTPUT_DIR)):
+            print(f"⚠️ {fileutil.get_project_name_from_path(project_dir)}: 해시 파일명 출력물이 없어 건너뜀 (nameFilesAsHashes 확인)")
+    
+    if not targets:
+        print("⚪ 검사할 빌드 출력물이 없습니다.")
+        return {}
+    
+    measurements = {project_dir: {} for project_dir in targets}
+    with ThreadPoolExecutor(max_workers=config.PAYLOAD_WORKERS, thread_name_prefix="payload-worker") as executor:
+        future_to_file = {}
+        for project_dir, files in targets.items():
+            project_state = state.get(fileutil.get_project_name_from_path(project_dir), {})
+            known = {}
+            for payload in (project_state.get("baseline"), project_state.get("last")):
+                for entry in (payload or {}).get("roles", {}).values():
+                    known[entry["file"]] = entry
+            
+            for role, (filepath, compressed) in files.items():
+                name = os.path.basename(filepath)
+                if name in known:
+                    measurements[project_dir][role] = dict(known[name])
+                    continue
+                raw_size = os.path.getsize(filepath)
+                if compressed:
+                    # Unity가 이미 압축한 출력물은 파일 크기가 곧 전송 크기
+                    measurements[project_dir][role] = {"file": name, "raw": raw_size, "gz": raw_size}
+                    continue
+                future_to_file[executor.submit(measure_gzip_size, filepath)] = (project_dir, role, name, raw_size)
+        
+        try:
+            for future in as_completed(future_to_file):
+                project_dir, role, name, raw_size = future_to_file[future]
+                try:
+                    measurements[project_dir][role] = {"file": name, "raw": raw_size, "gz": future.result()}
+                except Exception as e:
+                    print(f"❌ {fileutil.get_project_name_from_path(project_dir)}/{name} 크기 측정 실패: {e}")
+        except KeyboardInterrupt:
+            unity.cancel_pending_futures(future_to_file)
+            raise
+    
+    violations = {}
+    measured = time.time()
+    for project_dir, roles in sorted(measurements.items()):
+        if not roles:
+            continue
+        project_name = fileutil.get_project_name_from_path(project_dir)
+        with run_history.record_stage(project_dir, "payload") as stage:
+            current = {
+                "measured": measured,
+                "roles": roles,
+                "total": {
+                    "raw": sum(entry["raw"] for entry in roles.values()),
+                    "gz": sum(entry["gz"] for entry in roles.values()),
+                },
+            }
+            project_state = state.setdefault(project_name, {})
+            baseline = project_state.get("baseline")
+            
+            # 기준을 새로 받아들이는 경우 예산만 검사
+            problems = evaluate_payload(project_name, current, None if accept else baseline)
+            print_payload_result(project_name, current, baseline, problems)
+            
+            project_state["last"] = current
+            if accept or baseline is None:
+                project_state["baseline"] = current
+            stage["build_size"] = current["total"]["gz"]
+            if problems:
+                stage["outcome"] = "failed"
+                violations[project_name] = problems
+    
+    fileutil.save_json_file(config.PAYLOAD_BASELINE_PATH, state)
+    
+    if violations:
+        print(f"\n⚠️ 페이로드 예산 초과/회귀: {len(violations)}개 프로젝트")
+        for project_name, problems in sorted(violations.items()):
+            print(f"  - {project_name}: {'; '.join(problems)}")
+    else:
+        print("\n✅ 모든 프로젝트가 페이로드 예산과 기준 이내입니다.")
+    return violations
+# endregion
@@ -0,0 +1,164 @@
+"""WebGL 빌드 출력물 사전 압축 (.br/.gz)."""
+import os
+import collections
+import gzip
+import hashlib
+import io
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+try:
+    import brotli  # 선택 사항 (pip install brotli), 없으면 사전 압축 시 .gz만 생성
+except ImportError:
+    brotli = None
+
+from . import config, fileutil, tracing, unity
+
+
+# =========================
+# #region WebGL 빌드 출력물 사전 압축 (.br/.gz)
+# =========================
+PRECOMPRESS_SIDECAR = ".precompress.json"  # 빌드 폴더 안, 파일별 압축 당시 원본 해시 기록
+
+def _precompress_file(filepath, previous_hash, formats, gzip_level, brotli_quality):
+    """(프로세스 풀 작업) 파일 하나를 .gz/.br로 압축합니다.
+
+    원본 해시가 이전과 같고 압축본이 이미 있으면 다시 압축하지 않습니다.
+    반환값: (원본 해시, 원본 크기, {형식: 압축 크기}, 새로 압축했는지 여부)
+    """
+    with open(filepath, "rb") as f:
+        data = f.read()
+    file_hash = hashlib.sha256(data).hexdigest()
+    
+    sizes = {}
+    compressed = False
+    for fmt in formats:
+        target_path = f"{filepath}.{fmt}"
+        if file_hash == previous_hash and os.path.exists(target_path):
+            sizes[fmt] = os.path.getsize(target_path)
+            continue
+        
+        if fmt == "gz":
+            # mtime=0으로 고정해 같은 입력이면 항상 같은 결과가 나오도록 함
+            buffer = io.BytesIO()
+            with gzip.GzipFile(filename="", mode="wb", compresslevel=gzip_level, fileobj=buffer, mtime=0) as gz:
+                gz.write(data)
+            output = buffer.getvalue()
+        else:
+            is_text = filepath.endswith((".js", ".json", ".html", ".css", ".svg"))
+            output = brotli.compress(data, mode=brotli.MODE_TEXT if is_text else brotli.MODE_GENERIC,
+                                     quality=brotli_quality)
+        
+        tmp_path = f"{target_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(output)
+        os.replace(tmp_path, target_path)
+        sizes[fmt] = len(output)
+        compressed = True
+    
+    return file_hash, len(data), sizes, compressed
+
+def collect_precompress_targets(project_dir):
+    """빌드 폴더에서 사전 압축 대상 파일의 상대 경로 목록을 반환합니다."""
+    build_dir = os.path.join(project_dir, config.BUILD_OUTPUT_DIR)
+    targets = []
+    for root, dirs, files in os.walk(build_dir):
+        for file in files:
+            if not file.endswith(config.PRECOMPRESS_EXTENSIONS) or file == PRECOMPRESS_SIDECAR:
+                continue
+            filepath = os.path.join(root, file)
+            if os.path.getsize(filepath) < config.PRECOMPRESS_MIN_SIZE:
+                continue
+            targets.append(os.path.relpath(filepath, build_dir).replace(os.sep, "/"))
+    return sorted(targets)
+
+@tracing.traced("stage")
+def precompress_build_outputs(project_dirs, max_workers=config.PRECOMPRESS_WORKERS):
+    """모든 프로젝트의 WebGL 빌드 출력물을 프로세스 풀에서 .br/.gz로 사전 압축합니다.
+
+    파일 단위로 작업을 나누므로 프로젝트 수와 관계없이 모든 코어를 사용합니다.
+    """
+    print("\n=== WebGL 빌드 출력물 사전 압축 시작 ===")
+    
+    formats = ["gz"] if brotli is None else ["br", "gz"]
+    if brotli is None:
+        print("⚠️ brotli 모듈이 없어 .gz만 생성합니다. (pip install brotli)")
+    
+    sidecars = {}
+    jobs = []
+    for project_dir in project_dirs:
+        build_dir = os.path.join(project_dir, config.BUILD_OUTPUT_DIR)
+        if not os.path.isdir(build_dir):
+            continue
+        previous = fileutil.load_json_file(os.path.join(build_dir, PRECOMPRESS_SIDECAR), {})
+        sidecars[project_dir] = {}
+        for relative_path in collect_precompress_targets(project_dir):
+            jobs.append((project_dir, relative_path, previous.get(relative_path)))
+    
+    if not jobs:
+        print("⚪ 압축할 빌드 출력물이 없습니다.")
+        return {}
+    
+    report = {
+        project_dir: {"files": 0, "compressed": 0, "failed": 0, "raw": 0, "br": 0, "gz": 0}
+        for project_dir in sidecars
+    }
+    print(f"📦 {len(sidecars)}개 프로젝트, {len(jobs)}개 파일 압축 ({', '.join(formats)})")
+    
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        future_to_job = {
+            executor.submit(
+                _precompress_file,
+                os.path.join(project_dir, config.BUILD_OUTPUT_DIR, relative_path),
+                previous_hash, formats, config.PRECOMPRESS_GZIP_LEVEL, config.PRECOMPRESS_BROTLI_QUALITY
+            ): (project_dir, relative_path)
+            for project_dir, relative_path, previous_hash in jobs
+        }
+        
+        try:
+            for future in as_completed(future_to_job):
+                project_dir, relative_path = future_to_job[future]
+                stats = report[project_dir]
+                try:
+                    file_hash, raw_size, sizes, compressed = future.result()
+                except Exception as e:
+                    stats["failed"] += 1
+                    print(f"❌ {fileutil.get_project_name_from_path(project_dir)}/{relative_path} 압축 실패: {e}")
+                    continue
+                
+                sidecars[project_dir][relative_path] = file_hash
+                stats["files"] += 1
+                stats["compressed"] += 1 if compressed else 0
+                stats["raw"] += raw_size
+                for fmt, size in sizes.items():
+                    stats[fmt] += size
+        except KeyboardInterrupt:
+            unity.cancel_pending_futures(future_to_job)
+            raise
+    
+    # 현재 파일만 남기도록 기록을 새로 저장 (삭제된 파일의 항목은 제거)
+    for project_dir, sidecar in sidecars.items():
+        fileutil.save_json_file(os.path.join(project_dir, config.BUILD_OUTPUT_DIR, PRECOMPRESS_SIDECAR), sidecar)
+    
+    print_precompress_report(report, formats)
+    return report
+
+def print_precompress_report(report, formats):
+    """프로젝트별 원본/압축 크기와 압축률을 출력합니다."""
+    def describe(raw, stats):
+        parts = [f"원본 {fileutil.format_bytes(raw)}"]
+        for fmt in formats:
+            ratio = stats[fmt] / raw * 100 if raw else 0
+            parts.append(f"{fmt} {fileutil.format_bytes(stats[fmt])} ({ratio:.0f}%)")
+        return ", ".join(parts)
+    
+    print(f"\n=== 사전 압축 결과 ===")
+    totals = collections.Counter()
+    for project_dir, stats in sorted(report.items()):
+        skipped = stats["files"] - stats["compressed"]
+        failed = f", 실패 {stats['failed']}개" if stats["failed"] else ""
+        print(f"📦 {fileutil.get_project_name_from_path(project_dir)}: 파일 {stats['files']}개 "
+              f"(새로 압축 {stats['compressed']}개, 변경 없음 {skipped}개{failed})")
+        print(f"    {describe(stats['raw'], stats)}")
+        totals.update(stats)
+    print(f"📊 전체: {describe(totals['raw'], totals)}")
+# endregion
@@ -0,0 +1,456 @@
+"""실행 기록 (SQLite: 실행/프로젝트/단계별 시간과 결과)."""
+import os
+import collections
+import contextlib
+import threading
+import time
+
+from . import config, fileutil, logs, metrics_export, tracing
+
+
+# =========================
+# #region 실행 기록 (SQLite: 실행/프로젝트/단계별 시간과 결과)
+# =========================
+HISTORY_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    started REAL NOT NULL,
+    ended REAL,
+    command TEXT,
+    outcome TEXT
+);
+CREATE TABLE IF NOT EXISTS stages (
+    id INTEGER PRIMARY KEY,
+    run_id INTEGER,
+    project TEXT NOT NULL,
+    stage TEXT NOT NULL,
+    started REAL NOT NULL,
+    ended REAL NOT NULL,
+    duration REAL NOT NULL,
+    outcome TEXT,
+    files_touched INTEGER,
+    bytes_written INTEGER,
+    build_size INTEGER,
+    exit_code INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_stages_project_stage ON stages (project, stage, started);
+CREATE TABLE IF NOT EXISTS unity_phases (
+    id INTEGER PRIMARY KEY,
+    run_id INTEGER,
+    project TEXT NOT NULL,
+    stage TEXT NOT NULL,
+    phase TEXT NOT NULL,
+    seconds REAL NOT NULL,
+    recorded REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS build_reports (
+    id INTEGER PRIMARY KEY,
+    guid TEXT UNIQUE NOT NULL,
+    run_id INTEGER,
+    project TEXT NOT NULL,
+    recorded REAL NOT NULL,
+    unity_version TEXT,
+    result TEXT,
+    total_seconds REAL,
+    total_size INTEGER
+);
+CREATE TABLE IF NOT EXISTS build_steps (
+    report_id INTEGER NOT NULL,
+    project TEXT NOT NULL,
+    name TEXT NOT NULL,
+    depth INTEGER,
+    seconds REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS build_assets (
+    report_id INTEGER NOT NULL,
+    project TEXT NOT NULL,
+    path TEXT NOT NULL,
+    type TEXT,
+    size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS build_files (
+    report_id INTEGER NOT NULL,
+    project TEXT NOT NULL,
+    path TEXT NOT NULL,
+    role TEXT,
+    size INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_build_steps_report ON build_steps (report_id);
+CREATE INDEX IF NOT EXISTS idx_build_assets_report ON build_assets (report_id);
+CREATE INDEX IF NOT EXISTS idx_build_files_report ON build_files (report_id);
+"""
+
+# 프로젝트별 가장 최근의 성공한 빌드 리포트
+LATEST_BUILD_REPORTS_SQL = """
+SELECT MAX(id) AS id FROM build_reports WHERE result = 'Succeeded' GROUP BY project
+"""
+
+# Unity 로그에서 추출할 단계별 시간 (이름, 정규식, 초 단위 환산 배율)
+UNITY_PHASE_PATTERNS = [
+    ("asset_refresh", r"Asset Pipeline Refresh \(id=[^)]*\): Total: ([\d.]+) seconds", 1.0),
+    ("domain_reload", r"Domain Reload Profiling: (\d+)ms", 0.001),
+    ("script_compile", r"\*\*\* Tundra build success \(([\d.]+) seconds\)", 1.0),
+    ("build_player", r"빌드 시간: (\d+):(\d+):([\d.]+)", None),
+]
+
+_history_lock = threading.Lock()
+_history_buffer = {"stages": [], "unity_phases": []}
+_history_run = {"id": None}
+
+def open_history_db():
+    """실행 기록 DB에 연결합니다. (없으면 스키마 생성)"""
+    import sqlite3
+    
+    os.makedirs(os.path.dirname(config.HISTORY_DB_PATH), exist_ok=True)
+    conn = sqlite3.connect(config.HISTORY_DB_PATH, timeout=30)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(HISTORY_SCHEMA)
+    return conn
+
+def history_start_run(command):
+    """새 실행(run)을 기록하고 이후 단계 기록에 연결합니다."""
+    if not config.HISTORY_ENABLED:
+        return
+    try:
+        conn = open_history_db()
+        with conn:
+            cursor = conn.execute(
+                "INSERT INTO runs (started, command) VALUES (?, ?)", (time.time(), command)
+            )
+        _history_run["id"] = cursor.lastrowid
+        conn.close()
+    except Exception as e:
+        print(f"⚠️ 실행 기록 시작 실패: {e}")
+
+def history_flush():
+    """메모리에 모아 둔 기록을 한 번의 트랜잭션으로 DB에 씁니다."""
+    with _history_lock:
+        stages = _history_buffer["stages"]
+        phases = _history_buffer["unity_phases"]
+        _history_buffer["stages"] = []
+        _history_buffer["unity_phases"] = []
+    if not stages and not phases:
+        return
+    
+    try:
+        conn = open_history_db()
+        with conn:
+            conn.executemany(
+                "INSERT INTO stages (run_id, project, stage, started, ended, duration, outcome, "
+                "files_touched, bytes_written, build_size, exit_code) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                stages
+            )
+            conn.executemany(
+                "INSERT INTO unity_phases (run_id, project, stage, phase, seconds, recorded) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                phases
+            )
+        conn.close()
+    except Exception as e:
+        print(f"⚠️ 실행 기록 저장 실패: {e}")
+
+def history_finish_run(outcome):
+    """남은 기록을 모두 쓰고 실행 종료 시간과 결과를 기록합니다."""
+    if not config.HISTORY_ENABLED or _history_run["id"] is None:
+        return
+    history_flush()
+    try:
+        conn = open_history_db()
+        with conn:
+            conn.execute(
+                "UPDATE runs SET ended = ?, outcome = ? WHERE id = ?",
+                (time.time(), outcome, _history_run["id"])
+            )
+        conn.close()
+    except Exception as e:
+        print(f"⚠️ 실행 기록 종료 실패: {e}")
+    _history_run["id"] = None
+
+def history_add_stage(project_dir, stage, started, ended, metrics):
+    """단계 기록을 버퍼에 추가합니다. 버퍼가 차면 한 번에 기록합니다."""
+    if not config.HISTORY_ENABLED:
+        return
+    project_name = fileutil.get_project_name_from_path(project_dir)
+    row = (
+        _history_run["id"], project_name, stage, started, ended, ended - started,
+        metrics.get("outcome"), metrics.get("files_touched"), metrics.get("bytes_written"),
+        metrics.get("build_size"), metrics.get("exit_code")
+    )
+    phase_rows = [
+        (_history_run["id"], project_name, stage, phase, seconds, ended)
+        for phase, seconds in metrics.get("unity_phases", {}).items()
+    ]
+    with _history_lock:
+        _history_buffer["stages"].append(row)
+        _history_buffer["unity_phases"].extend(phase_rows)
+        should_flush = len(_history_buffer["stages"]) >= config.HISTORY_FLUSH_SIZE
+    if should_flush:
+        history_flush()
+
+@contextlib.contextmanager
+def record_stage(project_dir, stage):
+    """프로젝트별 작업 단계의 시작/종료 시간과 결과를 실행 기록에 남깁니다.
+
+    with 블록에서 반환된 dict에 outcome, files_touched, bytes_written, build_size 등을 채웁니다.
+    블록 안의 출력은 프로젝트 버퍼에 모았다가 단계가 끝날 때 한 번에 출력합니다. (logs.project_log)
+    """
+    metrics = {"outcome": "success"}
+    started = time.time()
+    span = tracing.trace_span(stage, "project", project=fileutil.get_project_name_from_path(project_dir))
+    try:
+        with logs.project_log(project_dir, stage), span:
+            yield metrics
+            span.set(**{k: v for k, v in metrics.items() if k != "unity_phases"})
+    except KeyboardInterrupt:
+        metrics["outcome"] = "cancelled"
+        raise
+    except Exception:
+        metrics["outcome"] = "error"
+        raise
+    finally:
+        ended = time.time()
+        history_add_stage(project_dir, stage, started, ended, metrics)
+        metrics_export.metrics_observe_stage(project_dir, stage, ended - started, metrics)
+
+def parse_unity_phase_timings(log_text):
+    """Unity 로그에서 에셋 리프레시, 도메인 리로드, 스크립트 컴파일, 빌드 시간을 합산합니다."""
+    import re
+    
+    phases = {}
+    for phase, pattern, scale in UNITY_PHASE_PATTERNS:
+        for match in re.finditer(pattern, log_text):
+            if scale is None:
+                # TimeSpan 형식 (hh:mm:ss.fff)
+                hours, minutes, seconds = match.groups()
+                value = int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+            else:
+                value = float(match.group(1)) * scale
+            phases[phase] = phases.get(phase, 0.0) + value
+    return phases
+
+def record_unity_result_metrics(project_path, stage):
+    """마지막 Unity 실행 결과의 종료 코드와 단계별 시간을 stage 기록에 추가합니다."""
+    from . import unity
+    
+    result = unity.unity_run_results.get(project_path)
+    if result is None:
+        return
+    stage["exit_code"] = result.returncode
+    stage["unity_phases"] = parse_unity_phase_timings(result.output)
+    if result.status != "exited":
+        stage["outcome"] = result.status
+
+def ingest_build_report(project_path):
+    """Builds 폴더의 BuildReport 요약(JSON)을 실행 기록 DB에 추가합니다. (이미 추가한 리포트는 건너뜀)"""
+    if not config.HISTORY_ENABLED:
+        return False
+    report = fileutil.load_json_file(os.path.join(project_path, config.BUILD_OUTPUT_DIR, config.BUILD_REPORT_FILENAME), None)
+    if not report or not report.get("guid"):
+        return False
+    
+    project_name = fileutil.get_project_name_from_path(project_path)
+    project_root = os.path.abspath(project_path).replace(os.sep, "/").rstrip("/") + "/"
+    try:
+        conn = open_history_db()
+        try:
+            with conn:
+                cursor = conn.execute(
+                    "INSERT OR IGNORE INTO build_reports "
+                    "(guid, run_id, project, recorded, unity_version, result, total_seconds, total_size) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (report["guid"], _history_run["id"], project_name, time.time(), report.get("unityVersion"),
+                     report.get("result"), report.get("totalSeconds"), report.get("totalSize"))
+                )
+                if cursor.rowcount == 0:
+                    return False
+                report_id = cursor.lastrowid
+                conn.executemany(
+                    "INSERT INTO build_steps (report_id, project, name, depth, seconds) VALUES (?, ?, ?, ?, ?)",
+                    [(report_id, project_name, step["name"], step.get("depth"), step["seconds"])
+                     for step in report.get("steps", [])]
+                )
+                conn.executemany(
+                    "INSERT INTO build_assets (report_id, project, path, type, size) VALUES (?, ?, ?, ?, ?)",
+                    [(report_id, project_name, asset["path"], asset.get("type"), asset["size"])
+                     for asset in report.get("packedAssets", [])]
+                )
+                # 출력 파일 경로는 프로젝트 기준 상대 경로로 저장
+                conn.executemany(
+                    "INSERT INTO build_files (report_id, project, path, role, size) VALUES (?, ?, ?, ?, ?)",
+                    [(report_id, project_name, file["path"].replace(project_root, "", 1), file.get("role"), file["size"])
+                     for file in report.get("files", [])]
+                )
+        finally:
+            conn.close()
+        print(f"📊 {project_name} 빌드 리포트 수집: 단계 {len(report.get('steps', []))}개, "
+              f"에셋 {len(report.get('packedAssets', []))}개, 출력 파일 {len(report.get('files', []))}개")
+        return True
+    except Exception as e:
+        print(f"⚠️ {project_name} 빌드 리포트 수집 실패: {e}")
+        return False
+
+def print_largest_assets(limit=20):
+    """모든 프로젝트의 최근 빌드에서 용량이 큰 에셋을 출력합니다."""
+    conn = open_history_db()
+    by_project = conn.execute(
+        f"SELECT a.project, a.path, a.type, a.size FROM build_assets a "
+        f"WHERE a.report_id IN ({LATEST_BUILD_REPORTS_SQL}) ORDER BY a.size DESC LIMIT ?", (limit,)
+    ).fetchall()
+    # 여러 프로젝트가 같은 경로의 에셋(공용 패키지, 템플릿 등)을 포함하는 경우 합산
+    shared = conn.execute(
+        f"SELECT path, COUNT(DISTINCT project), SUM(size), MAX(size) FROM build_assets "
+        f"WHERE report_id IN ({LATEST_BUILD_REPORTS_SQL}) GROUP BY path HAVING COUNT(DISTINCT project) > 1 "
+        f"ORDER BY SUM(size) DESC LIMIT ?", (limit,)
+    ).fetchall()
+    conn.close()
+    
+    print(f"\n=== 용량이 큰 에셋 (프로젝트별 최근 빌드 기준, 상위 {limit}개) ===")
+    if not by_project:
+        print("빌드 리포트 기록 없음 (WebGL 빌드 후 또는 --ingest-build-reports로 수집)")
+        return
+    for project, path, asset_type, size in by_project:
+        print(f"  {fileutil.format_bytes(size):>10}  {project}: {path} ({asset_type})")
+    
+    if shared:
+        print(f"\n=== 여러 프로젝트가 함께 포함하는 에셋 (합계 기준) ===")
+        for path, project_count, total_size, max_size in shared:
+            print(f"  {fileutil.format_bytes(total_size):>10}  {path} ({project_count}개 프로젝트, 최대 {fileutil.format_bytes(max_size)})")
+
+def print_slowest_build_steps(limit=20):
+    """모든 프로젝트의 최근 빌드에서 오래 걸린 빌드 단계를 출력합니다."""
+    conn = open_history_db()
+    by_name = conn.execute(
+        f"SELECT name, depth, COUNT(*), AVG(seconds), MAX(seconds), SUM(seconds) FROM build_steps "
+        f"WHERE report_id IN ({LATEST_BUILD_REPORTS_SQL}) GROUP BY name, depth "
+        f"ORDER BY SUM(seconds) DESC LIMIT ?", (limit,)
+    ).fetchall()
+    slowest = conn.execute(
+        f"SELECT project, name, seconds FROM build_steps "
+        f"WHERE report_id IN ({LATEST_BUILD_REPORTS_SQL}) ORDER BY seconds DESC LIMIT ?", (limit,)
+    ).fetchall()
+    conn.close()
+    
+    print(f"\n=== 오래 걸린 빌드 단계 (프로젝트별 최근 빌드 합계 기준, 상위 {limit}개) ===")
+    if not by_name:
+        print("빌드 리포트 기록 없음 (WebGL 빌드 후 또는 --ingest-build-reports로 수집)")
+        return
+    for name, depth, count, average, maximum, total in by_name:
+        print(f"  {fileutil.format_duration(total):>10}  {'  ' * (depth or 0)}{name} "
+              f"({count}개 프로젝트, 평균 {average:.1f}초, 최대 {maximum:.1f}초)")
+    
+    print(f"\n=== 가장 오래 걸린 개별 단계 ===")
+    for project, name, seconds in slowest:
+        print(f"  {fileutil.format_duration(seconds):>10}  {project}: {name}")
+
+def get_latest_stage_results(stage):
+    """프로젝트별 가장 최근 단계 기록을 {프로젝트명: {outcome, ended, duration}}으로 반환합니다. (DB가 없으면 빈 dict)"""
+    if not config.HISTORY_ENABLED or not os.path.exists(config.HISTORY_DB_PATH):
+        return {}
+    conn = open_history_db()
+    # SQLite는 MAX()와 함께 선택한 다른 열을 최댓값 행에서 가져옴
+    rows = conn.execute(
+        "SELECT project, MAX(started), ended, duration, outcome FROM stages WHERE stage = ? GROUP BY project",
+        (stage,)
+    ).fetchall()
+    conn.close()
+    return {project: {"outcome": outcome, "ended": ended, "duration": duration}
+            for project, _, ended, duration, outcome in rows}
+
+def print_history_runs(limit=10):
+    """최근 실행 목록을 출력합니다."""
+    conn = open_history_db()
+    rows = conn.execute(
+        "SELECT r.id, r.started, r.ended, r.command, r.outcome, COUNT(s.id), "
+        "SUM(CASE WHEN s.outcome IN ('success', 'cache_hit') THEN 1 ELSE 0 END) "
+        "FROM runs r LEFT JOIN stages s ON s.run_id = r.id "
+        "GROUP BY r.id ORDER BY r.id DESC LIMIT ?", (limit,)
+    ).fetchall()
+    conn.close()
+    
+    print(f"\n=== 최근 실행 {len(rows)}개 ===")
+    for run_id, started, ended, command, outcome, stage_count, success_count in rows:
+        started_text = time.strftime('%Y-%m-%d %H:%M', time.localtime(started))
+        duration = fileutil.format_duration(ended - started) if ended else "진행 중/중단"
+        print(f"#{run_id} {started_text} ({duration}) [{outcome or '-'}] "
+              f"단계 {success_count or 0}/{stage_count} 성공  {command or ''}")
+
+def print_history_trend(project_name, stage="build", days=30):
+    """프로젝트 단계의 일별 소요 시간 추이를 출력합니다."""
+    import statistics
+    
+    since = time.time() - days * 86400
+    conn = open_history_db()
+    rows = conn.execute(
+        "SELECT started, duration, outcome, build_size FROM stages "
+        "WHERE project = ? AND stage = ? AND started >= ? ORDER BY started",
+        (project_name, stage, since)
+    ).fetchall()
+    conn.close()
+    
+    print(f"\n=== {project_name} '{stage}' 추이 (최근 {days}일) ===")
+    if not rows:
+        print("기록 없음")
+        return
+    
+    by_day = collections.OrderedDict()
+    for started, duration, outcome, build_size in rows:
+        day = time.strftime('%Y-%m-%d', time.localtime(started))
+        by_day.setdefault(day, []).append((duration, outcome, build_size))
+    
+    for day, entries in by_day.items():
+        durations = [d for d, outcome, _ in entries if outcome == "success"]
+        failures = sum(1 for _, outcome, _ in entries if outcome not in ("success", "cache_hit"))
+        cache_hits = sum(1 for _, outcome, _ in entries if outcome == "cache_hit")
+        sizes = [size for _, _, size in entries if size]
+        median_text = fileutil.format_duration(statistics.median(durations)) if durations else "-"
+        size_text = fileutil.format_bytes(sizes[-1]) if sizes else "-"
+        print(f"  {day}: 중앙값 {median_text}, 실행 {len(durations)}회, "
+              f"캐시 {cache_hits}회, 실패 {failures}회, 크기 {size_text}")
+
+def find_history_regressions(threshold=config.HISTORY_REGRESSION_THRESHOLD, window_days=config.HISTORY_REGRESSION_WINDOW_DAYS):
+    """최근 구간의 중앙 소요 시간이 직전 구간보다 threshold 이상 늘어난 (프로젝트, 단계)를 찾습니다."""
+    import statistics
+    
+    now = time.time()
+    recent_start = now - window_days * 86400
+    previous_start = now - 2 * window_days * 86400
+    
+    conn = open_history_db()
+    rows = conn.execute(
+        "SELECT project, stage, started, duration FROM stages "
+        "WHERE outcome = 'success' AND started >= ?", (previous_start,)
+    ).fetchall()
+    conn.close()
+    
+    samples = {}
+    for project, stage, started, duration in rows:
+        key = (project, stage)
+        bucket = 1 if started >= recent_start else 0
+        samples.setdefault(key, ([], []))[bucket].append(duration)
+    
+    regressions = []
+    for (project, stage), (previous, recent) in samples.items():
+        if not previous or not recent:
+            continue
+        previous_median = statistics.median(previous)
+        recent_median = statistics.median(recent)
+        if previous_median > 0 and recent_median >= previous_median * (1 + threshold):
+            regressions.append((project, stage, previous_median, recent_median))
+    
+    regressions.sort(key=lambda r: r[3] / r[2], reverse=True)
+    return regressions
+
+def print_history_regressions():
+    """성능 저하가 발생한 프로젝트 단계를 출력합니다."""
+    regressions = find_history_regressions()
+    print(f"\n=== 성능 저하 감지 (최근 {config.HISTORY_REGRESSION_WINDOW_DAYS}일 vs 직전 {config.HISTORY_REGRESSION_WINDOW_DAYS}일, "
+          f"기준 {config.HISTORY_REGRESSION_THRESHOLD * 100:.0f}%) ===")
+    if not regressions:
+        print("✅ 성능 저하 없음")
+        return
+    for project, stage, previous_median, recent_median in regressions:
+        change = (recent_median / previous_median - 1) * 100
+        print(f"⚠️ {project} '{stage}': {fileutil.format_duration(previous_median)} → "
+              f"{fileutil.format_duration(recent_median)} ({change:+.0f}%)")
+# endregion
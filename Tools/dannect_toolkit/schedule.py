@@ -0,0 +1,78 @@
+"""빌드 스케줄링 (과거 빌드 시간 기반 LPT, 예상 시간)."""
+import threading
+import time
+
+from . import config, fileutil
+
+
+# =========================
+# #region 빌드 스케줄링 (과거 빌드 시간 기반 LPT, 예상 시간)
+# =========================
+def load_build_durations():
+    """프로젝트별 최근 빌드 시간 기록을 불러옵니다."""
+    return fileutil.load_json_file(config.BUILD_DURATIONS_PATH, {})
+
+_build_durations_lock = threading.Lock()
+
+def record_build_duration(project_path, seconds):
+    """실제 Unity 빌드에 걸린 시간을 기록합니다. (최근 BUILD_DURATION_HISTORY개 유지)"""
+    project_name = fileutil.get_project_name_from_path(project_path)
+    try:
+        with _build_durations_lock:
+            durations = load_build_durations()
+            history = durations.get(project_name, []) + [round(seconds, 1)]
+            durations[project_name] = history[-config.BUILD_DURATION_HISTORY:]
+            fileutil.save_json_file(config.BUILD_DURATIONS_PATH, durations)
+    except Exception as e:
+        print(f"⚠️ 빌드 시간 기록 실패: {e}")
+
+def estimate_build_durations(project_dirs):
+    """프로젝트별 예상 빌드 시간(초)을 최근 기록의 중앙값으로 계산합니다.
+
+    기록이 없는 프로젝트는 다른 프로젝트들의 중앙값(없으면 BUILD_DEFAULT_DURATION)을 사용합니다.
+    """
+    import statistics
+    
+    durations = load_build_durations()
+    estimates = {}
+    for project_dir in project_dirs:
+        history = durations.get(fileutil.get_project_name_from_path(project_dir))
+        if history:
+            estimates[project_dir] = statistics.median(history)
+    
+    default = statistics.median(estimates.values()) if estimates else config.BUILD_DEFAULT_DURATION
+    for project_dir in project_dirs:
+        estimates.setdefault(project_dir, default)
+    return estimates
+
+def order_longest_first(project_dirs, estimates):
+    """예상 시간이 긴 프로젝트부터 정렬합니다. (같으면 원래 순서 유지)"""
+    return sorted(project_dirs, key=lambda d: -estimates[d])
+
+def predict_makespan(durations, workers, initial_loads=()):
+    """LPT 방식으로 작업을 워커에 배정했을 때의 전체 소요 시간(초)을 예측합니다."""
+    import heapq
+    
+    workers = max(1, workers)
+    loads = sorted(initial_loads, reverse=True)[:workers]
+    loads += [0.0] * (workers - len(loads))
+    heapq.heapify(loads)
+    for duration in sorted(durations, reverse=True):
+        heapq.heappush(loads, heapq.heappop(loads) + duration)
+    return max(loads)
+
+def estimate_remaining_build_time(estimates, project_dirs, started_at, completed, workers):
+    """실행 중인 빌드의 남은 시간과 대기 중인 빌드를 고려해 남은 전체 시간을 예측합니다."""
+    now = time.time()
+    running_loads = [
+        max(0.0, estimates[d] - (now - started_at[d]))
+        for d in project_dirs if d in started_at and d not in completed
+    ]
+    pending = [estimates[d] for d in project_dirs if d not in started_at and d not in completed]
+    return predict_makespan(pending, workers, running_loads)
+
+def print_build_eta(seconds):
+    """예상 소요 시간과 완료 예정 시각을 출력합니다."""
+    finish_time = time.strftime('%H:%M', time.localtime(time.time() + seconds))
+    print(f"⏱️ 예상 소요 시간: {fileutil.format_duration(seconds)} (완료 예정 {finish_time})")
+# endregion
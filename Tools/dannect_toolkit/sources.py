@@ -0,0 +1,301 @@
+"""C# 소스 UTF-8 변환과 Unity 6 API 호환성 수정/보고서."""
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from . import config, fileutil, journal, locks, logs, run_history, tracing
+
+
+# =========================
+# #region UTF-8 변환 및 Unity 6 API 호환성 함수
+# =========================
+# 파일별 변환/교체는 프로세스 풀에서 실행하고, 프로젝트 잠금, 저널, 실행 기록과 출력은 호출한 스레드에서 처리합니다.
+_source_pool_state = {"executor": None}
+_source_pool_lock = threading.Lock()
+
+def get_source_process_pool():
+    """C# 파일 처리용 프로세스 풀을 반환합니다. (처음 호출할 때 만들고 파이프라인의 프로젝트 스레드들이 함께 사용)"""
+    with _source_pool_lock:
+        if _source_pool_state["executor"] is None:
+            _source_pool_state["executor"] = ProcessPoolExecutor(max_workers=config.SOURCE_PROCESS_WORKERS)
+        return _source_pool_state["executor"]
+
+def shutdown_source_process_pool():
+    """C# 파일 처리용 프로세스 풀을 종료합니다."""
+    with _source_pool_lock:
+        executor = _source_pool_state["executor"]
+        _source_pool_state["executor"] = None
+    if executor is not None:
+        executor.shutdown()
+
+def map_source_files(func, filepaths):
+    """파일별 작업 결과를 입력 순서대로 반환합니다. 파일이 SOURCE_PROCESS_MIN_FILES개 이상이면 프로세스 풀에서 실행합니다."""
+    if len(filepaths) < config.SOURCE_PROCESS_MIN_FILES:
+        return [func(filepath) for filepath in filepaths]
+    workers = config.SOURCE_PROCESS_WORKERS or os.cpu_count() or 4
+    return list(get_source_process_pool().map(func, filepaths, chunksize=max(1, len(filepaths) // (workers * 4))))
+
+def convert_to_utf8(filepath):
+    import chardet
+    
+    # 파일의 원래 인코딩 감지
+    with open(filepath, 'rb') as f:
+        raw = f.read()
+        result = chardet.detect(raw)
+        encoding = result['encoding']
+    # 이미 UTF-8이면 변환하지 않음
+    if encoding and encoding.lower().replace('-', '') == 'utf8':
+        return False  # 변환하지 않음
+    # 감지된 인코딩으로 읽어서 UTF-8로 저장
+    with open(filepath, 'r', encoding=encoding, errors='ignore') as f:
+        content = f.read()
+    with open(filepath, 'w', encoding='utf-8') as f:
+        f.write(content)
+    return True  # 변환함
+
+def _convert_source_file(filepath):
+    """(프로세스 풀 작업) 파일 하나를 UTF-8로 변환합니다. 반환값: (변환 여부, 오류 메시지 또는 None)"""
+    try:
+        return convert_to_utf8(filepath), None
+    except Exception as e:
+        return False, str(e)
+
+@locks.leased("worktree", skipped=0)
+@journal.journaled("convert", skipped=0)
+def convert_project_to_utf8(project_dir):
+    """프로젝트 Assets 폴더의 모든 C# 파일을 UTF-8로 변환합니다."""
+    project_name = fileutil.get_project_name_from_path(project_dir)
+    root_dir = os.path.join(project_dir, "Assets")
+    if not os.path.exists(root_dir):
+        print(f"Assets 폴더 없음: {project_dir}")
+        return 0
+    
+    with run_history.record_stage(project_dir, "convert") as stage:
+        print(f"\n--- {project_name} UTF-8 변환 ---")
+        filepaths = [
+            os.path.join(subdir, file)
+            for subdir, _, files in os.walk(root_dir)
+            for file in files if file.endswith('.cs')
+        ]
+        files_converted = 0
+        bytes_written = 0
+        with tracing.trace_span("utf8 " + os.path.relpath(root_dir, project_dir), "files", files=len(filepaths)):
+            results = map_source_files(_convert_source_file, filepaths)
+        for filepath, (changed, error) in zip(filepaths, results):
+            file = os.path.basename(filepath)
+            if error:
+                logs.log_error(f"  {file} 변환 실패: {error}")
+            elif changed:
+                files_converted += 1
+                bytes_written += os.path.getsize(filepath)
+                logs.log_debug(f"  {file} 변환 완료")
+            else:
+                logs.log_debug(f"  {file} 이미 UTF-8, 변환 생략")
+        
+        # 파일별 결과는 debug 레벨이므로 프로젝트마다 한 줄로 요약
+        print(f"  {project_name}: C# 파일 {len(filepaths)}개 중 {files_converted}개 UTF-8로 변환")
+        stage["files_touched"] = files_converted
+        stage["bytes_written"] = bytes_written
+    return files_converted
+
+FIX_RULES_VERSION = 1  # 아래 교체 규칙을 바꾸면 올림 (--resume이 완료된 fix 단계를 다시 실행)
+
+def fix_unity6_deprecated_apis(filepath):
+    """Unity 6에서 deprecated된 API들을 최신 API로 교체합니다. 반환값: (수정 여부, 교체 내용 목록)"""
+    with open(filepath, 'r', encoding='utf-8') as f:
+        content = f.read()
+    
+    original_content = content
+    changes_made = []
+    
+    # Unity 6 API 교체 규칙들
+    api_replacements = [
+        # FindObjectOfType -> FindFirstObjectByType
+        (r'FindObjectOfType<([^>]+)>\(\)', r'FindFirstObjectByType<\1>()'),
+        (r'GameObject\.FindObjectOfType<([^>]+)>\(\)', r'FindFirstObjectByType<\1>()'),
+        (r'Object\.FindObjectOfType<([^>]+)>\(\)', r'FindFirstObjectByType<\1>()'),
+        
+        # FindObjectsOfType -> FindObjectsByType
+        (r'FindObjectsOfType<([^>]+)>\(\)', r'FindObjectsByType<\1>(FindObjectsSortMode.None)'),
+        (r'GameObject\.FindObjectsOfType<([^>]+)>\(\)', r'FindObjectsByType<\1>(FindObjectsSortMode.None)'),
+        (r'Object\.FindObjectsOfType<([^>]+)>\(\)', r'FindObjectsByType<\1>(FindObjectsSortMode.None)'),
+        
+        # Unity 6 WebGL API 호환성 수정
+        (r'PlayerSettings\.WebGL\.debugSymbols\s*=\s*false', r'PlayerSettings.WebGL.debugSymbolMode = WebGLDebugSymbolMode.Off'),
+        (r'PlayerSettings\.WebGL\.debugSymbols\s*=\s*true', r'PlayerSettings.WebGL.debugSymbolMode = WebGLDebugSymbolMode.External'),
+        (r'PlayerSettings\.WebGL\.wasmStreaming\s*=\s*[^;]+;', r'// Unity 6에서 wasmStreaming 제거됨 (decompressionFallback에 따라 자동 결정)'),
+        (r'PlayerSettings\.SplashScreen\.logoAnimationMode[^;]+;', r'// Unity 6에서 logoAnimationMode 제거됨'),
+        (r'PlayerSettings\.GetIconsForTargetGroup\(BuildTargetGroup\.([^)]+)\)', 
+         r'PlayerSettings.GetIcons(NamedBuildTarget.\1, IconKind.Application)'),
+        
+        # Camera.main -> Camera.current (일부 상황에서)
+        # 주의: 이 교체는 상황에 따라 다를 수 있으므로 주석으로 남겨둠
+        # (r'Camera\.main', r'Camera.current'),
+    ]
+    
+    # 각 교체 규칙 적용
+    import re
+    for old_pattern, new_pattern in api_replacements:
+        matches = re.findall(old_pattern, content)
+        if matches:
+            content = re.sub(old_pattern, new_pattern, content)
+            changes_made.append(f"'{old_pattern}' -> '{new_pattern}' ({len(matches)}개 교체)")
+    
+    # 변경사항이 있으면 파일 저장
+    if content != original_content:
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return True, changes_made
+    else:
+        return False, []
+
+def _fix_source_file(filepath):
+    """(프로세스 풀 작업) 파일 하나의 deprecated API를 교체합니다. 반환값: (수정 여부, 교체 내용 목록, 오류 메시지 또는 None)"""
+    try:
+        return fix_unity6_deprecated_apis(filepath) + (None,)
+    except Exception as e:
+        return False, [], str(e)
+
+@locks.leased("worktree", skipped=(0, 0, 0))
+@journal.journaled("fix", skipped=(0, 0, 0), refreshes=("convert",))
+def fix_project_unity6_apis(project_dir):
+    """프로젝트 하나의 C# 파일에서 Unity 6 deprecated API를 교체합니다.
+
+    반환값: (처리한 파일 수, 수정한 파일 수, 교체한 API 수)
+    """
+    project_name = fileutil.get_project_name_from_path(project_dir)
+    assets_dir = os.path.join(project_dir, "Assets")
+    if not os.path.exists(assets_dir):
+        print(f"Assets 폴더 없음: {project_dir}")
+        return 0, 0, 0
+    
+    with run_history.record_stage(project_dir, "fix") as stage:
+        print(f"\n--- {project_name} Unity 6 호환성 수정 ---")
+        # Assets 폴더의 모든 C# 파일 처리 (Library, Temp 등 불필요한 폴더 제외)
+        filepaths = []
+        for root, dirs, files in os.walk(assets_dir):
+            dirs[:] = [d for d in dirs if not d.startswith('.') and d not in ['Library', 'Temp', 'Logs']]
+            filepaths.extend(os.path.join(root, file) for file in files if file.endswith('.cs'))
+        files_processed = len(filepaths)
+        files_changed = 0
+        project_changes = 0
+        bytes_written = 0
+        
+        with tracing.trace_span("fix " + os.path.relpath(assets_dir, project_dir), "files", files=files_processed):
+            results = map_source_files(_fix_source_file, filepaths)
+        for filepath, (changed, changes, error) in zip(filepaths, results):
+            file = os.path.basename(filepath)
+            if error:
+                logs.log_error(f"Unity 6 API 교체 실패 ({filepath}): {error}")
+            elif changed:
+                files_changed += 1
+                project_changes += len(changes)
+                bytes_written += os.path.getsize(filepath)
+                print(f"  ✅ {file}: {len(changes)}개 API 교체")
+                for change in changes:
+                    logs.log_debug(f"    - {change}")
+            else:
+                logs.log_debug(f"  ⚪ {file}: 변경 없음")
+        
+        print(f"  📊 {project_name} 결과: {files_processed}개 파일 중 {files_changed}개 수정, 총 {project_changes}개 API 교체")
+        stage["files_touched"] = files_changed
+        stage["bytes_written"] = bytes_written
+    
+    return files_processed, files_changed, project_changes
+
+@tracing.traced("stage")
+def process_unity6_compatibility(project_dirs):
+    """모든 프로젝트에서 Unity 6 호환성 문제를 수정합니다."""
+    print("\n=== Unity 6 API 호환성 수정 시작 ===")
+    
+    total_files_processed = 0
+    total_files_changed = 0
+    total_changes = 0
+    
+    for project_dir in project_dirs:
+        if not os.path.exists(project_dir):
+            continue
+        
+        files_processed, files_changed, project_changes = fix_project_unity6_apis(project_dir)
+        total_files_processed += files_processed
+        total_files_changed += files_changed
+        total_changes += project_changes
+    
+    logs.log_summary(f"\n=== Unity 6 API 호환성 수정 완료 ===")
+    logs.log_summary(f"📊 전체 결과: {total_files_processed}개 파일 중 {total_files_changed}개 수정")
+    logs.log_summary(f"🔧 총 {total_changes}개 deprecated API 교체 완료")
+    
+    return total_files_changed > 0
+
+@tracing.traced("stage")
+def create_unity6_compatibility_report(project_dirs):
+    """Unity 6 호환성 보고서를 생성합니다."""
+    print("\n=== Unity 6 호환성 검사 보고서 생성 ===")
+    
+    deprecated_patterns = [
+        r'FindObjectOfType<[^>]+>\(\)',
+        r'FindObjectsOfType<[^>]+>\(\)',
+        r'PlayerSettings\.WebGL\.debugSymbols',  # Unity 6에서 debugSymbolMode로 변경
+        r'PlayerSettings\.WebGL\.wasmStreaming',  # Unity 6에서 제거됨
+        r'PlayerSettings\.SplashScreen\.logoAnimationMode',  # Unity 6에서 제거됨
+        r'PlayerSettings\.GetIconsForTargetGroup\(',  # Unity 6에서 GetIcons로 변경
+        r'Camera\.main(?!\w)',  # Camera.main (단어 경계 확인)
+        r'\.SetActive\(true\).*\.SetActive\(false\)',  # 비효율적인 SetActive 패턴
+    ]
+    
+    report_lines = []
+    report_lines.append("# Unity 6 호환성 검사 보고서")
+    report_lines.append(f"생성 시간: {time.strftime('%Y-%m-%d %H:%M:%S')}")
+    report_lines.append("")
+    
+    for project_dir in project_dirs:
+        if not os.path.exists(project_dir):
+            continue
+            
+        project_name = fileutil.get_project_name_from_path(project_dir)
+        report_lines.append(f"## 프로젝트: {project_name}")
+        
+        assets_dir = os.path.join(project_dir, "Assets")
+        if not os.path.exists(assets_dir):
+            report_lines.append("❌ Assets 폴더 없음")
+            continue
+        
+        project_issues = []
+        
+        for root, dirs, files in os.walk(assets_dir):
+            dirs[:] = [d for d in dirs if not d.startswith('.') and d not in ['Library', 'Temp', 'Logs']]
+            
+            for file in files:
+                if file.endswith('.cs'):
+                    filepath = os.path.join(root, file)
+                    try:
+                        with open(filepath, 'r', encoding='utf-8') as f:
+                            content = f.read()
+                        
+                        import re
+                        for pattern in deprecated_patterns:
+                            matches = re.findall(pattern, content)
+                            if matches:
+                                relative_path = os.path.relpath(filepath, project_dir)
+                                project_issues.append(f"  - {relative_path}: {pattern} ({len(matches)}개)")
+                    except Exception as e:
+                        continue
+        
+        if project_issues:
+            report_lines.append("⚠️ 발견된 호환성 문제:")
+            report_lines.extend(project_issues)
+        else:
+            report_lines.append("✅ 호환성 문제 없음")
+        
+        report_lines.append("")
+    
+    # 보고서 파일 저장
+    report_path = os.path.join(config.TOOLKIT_DIR, "unity6_compatibility_report.md")
+    try:
+        with open(report_path, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(report_lines))
+        print(f"📋 호환성 보고서 생성 완료: {report_path}")
+    except Exception as e:
+        print(f"❌ 보고서 생성 실패: {e}")
+# endregion
@@ -0,0 +1,225 @@
+"""프로젝트별 단계 파이프라인 (asyncio DAG 실행기, --pipeline)."""
+import os
+import asyncio
+import collections
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from . import build_cache, config, fileutil, gitops, logs, manifests, mirror, run_history, sources, tracing, trash, unity
+
+
+# =========================
+# #region 프로젝트별 단계 파이프라인 (asyncio DAG 실행기, --pipeline)
+# =========================
+# 프로젝트 단계 정의: 단계 이름 → (자원 종류, 선행 단계, 실패하면 이후 단계를 중단할지 여부)
+# 순서는 위상 정렬 순서이며, 선행 단계가 꺼져 있으면 그 단계의 선행 단계를 대신 기다립니다.
+# cpu 단계는 작업 스레드에서 잠금, 저널, 실행 기록을 처리하고, convert/fix의 파일별 작업은 sources의 프로세스 풀에서 실행합니다.
+PROJECT_STAGES = {
+    "convert": ("cpu", [], False),
+    "fix": ("cpu", ["convert"], False),
+    "manifest": ("cpu", [], False),  # C# 파일과 무관하므로 소스 변환과 동시에 진행
+    "git": ("network", ["fix", "manifest"], False),
+    "mirror": ("cpu", ["git"], False),
+    "batch": ("unity", ["git", "mirror"], True),
+    "clean": ("cpu", [], False),
+    "build": ("unity", ["batch", "clean", "mirror"], True),
+}
+
+def get_available_memory():
+    """사용 가능한 물리 메모리(바이트)를 반환합니다. 알 수 없으면 None."""
+    if sys.platform == "win32":
+        import ctypes
+        
+        class MemoryStatus(ctypes.Structure):
+            _fields_ = [("dwLength", ctypes.c_ulong), ("dwMemoryLoad", ctypes.c_ulong),
+                        ("ullTotalPhys", ctypes.c_ulonglong), ("ullAvailPhys", ctypes.c_ulonglong),
+                        ("ullTotalPageFile", ctypes.c_ulonglong), ("ullAvailPageFile", ctypes.c_ulonglong),
+                        ("ullTotalVirtual", ctypes.c_ulonglong), ("ullAvailVirtual", ctypes.c_ulonglong),
+                        ("ullAvailExtendedVirtual", ctypes.c_ulonglong)]
+        
+        status = MemoryStatus()
+        status.dwLength = ctypes.sizeof(status)
+        if ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(status)):
+            return status.ullAvailPhys
+        return None
+    
+    try:
+        with open("/proc/meminfo", "r") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    for pages_name in ("SC_AVPHYS_PAGES", "SC_PHYS_PAGES"):
+        try:
+            return os.sysconf(pages_name) * os.sysconf("SC_PAGE_SIZE")
+        except (ValueError, OSError, AttributeError):
+            continue
+    return None
+
+def get_unity_slot_count():
+    """사용 가능한 메모리로 동시에 실행할 수 있는 Unity 인스턴스 수를 계산합니다."""
+    available = get_available_memory()
+    if available is None:
+        return config.PIPELINE_UNITY_MAX_SLOTS
+    return max(1, min(config.PIPELINE_UNITY_MAX_SLOTS, int(available // config.PIPELINE_UNITY_MEMORY_PER_SLOT)))
+
+def get_pipeline_dependencies(stage, enabled):
+    """꺼진 단계를 건너뛰어 stage가 실제로 기다려야 할 선행 단계 목록을 반환합니다."""
+    dependencies = []
+    for dependency in PROJECT_STAGES[stage][1]:
+        if dependency in enabled:
+            dependencies.append(dependency)
+        else:
+            dependencies.extend(get_pipeline_dependencies(dependency, enabled))
+    return sorted(set(dependencies), key=list(PROJECT_STAGES).index)
+
+def run_project_stage(stage, project_dir, options, context):
+    """프로젝트 단계 하나를 실행하고 성공 여부를 반환합니다. (파이프라인 작업 스레드에서 호출)
+
+    context는 프로젝트별로 단계 사이에 넘길 값을 담는 dict입니다.
+    """
+    if stage == "convert":
+        sources.convert_project_to_utf8(project_dir)
+        return True
+    if stage == "fix":
+        _, files_changed, _ = sources.fix_project_unity6_apis(project_dir)
+        context["unity6_changes_made"] = files_changed > 0
+        return True
+    if stage == "manifest":
+        manifests.update_project_manifest(project_dir, options["package_versions"], options["package_pins"],
+                                config.remove_packages, config.scoped_registries)
+        return True
+    if stage == "git":
+        commit_message = gitops.get_auto_commit_message(context.get("unity6_changes_made"))
+        with run_history.record_stage(project_dir, "git") as metrics:
+            success = gitops.commit_and_push_changes(project_dir, commit_message)
+            if not success:
+                metrics["outcome"] = "failed"
+        return success
+    if stage == "mirror":
+        mirror.use_package_mirrors([project_dir], config.git_packages)
+        return True
+    if stage == "batch":
+        unity.create_unity_batch_script(project_dir)
+        return unity.process_unity_project_batch(project_dir)
+    if stage == "clean":
+        trash.clean_build_outputs([project_dir], options["clean_keep"])
+        return True
+    if stage == "build":
+        return build_cache.build_webgl_project_cached(project_dir, options["force"])
+    raise ValueError(f"알 수 없는 단계: {stage}")
+
+async def run_pipeline_async(project_dirs, stages, options, limits):
+    """모든 (프로젝트, 단계)를 DAG 노드로 만들어 자원 종류별 동시 실행 한도 안에서 실행합니다.
+
+    각 노드는 같은 프로젝트의 선행 단계만 기다리므로 빠른 프로젝트는 느린 프로젝트를 기다리지 않습니다.
+    반환값: {(프로젝트 경로, 단계): "success" | "failed" | "error" | "skipped"}
+    """
+    loop = asyncio.get_event_loop()
+    semaphores = {resource: asyncio.Semaphore(limit) for resource, limit in limits.items()}
+    executor = ThreadPoolExecutor(max_workers=sum(limits.values()), thread_name_prefix="pipeline-worker")
+    contexts = {project_dir: {} for project_dir in project_dirs}
+    statuses = {}
+    tasks = {}
+    total = len(project_dirs) * len(stages)
+    
+    async def run_node(project_dir, stage, dependencies):
+        project_name = fileutil.get_project_name_from_path(project_dir)
+        dependency_statuses = await asyncio.gather(*(tasks[(project_dir, d)] for d in dependencies))
+        for dependency, status in zip(dependencies, dependency_statuses):
+            if status in ("skipped", "error") or (status == "failed" and PROJECT_STAGES[dependency][2]):
+                statuses[(project_dir, stage)] = "skipped"
+                print(f"⏭️ [{len(statuses)}/{total}] {project_name}: {stage} 건너뜀 ({dependency} {status})")
+                return "skipped"
+        
+        resource = PROJECT_STAGES[stage][0]
+        attempt = 0
+        while True:
+            async with semaphores[resource]:
+                if unity.cancel_event.is_set():
+                    status = "skipped"
+                    break
+                try:
+                    success = await loop.run_in_executor(
+                        executor, run_project_stage, stage, project_dir, options, contexts[project_dir]
+                    )
+                    status = "success" if success else "failed"
+                except Exception as e:
+                    print(f"❌ {project_name}: {stage} 예외 - {e}")
+                    status = "error"
+            
+            # Unity 단계의 일시적 실패는 슬롯을 반납하고 백오프 후 이 프로젝트만 재시도
+            if status != "failed" or resource != "unity" or attempt >= config.UNITY_RETRY_MAX_ATTEMPTS:
+                break
+            category = unity.classify_unity_failure(unity.unity_run_results.get(project_dir))
+            if category not in unity.TRANSIENT_FAILURE_CATEGORIES:
+                break
+            attempt += 1
+            delay = config.UNITY_RETRY_BACKOFF * (2 ** (attempt - 1))
+            print(f"🔁 {project_name}: {stage} 일시적 실패 ({category}), {delay}초 후 재시도 {attempt}/{config.UNITY_RETRY_MAX_ATTEMPTS}")
+            await asyncio.sleep(delay)
+        
+        statuses[(project_dir, stage)] = status
+        icon = {"success": "✅", "failed": "❌", "error": "❌", "skipped": "⏭️"}[status]
+        print(f"{icon} [{len(statuses)}/{total}] {project_name}: {stage} {status}")
+        return status
+    
+    try:
+        # PROJECT_STAGES 순서가 위상 정렬 순서이므로 선행 노드의 작업이 항상 먼저 만들어짐
+        for project_dir in project_dirs:
+            for stage in stages:
+                tasks[(project_dir, stage)] = asyncio.ensure_future(
+                    run_node(project_dir, stage, get_pipeline_dependencies(stage, stages))
+                )
+        await asyncio.gather(*tasks.values())
+    finally:
+        for task in tasks.values():
+            task.cancel()
+        executor.shutdown(wait=not unity.cancel_event.is_set())
+    return statuses
+
+@tracing.traced("stage")
+def run_project_pipeline(project_dirs, stages, options):
+    """선택한 단계를 프로젝트마다 독립적으로 진행합니다. (단계 사이에 전체 프로젝트 대기 없음)
+
+    자원 종류별 동시 실행 한도: cpu(소스 변환/manifest), network(git push), unity(메모리 기준 슬롯)
+    반환값: 빌드 단계 결과 [(프로젝트명, 성공 여부)] (빌드 단계가 없으면 빈 목록)
+    """
+    stages = [stage for stage in PROJECT_STAGES if stage in stages]
+    project_dirs = [d for d in project_dirs if os.path.exists(d)]
+    limits = {
+        "cpu": config.PIPELINE_CPU_WORKERS,
+        "network": config.PIPELINE_NETWORK_LIMIT,
+        "unity": get_unity_slot_count(),
+    }
+    available = get_available_memory()
+    print(f"\n=== 프로젝트별 단계 파이프라인 시작 ===")
+    print(f"🔀 단계: {' → '.join(stages)} ({len(project_dirs)}개 프로젝트)")
+    print(f"⚙️ 동시 실행 한도: CPU {limits['cpu']}, 네트워크 {limits['network']}, Unity {limits['unity']}"
+          f" (사용 가능 메모리 {fileutil.format_bytes(available) if available else '알 수 없음'})")
+    
+    started = time.time()
+    loop = asyncio.new_event_loop()
+    try:
+        statuses = loop.run_until_complete(run_pipeline_async(project_dirs, stages, options, limits))
+    finally:
+        loop.close()
+    
+    logs.log_summary(f"\n=== 파이프라인 결과 ({fileutil.format_duration(time.time() - started)}) ===")
+    for stage in stages:
+        counts = collections.Counter(statuses.get((d, stage), "skipped") for d in project_dirs)
+        logs.log_summary(f"  {stage:<10} 성공 {counts['success']}개, 실패 {counts['failed'] + counts['error']}개, 건너뜀 {counts['skipped']}개")
+    for project_dir in project_dirs:
+        failed = [stage for stage in stages if statuses.get((project_dir, stage)) in ("failed", "error")]
+        if failed:
+            logs.log_summary(f"  ❌ {fileutil.get_project_name_from_path(project_dir)}: {', '.join(failed)} 실패")
+    
+    if "build" not in stages:
+        return []
+    return [
+        (fileutil.get_project_name_from_path(d), statuses.get((d, "build")) == "success")
+        for d in project_dirs
+    ]
+# endregion
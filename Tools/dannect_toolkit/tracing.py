@@ -0,0 +1,114 @@
+"""실행 추적 (Chrome trace-event 형식, --trace)."""
+import os
+import json
+import functools
+import threading
+import time
+
+
+# =========================
+# #region 실행 추적 (Chrome trace-event 형식, --trace)
+# =========================
+# 비활성 상태에서는 trace_span이 공용 빈 컨텍스트를 반환하므로 추가 비용이 거의 없습니다.
+_trace_state = {"enabled": False, "path": None, "origin": 0.0, "events": [], "threads": {}}
+_trace_lock = threading.Lock()
+
+class _NullSpan:
+    """추적이 꺼져 있을 때 사용하는 빈 span입니다."""
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+    
+    def set(self, **args):
+        pass
+
+_NULL_SPAN = _NullSpan()
+
+class _TraceSpan:
+    """시작/종료 시간을 재서 완료(X) 이벤트 하나로 기록하는 span입니다."""
+    def __init__(self, name, category, args):
+        self.name = name
+        self.category = category
+        self.args = args
+    
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        ended = time.perf_counter()
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        trace_add_event({
+            "name": self.name,
+            "cat": self.category,
+            "ph": "X",
+            "ts": (self.started - _trace_state["origin"]) * 1e6,
+            "dur": (ended - self.started) * 1e6,
+            "args": self.args,
+        })
+        return False
+    
+    def set(self, **args):
+        """span이 끝나기 전에 결과 값(종료 코드 등)을 인수로 추가합니다."""
+        self.args.update(args)
+
+def trace_start(path):
+    """실행 추적을 시작합니다. 종료 시 trace_finish가 path에 기록합니다."""
+    _trace_state.update(enabled=True, path=path, origin=time.perf_counter(), events=[], threads={})
+    print(f"📈 실행 추적 활성화: {path}")
+
+def trace_span(name, category="toolkit", **args):
+    """구간 추적용 컨텍스트를 반환합니다. (with trace_span(...): ...)"""
+    if not _trace_state["enabled"]:
+        return _NULL_SPAN
+    return _TraceSpan(name, category, args)
+
+def traced(category):
+    """함수 전체를 하나의 span으로 추적하는 데코레이터입니다."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _trace_state["enabled"]:
+                return func(*args, **kwargs)
+            with _TraceSpan(func.__name__, category, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def trace_add_event(event):
+    """현재 스레드(워커) 정보를 붙여 이벤트를 추가합니다."""
+    thread = threading.current_thread()
+    with _trace_lock:
+        threads = _trace_state["threads"]
+        if thread.ident not in threads:
+            threads[thread.ident] = len(threads) + 1
+            # 스레드 이름(예: build-worker_0)을 Perfetto 트랙 이름으로 표시
+            _trace_state["events"].append({
+                "name": "thread_name", "ph": "M", "pid": os.getpid(),
+                "tid": threads[thread.ident], "args": {"name": thread.name},
+            })
+        event["pid"] = os.getpid()
+        event["tid"] = threads[thread.ident]
+        _trace_state["events"].append(event)
+
+def trace_finish():
+    """수집한 이벤트를 Chrome trace-event JSON 파일로 저장합니다."""
+    if not _trace_state["enabled"]:
+        return
+    _trace_state["enabled"] = False
+    with _trace_lock:
+        events = list(_trace_state["events"])
+    events.append({
+        "name": "process_name", "ph": "M", "pid": os.getpid(), "tid": 0,
+        "args": {"name": "dannect.unity.toolkit"},
+    })
+    try:
+        with open(_trace_state["path"], "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f, ensure_ascii=False)
+        print(f"📈 실행 추적 저장 완료: {_trace_state['path']} ({len(events)}개 이벤트, Perfetto/chrome://tracing에서 열기)")
+    except Exception as e:
+        print(f"❌ 실행 추적 저장 실패: {e}")
+# endregion
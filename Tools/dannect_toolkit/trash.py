@@ -0,0 +1,215 @@
+"""휴지통 (이름 변경 후 백그라운드 삭제)."""
+import os
+import collections
+import shutil
+import stat
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from . import config, fileutil, tracing
+
+
+# =========================
+# #region 휴지통 (이름 변경 후 백그라운드 삭제)
+# =========================
+# 같은 볼륨 안에서의 폴더 이름 변경은 파일 수와 관계없이 즉시 끝나므로,
+# 정리할 폴더를 휴지통으로 옮긴 뒤 바로 다음 작업을 진행하고 삭제는 스레드 풀에서 처리합니다.
+_trash_state = {"executor": None, "futures": [], "scheduled": set(), "dirs": {}}
+_trash_lock = threading.Lock()
+
+def find_mount_point(path):
+    """path가 속한 볼륨의 최상위 경로를 반환합니다."""
+    path = os.path.abspath(path)
+    while not os.path.ismount(path):
+        parent = os.path.dirname(path)
+        if parent == path:
+            break
+        path = parent
+    return path
+
+def get_trash_dir(project_dir, create=True):
+    """프로젝트와 같은 볼륨에 있는 휴지통 폴더를 반환합니다. (다른 볼륨이면 이름 변경이 복사가 됨)"""
+    device = os.stat(project_dir).st_dev
+    with _trash_lock:
+        if device in _trash_state["dirs"]:
+            return _trash_state["dirs"][device]
+    
+    candidates = [
+        os.path.join(find_mount_point(project_dir), config.CLEAN_TRASH_DIRNAME),
+        os.path.join(os.path.dirname(os.path.abspath(project_dir)), config.CLEAN_TRASH_DIRNAME),
+    ]
+    for candidate in candidates:
+        try:
+            if create:
+                os.makedirs(candidate, exist_ok=True)
+            if os.path.isdir(candidate) and os.stat(candidate).st_dev == device:
+                with _trash_lock:
+                    _trash_state["dirs"][device] = candidate
+                return candidate
+        except OSError:
+            continue
+    return None
+
+def move_to_trash(path, project_dir, keep=None):
+    """폴더를 휴지통으로 옮기고 백그라운드 삭제를 예약합니다.
+
+    keep을 지정하면 프로젝트별 최근 keep개를 넘는 휴지통 항목을 모두 정리하고,
+    지정하지 않으면 방금 옮긴 항목만 삭제합니다. (다른 보관 항목은 건드리지 않음)
+    같은 볼륨에 휴지통을 만들 수 없거나 이름 변경에 실패하면 바로 삭제합니다.
+    """
+    project_name = fileutil.get_project_name_from_path(project_dir)
+    trash_dir = get_trash_dir(project_dir)
+    if trash_dir is None:
+        remove_tree(path)
+        return
+    
+    # 항목 이름: <프로젝트>@<시각>-<임의값> (이름순 정렬 = 시간순)
+    entry_name = f"{project_name}@{time.strftime('%Y%m%d-%H%M%S')}-{os.urandom(4).hex()}"
+    entry_path = os.path.join(trash_dir, entry_name)
+    try:
+        os.rename(path, entry_path)
+    except OSError as e:
+        print(f"⚠️ 휴지통 이동 실패, 바로 삭제합니다: {e}")
+        remove_tree(path)
+        return
+    if keep is None:
+        schedule_trash_delete(entry_path)
+    else:
+        schedule_trash_sweep(trash_dir, keep)
+
+def remove_tree(path):
+    """폴더를 삭제합니다. (Windows 읽기 전용 파일은 속성을 바꾼 뒤 다시 시도)"""
+    def make_writable_and_retry(func, target, exc_info):
+        os.chmod(target, stat.S_IWRITE)
+        func(target)
+    shutil.rmtree(path, onerror=make_writable_and_retry)
+
+def _delete_trash_entry(path):
+    """(백그라운드 작업) 휴지통 항목의 크기를 잰 뒤 삭제하고 확보한 바이트를 반환합니다."""
+    size = fileutil.get_directory_size(path)
+    remove_tree(path)
+    return size
+
+def list_trash_entries(trash_dir):
+    """휴지통 항목을 프로젝트별 시간순 목록으로 반환합니다."""
+    entries = collections.defaultdict(list)
+    if not os.path.isdir(trash_dir):
+        return entries
+    for name in sorted(os.listdir(trash_dir)):
+        if "@" in name:
+            entries[name.rsplit("@", 1)[0]].append(name)
+    return entries
+
+def schedule_trash_sweep(trash_dir, keep=config.CLEAN_KEEP_BUILDS):
+    """프로젝트별 최근 keep개를 제외한 휴지통 항목의 삭제를 백그라운드 스레드 풀에 예약합니다.
+
+    이전 실행에서 지우지 못한 항목도 함께 정리됩니다.
+    """
+    for project_name, names in list_trash_entries(trash_dir).items():
+        for name in names[:len(names) - keep] if keep else names:
+            schedule_trash_delete(os.path.join(trash_dir, name))
+
+def schedule_trash_delete(path):
+    """휴지통 항목 하나의 삭제를 백그라운드 스레드 풀에 예약합니다. (중복 예약은 무시)"""
+    with _trash_lock:
+        if path in _trash_state["scheduled"]:
+            return
+        _trash_state["scheduled"].add(path)
+        if _trash_state["executor"] is None:
+            _trash_state["executor"] = ThreadPoolExecutor(
+                max_workers=config.CLEAN_DELETE_WORKERS, thread_name_prefix="trash-delete"
+            )
+        _trash_state["futures"].append(_trash_state["executor"].submit(_delete_trash_entry, path))
+
+def wait_for_trash_deletes():
+    """예약된 백그라운드 삭제가 모두 끝날 때까지 기다리고 확보한 용량을 출력합니다."""
+    with _trash_lock:
+        futures = list(_trash_state["futures"])
+        executor = _trash_state["executor"]
+    if not futures:
+        return
+    
+    pending = sum(1 for future in futures if not future.done())
+    if pending:
+        print(f"\n🗑️ 백그라운드 삭제 완료 대기 중... ({pending}개 남음)")
+    freed = 0
+    failed = 0
+    with tracing.trace_span("wait_for_trash_deletes", "stage"):
+        for future in futures:
+            try:
+                freed += future.result()
+            except Exception as e:
+                failed += 1
+                print(f"⚠️ 휴지통 항목 삭제 실패: {e}")
+    executor.shutdown(wait=True)
+    with _trash_lock:
+        _trash_state.update(executor=None, futures=[], scheduled=set())
+    
+    message = f"🗑️ 휴지통 정리 완료: {len(futures) - failed}개 항목, {fileutil.format_bytes(freed)} 확보"
+    print(message + (f" (실패 {failed}개)" if failed else ""))
+
+def print_trash_report(project_dirs, keep=config.CLEAN_KEEP_BUILDS):
+    """볼륨별 휴지통의 항목과 확보 가능한 용량을 출력합니다."""
+    print("\n=== 휴지통 용량 보고 ===")
+    trash_dirs = []
+    for project_dir in project_dirs:
+        if os.path.exists(project_dir):
+            trash_dir = get_trash_dir(project_dir, create=False)
+            if trash_dir and trash_dir not in trash_dirs:
+                trash_dirs.append(trash_dir)
+    
+    total_reclaimable = 0
+    total_retained = 0
+    for trash_dir in trash_dirs:
+        entries = list_trash_entries(trash_dir)
+        if not entries:
+            continue
+        print(f"📁 {trash_dir}")
+        for project_name, names in sorted(entries.items()):
+            for index, name in enumerate(names):
+                size = fileutil.get_directory_size(os.path.join(trash_dir, name))
+                retained = keep and index >= len(names) - keep
+                if retained:
+                    total_retained += size
+                else:
+                    total_reclaimable += size
+                print(f"  {'📦 보관' if retained else '🗑️ 삭제 대상'} {name}: {fileutil.format_bytes(size)}")
+    
+    if not trash_dirs or not (total_reclaimable or total_retained):
+        print("⚪ 휴지통이 비어 있습니다.")
+        return
+    print(f"📊 확보 가능 용량: {fileutil.format_bytes(total_reclaimable)}, 보관 중: {fileutil.format_bytes(total_retained)} (보관 개수 {keep})")
+
+@tracing.traced("stage")
+def clean_build_outputs(project_dirs, keep=config.CLEAN_KEEP_BUILDS):
+    """모든 프로젝트의 빌드 출력물을 휴지통 폴더로 옮깁니다. (실제 삭제는 백그라운드에서 진행)"""
+    print("\n=== 빌드 출력물 정리 시작 ===")
+    
+    cleaned_count = 0
+    for project_dir in project_dirs:
+        if not os.path.exists(project_dir):
+            continue
+            
+        project_name = fileutil.get_project_name_from_path(project_dir)
+        build_dir = os.path.join(project_dir, config.BUILD_OUTPUT_DIR)
+        
+        if os.path.exists(build_dir):
+            try:
+                move_to_trash(build_dir, project_dir, keep)
+                print(f"✅ {project_name} 빌드 출력물 정리 완료")
+                cleaned_count += 1
+            except Exception as e:
+                print(f"❌ {project_name} 빌드 출력물 정리 실패: {e}")
+        else:
+            print(f"⚪ {project_name} 빌드 출력물 없음")
+    
+    # 이전 실행에서 남은 휴지통 항목도 보관 개수에 맞춰 정리
+    trash_dirs = {get_trash_dir(d, create=False) for d in project_dirs if os.path.exists(d)}
+    for trash_dir in trash_dirs - {None}:
+        schedule_trash_sweep(trash_dir, keep)
+    
+    print(f"총 {cleaned_count}개 프로젝트 빌드 출력물 정리 완료 (백그라운드 삭제 {len(_trash_state['futures'])}개 진행 중)")
+    if keep:
+        print(f"📦 프로젝트별 최근 빌드 {keep}개는 휴지통에 보관합니다.")
+# endregion
@@ -0,0 +1,485 @@
+"""Unity 프로세스 감시와 Unity CLI 배치 모드 실행."""
+import os
+import collections
+import signal
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from . import build, config, fileutil, journal, locks, logs, run_history, tracing
+
+
+# =========================
+# #region Unity 프로세스 감시 (타임아웃, 멈춤 감지, 취소)
+# =========================
+# status: "exited"(정상 종료), "timeout"(전체 시간 초과), "stalled"(로그 없음), "cancelled"(사용자 취소),
+#         "locked"(다른 실행이 프로젝트 Unity 잠금을 가지고 있어 실행하지 않음)
+UnityRunResult = collections.namedtuple("UnityRunResult", ["returncode", "output", "status", "duration"])
+
+# Ctrl+C 등으로 설정되면 대기 중인 작업은 시작하지 않고 실행 중인 Unity는 종료됩니다.
+cancel_event = threading.Event()
+
+# 프로젝트 경로별 마지막 Unity 실행 결과 (실패 분류 및 재시도 판단용)
+unity_run_results = {}
+
+# 프로젝트 경로별 Unity 로그 줄 수신 함수 (분산 빌드 워커가 로그를 코디네이터로 보낼 때 등록)
+unity_output_listeners = {}
+
+def get_process_group_popen_kwargs():
+    """Unity와 하위 프로세스를 하나의 그룹으로 묶기 위한 Popen 인자를 반환합니다."""
+    if os.name == "nt":
+        return {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+    return {"start_new_session": True}
+
+def kill_process_tree(process):
+    """Unity 프로세스와 하위 프로세스(IL2CPP, Bee 백엔드 등)를 모두 종료합니다."""
+    if os.name == "nt":
+        # /T: 하위 프로세스 트리 전체, /F: 강제 종료
+        subprocess.run(
+            ["taskkill", "/F", "/T", "/PID", str(process.pid)],
+            capture_output=True
+        )
+        try:
+            process.wait(timeout=config.UNITY_KILL_GRACE)
+        except subprocess.TimeoutExpired:
+            process.kill()
+        return
+    
+    # POSIX: start_new_session으로 만든 프로세스 그룹 전체에 먼저 SIGTERM, 이후 SIGKILL
+    try:
+        os.killpg(process.pid, signal.SIGTERM)
+    except (ProcessLookupError, PermissionError):
+        pass
+    try:
+        process.wait(timeout=config.UNITY_KILL_GRACE)
+    except subprocess.TimeoutExpired:
+        pass
+    try:
+        os.killpg(process.pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        pass
+    process.wait()
+
+def run_unity_process(cmd, cwd=None, timeout=config.UNITY_TIMEOUT, inactivity_timeout=config.UNITY_INACTIVITY_TIMEOUT):
+    """Unity를 실행하고 종료될 때까지 감시합니다.
+
+    전체 타임아웃 외에 로그 출력이 inactivity_timeout 동안 없으면 멈춘 것으로 보고,
+    취소 요청(cancel_event)이나 Ctrl+C가 들어오면 프로세스 트리 전체를 종료합니다.
+    """
+    if cancel_event.is_set():
+        return UnityRunResult(None, "", "cancelled", 0.0)
+    
+    started = time.time()
+    output_lines = []
+    last_output_time = [started]
+    
+    project_path = cmd[cmd.index("-projectPath") + 1] if "-projectPath" in cmd else (cwd or "")
+    method = cmd[cmd.index("-executeMethod") + 1] if "-executeMethod" in cmd else "(import)"
+    with tracing.trace_span("unity " + method, "unity", project=fileutil.get_project_name_from_path(project_path)) as span:
+        process = subprocess.Popen(
+            cmd,
+            cwd=cwd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            encoding='utf-8',
+            errors='replace',
+            **get_process_group_popen_kwargs()
+        )
+        
+        listener = unity_output_listeners.get(project_path)
+        
+        def read_output():
+            for line in process.stdout:
+                output_lines.append(line)
+                last_output_time[0] = time.time()
+                if listener:
+                    listener(line)
+        
+        reader = threading.Thread(target=read_output, daemon=True)
+        reader.start()
+        
+        status = "exited"
+        try:
+            while True:
+                try:
+                    process.wait(timeout=1)
+                    break
+                except subprocess.TimeoutExpired:
+                    pass
+                
+                now = time.time()
+                if cancel_event.is_set():
+                    status = "cancelled"
+                elif now - started > timeout:
+                    status = "timeout"
+                elif inactivity_timeout and now - last_output_time[0] > inactivity_timeout:
+                    status = "stalled"
+                else:
+                    continue
+                
+                kill_process_tree(process)
+                break
+        except KeyboardInterrupt:
+            # 하위 프로세스는 별도 그룹이라 Ctrl+C를 받지 못하므로 직접 종료
+            cancel_event.set()
+            kill_process_tree(process)
+            span.set(status="cancelled", pid=process.pid)
+            raise
+        
+        reader.join(timeout=5)
+        span.set(status=status, returncode=process.returncode, pid=process.pid)
+        return UnityRunResult(process.returncode, "".join(output_lines), status, time.time() - started)
+
+# 실패 분류 규칙 (위에서부터 순서대로 검사)
+# 패키지 해석 실패가 컴파일 오류로 이어지는 경우가 많으므로 일시적 원인을 먼저 검사합니다.
+UNITY_FAILURE_PATTERNS = [
+    ("project_locked", [
+        r"another Unity instance is running",
+        r"Multiple Unity instances cannot open the same project",
+        r"UnityLockfile",
+    ]),
+    ("license", [
+        r"No valid Unity Editor license",
+        r"License client .*(?:failed|timed out|not ready)",
+        r"\[Licensing::[^\]]*\].*(?:[Ee]rror|[Ff]ailed)",
+        r"Unable to (?:get|acquire|activate) (?:a )?license",
+    ]),
+    ("package_cache", [
+        r"An error occurred while resolving packages",
+        r"Cannot perform upm operation",
+        r"Error when executing git command",
+        r"EBUSY|EPERM: operation not permitted|ENOTEMPTY",
+        r"[Pp]ackage cache .*(?:locked|corrupt)",
+    ]),
+    ("compile_error", [
+        r"error CS\d{4}",
+        r"Scripts have compiler errors",
+        r"[Cc]ompilation failed",
+    ]),
+    ("build_failed", [
+        r"Build Finished, Result: Failure",
+        r"Error building Player",
+        r"WebGL 빌드 실패",
+    ]),
+]
+
+# 같은 입력으로 다시 실행하면 성공할 수 있는 실패 유형
+TRANSIENT_FAILURE_CATEGORIES = {"project_locked", "license", "package_cache", "stalled", "crashed"}
+
+def classify_unity_failure(result):
+    """Unity 실행 결과(로그, 종료 코드, 감시 상태)로 실패 원인을 분류합니다."""
+    import re
+    
+    if result is None:
+        return "unknown"
+    if result.status == "locked":
+        return "project_locked"
+    if result.status in ("timeout", "stalled", "cancelled"):
+        return result.status
+    
+    for category, patterns in UNITY_FAILURE_PATTERNS:
+        for pattern in patterns:
+            if re.search(pattern, result.output):
+                return category
+    
+    # 시그널로 종료되었거나 Windows 접근 위반(0xC0000005)으로 크래시한 경우
+    if result.returncode is not None and (result.returncode < 0 or result.returncode == 0xC0000005):
+        return "crashed"
+    return "unknown"
+
+def retry_transient_unity_failures(failed_project_dirs, job_func, job_label):
+    """실패한 Unity 작업을 분류하여 일시적 실패만 실행 마지막에 백오프 후 재시도합니다.
+
+    재시도는 다른 에디터와의 잠금/패키지 캐시 경합을 피하기 위해 순차로 실행합니다.
+    반환값은 재시도한 프로젝트의 {프로젝트 경로: 최종 성공 여부} 입니다.
+    """
+    recovered = {}
+    pending = list(failed_project_dirs)
+    
+    for attempt in range(1, config.UNITY_RETRY_MAX_ATTEMPTS + 1):
+        retry_queue = []
+        for project_dir in pending:
+            project_name = fileutil.get_project_name_from_path(project_dir)
+            category = classify_unity_failure(unity_run_results.get(project_dir))
+            if category in TRANSIENT_FAILURE_CATEGORIES:
+                print(f"🔁 {project_name}: 일시적 실패 ({category}), 재시도 대기열에 추가")
+                retry_queue.append(project_dir)
+            else:
+                print(f"⛔ {project_name}: 재시도하지 않는 실패 ({category})")
+        
+        if not retry_queue or cancel_event.is_set():
+            break
+        
+        delay = config.UNITY_RETRY_BACKOFF * (2 ** (attempt - 1))
+        print(f"\n=== {job_label} 재시도 {attempt}/{config.UNITY_RETRY_MAX_ATTEMPTS}: "
+              f"{len(retry_queue)}개 프로젝트, {delay}초 후 시작 ===")
+        if cancel_event.wait(delay):
+            break
+        
+        pending = []
+        for project_dir in retry_queue:
+            success = job_func(project_dir)
+            recovered[project_dir] = success
+            if success:
+                print(f"✅ {fileutil.get_project_name_from_path(project_dir)} 재시도 성공")
+            else:
+                pending.append(project_dir)
+    
+    return recovered
+
+def apply_retry_results(results, recovered):
+    """재시도 결과를 (프로젝트명, 성공 여부) 결과 목록에 반영합니다."""
+    recovered_by_name = {fileutil.get_project_name_from_path(d): ok for d, ok in recovered.items()}
+    return [(name, recovered_by_name.get(name, ok)) for name, ok in results]
+
+def cancel_pending_futures(future_to_project):
+    """Ctrl+C 시 아직 시작하지 않은 작업을 취소하고 실행 중인 Unity 종료를 요청합니다."""
+    cancel_event.set()
+    cancelled = sum(1 for future in future_to_project if future.cancel())
+    print(f"\n⛔ 사용자 취소: 대기 중인 작업 {cancelled}개 취소, 실행 중인 Unity 프로세스 종료 중...")
+# endregion
+
+# =========================
+# #region Unity CLI 자동화 함수들
+# =========================
+def find_unity_editor_path():
+    """Unity Editor 경로를 자동으로 찾습니다."""
+    # 일반적인 Unity 설치 경로들
+    common_paths = [
+        r"C:\Program Files\Unity\Hub\Editor",
+        r"C:\Program Files\Unity\Editor",
+        r"C:\Program Files (x86)\Unity\Hub\Editor",
+        r"C:\Program Files (x86)\Unity\Editor"
+    ]
+    
+    for base_path in common_paths:
+        if os.path.exists(base_path):
+            # 버전 폴더들을 찾아서 가장 최신 버전 선택
+            try:
+                versions = [d for d in os.listdir(base_path) if os.path.isdir(os.path.join(base_path, d))]
+                if versions:
+                    # 버전 정렬 (최신 버전 우선)
+                    versions.sort(reverse=True)
+                    unity_exe = os.path.join(base_path, versions[0], "Editor", "Unity.exe")
+                    if os.path.exists(unity_exe):
+                        return unity_exe
+            except:
+                continue
+    
+    return None
+
+def run_unity_batch_mode(project_path, method_name=None, timeout=config.UNITY_TIMEOUT):
+    """Unity를 배치 모드로 실행하여 Editor 스크립트를 실행합니다."""
+    unity_run_results.pop(project_path, None)
+    unity_path = config.UNITY_EDITOR_PATH
+    
+    # Unity 경로가 존재하지 않으면 자동 검색
+    if not os.path.exists(unity_path):
+        print(f"Unity 경로를 찾을 수 없습니다: {unity_path}")
+        print("Unity 경로 자동 검색 중...")
+        unity_path = find_unity_editor_path()
+        if not unity_path:
+            print("Unity Editor를 찾을 수 없습니다. UNITY_EDITOR_PATH를 확인해주세요.")
+            return False
+        print(f"Unity 경로 발견: {unity_path}")
+    
+    project_name = fileutil.get_project_name_from_path(project_path)
+    print(f"Unity 배치 모드 실행 중: {project_name}")
+    
+    # Unity 명령어 구성
+    cmd = [
+        unity_path,
+        "-batchmode",           # 배치 모드
+        "-quit",               # 완료 후 종료
+        "-projectPath", project_path,  # 프로젝트 경로
+        "-logFile", "-",       # 로그를 콘솔에 출력
+    ]
+    
+    # 특정 메서드 실행이 지정된 경우
+    if method_name:
+        cmd.extend(["-executeMethod", method_name])
+    
+    try:
+        print(f"Unity 명령어: {' '.join(cmd)}")
+        result = run_unity_process(
+            cmd,
+            cwd=project_path,
+            timeout=timeout,
+            inactivity_timeout=config.UNITY_INACTIVITY_TIMEOUT
+        )
+        unity_run_results[project_path] = result
+        
+        # Unity 로그 출력 (stderr는 stdout에 합쳐서 수집, 정상 종료했으면 debug 레벨로만 출력)
+        if result.output:
+            level = "debug" if result.status == "exited" and result.returncode == 0 else "info"
+            logs.log_emit(level, "=== Unity 출력 ===\n" + result.output.rstrip("\n"))
+        
+        if result.status == "timeout":
+            print(f"Unity 실행 타임아웃 ({timeout}초), 프로세스 트리 종료: {project_name}")
+            return False
+        if result.status == "stalled":
+            print(f"Unity 멈춤 감지 ({config.UNITY_INACTIVITY_TIMEOUT}초 동안 로그 없음), 프로세스 트리 종료: {project_name}")
+            return False
+        if result.status == "cancelled":
+            print(f"Unity 실행 취소됨: {project_name}")
+            return False
+        
+        # Unity는 성공해도 exit code가 0이 아닐 수 있음
+        if result.returncode == 0:
+            print(f"Unity 배치 모드 완료: {project_name}")
+            return True
+        else:
+            print(f"Unity 배치 모드 경고 (exit code: {result.returncode}): {project_name}")
+            # 로그에서 실제 오류 확인
+            if "error" in result.output.lower() or "exception" in result.output.lower():
+                print("실제 오류 발견, 실패로 처리")
+                return False
+            else:
+                print("경고이지만 정상 처리된 것으로 판단")
+                return True
+                
+    except Exception as e:
+        print(f"Unity 실행 오류: {e}")
+        return False
+
+@locks.leased("unity")
+@journal.journaled("batch", skipped=True, succeeded=bool)
+def process_unity_project_batch(project_path):
+    """Unity 프로젝트를 배치 모드로 처리합니다."""
+    project_name = fileutil.get_project_name_from_path(project_path)
+    
+    if not os.path.exists(project_path):
+        print(f"프로젝트 폴더가 존재하지 않습니다: {project_path}")
+        return False
+    
+    # Unity 프로젝트인지 확인
+    project_settings = os.path.join(project_path, "ProjectSettings", "ProjectSettings.asset")
+    if not os.path.exists(project_settings):
+        print(f"Unity 프로젝트가 아닙니다: {project_path}")
+        return False
+    
+    # Unity 배치 모드 실행 (패키지 임포트 및 Editor 스크립트 실행)
+    with run_history.record_stage(project_path, "batch") as stage:
+        print(f"\n=== {project_name} Unity 배치 처리 시작 ===")
+        success = run_unity_batch_mode(project_path)
+        stage["outcome"] = "success" if success else "failed"
+        run_history.record_unity_result_metrics(project_path, stage)
+        print(f"=== {project_name} Unity 배치 처리 {'완료' if success else '실패'} ===")
+    return success
+
+def create_unity_batch_script(project_path):
+    """Unity Editor에서 실행할 배치 스크립트를 생성합니다. (내용이 같으면 다시 쓰지 않음)"""
+    script_dir = os.path.join(project_path, "Assets", "Editor", "BatchScripts")
+    script_path = os.path.join(script_dir, "AutoBatchProcessor.cs")
+    
+    if build.use_package_editor_scripts(project_path):
+        build.remove_generated_editor_script(script_path)
+        return True
+    
+    try:
+        if fileutil.write_file_if_changed(script_path, render_unity_batch_script()):
+            print(f"배치 스크립트 생성 완료: {script_path}")
+        else:
+            print(f"배치 스크립트 변경 없음, 기록 생략: {script_path}")
+        return True
+    except Exception as e:
+        print(f"배치 스크립트 생성 실패: {e}")
+        return False
+
+def render_unity_batch_script():
+    """배치 처리 Editor 스크립트 내용을 문자열로 생성합니다. (파일은 쓰지 않음)"""
+    script_content = '''using UnityEngine;
+using UnityEditor;
+using System.IO;
+
+public class AutoBatchProcessor
+{
+    [MenuItem("Tools/Process Batch")]
+    public static void ProcessBatch()
+    {
+        Debug.Log("=== 배치 처리 시작 ===");
+        
+        // 패키지 임포트 대기
+        AssetDatabase.Refresh();
+        
+        // PackageAssetCopier가 있다면 실행
+        var copierType = System.Type.GetType("PackageAssetCopier");
+        if (copierType != null)
+        {
+            var method = copierType.GetMethod("CopyFilesFromPackage", 
+                System.Reflection.BindingFlags.Public | System.Reflection.BindingFlags.Static);
+            if (method != null)
+            {
+                Debug.Log("PackageAssetCopier.CopyFilesFromPackage 실행");
+                method.Invoke(null, null);
+            }
+        }
+        
+        // 최종 Asset Database 갱신
+        AssetDatabase.Refresh();
+        AssetDatabase.SaveAssets();
+        
+        Debug.Log("=== 배치 처리 완료 ===");
+    }
+}
+'''
+    return script_content
+
+@tracing.traced("stage")
+def process_multiple_projects_parallel(project_dirs, max_workers=3):
+    """여러 Unity 프로젝트를 병렬로 처리합니다."""
+    print(f"\n=== 병렬 처리 시작 (최대 {max_workers}개 동시 실행) ===")
+    
+    success_count = 0
+    fail_count = 0
+    results = []
+    failed_project_dirs = []
+    
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="batch-worker") as executor:
+        # 모든 프로젝트를 병렬로 제출
+        future_to_project = {
+            executor.submit(process_unity_project_batch, project_dir): project_dir 
+            for project_dir in project_dirs if os.path.exists(project_dir)
+        }
+        
+        # 완료된 작업들을 처리 (Ctrl+C 시 대기 작업 취소)
+        try:
+            for future in as_completed(future_to_project):
+                project_dir = future_to_project[future]
+                project_name = fileutil.get_project_name_from_path(project_dir)
+                
+                try:
+                    result = future.result()
+                    if result:
+                        success_count += 1
+                        print(f"✅ {project_name} 병렬 처리 완료")
+                    else:
+                        fail_count += 1
+                        failed_project_dirs.append(project_dir)
+                        print(f"❌ {project_name} 병렬 처리 실패")
+                    results.append((project_name, result))
+                except Exception as e:
+                    fail_count += 1
+                    print(f"❌ {project_name} 병렬 처리 예외: {e}")
+                    results.append((project_name, False))
+        except KeyboardInterrupt:
+            cancel_pending_futures(future_to_project)
+            raise
+    
+    # 일시적 실패는 마지막에 백오프 후 재시도
+    recovered = retry_transient_unity_failures(failed_project_dirs, process_unity_project_batch, "Unity 배치")
+    if recovered:
+        results = apply_retry_results(results, recovered)
+        success_count = sum(1 for _, ok in results if ok)
+        fail_count = len(results) - success_count
+    
+    logs.log_summary(f"\n=== 병렬 처리 결과 ===")
+    logs.log_summary(f"성공: {success_count}개")
+    logs.log_summary(f"실패: {fail_count}개")
+    logs.log_summary(f"총 처리: {success_count + fail_count}개")
+    
+    return results
+# endregion